@@ -0,0 +1,105 @@
+"""
+Algorithm Registry Module for DAA Prelim Exam
+==============================================
+One table of every benchmark algorithm and its properties.
+
+Each entry names the sort function and declares what the rest of the app
+needs to know about it: the complexity shown on the metric card, whether it
+is stable and in place, which key kinds it accepts, its runtime cost model
+and how it is run. The GUI selector, the benchmark CLI, the runtime
+estimator and the permutation cache all read this table, so adding an
+algorithm means writing the function and registering it here.
+
+Modes:
+    full         - (data, key) -> permutation of all records
+    top_k        - (data, key, k) -> the first k records in order
+    incremental  - (data, key, prefix) -> extends a cached sorted prefix
+
+Only stable algorithms store their results in the permutation cache: its
+prefix reuse relies on the stable order (see permutation_cache).
+"""
+
+import parallel_sort
+import sorting_algorithms
+
+KEY_KINDS = ("int", "str")
+
+class SortAlgorithm:
+    """
+    Registry entry for one algorithm.
+    
+    Args:
+        name (str): Display name (selector entry).
+        func_name (str): Function name in sorting_algorithms (or parallel_sort).
+        complexity (str): Time complexity for the metric card.
+        stable (bool): Equal keys keep their input order.
+        in_place (bool): Sorts the key/index pairs with at most O(log n) extra space.
+        model (str): Runtime cost model ('n2', 'nlogn' or 'n', see runtime_estimator).
+        key_kinds (tuple): Accepted key column kinds (see runtime_estimator.column_kind).
+        mode (str): 'full', 'top_k' or 'incremental'.
+        isolated (bool): Runs in the sort worker process (False: manages its own
+                         processes and is driven from the GUI's sort thread).
+    """
+    __slots__ = ("name", "func_name", "complexity", "stable", "in_place", "model",
+                 "key_kinds", "mode", "isolated")
+    
+    def __init__(self, name, func_name, complexity, stable, in_place, model,
+                 key_kinds=KEY_KINDS, mode="full", isolated=True):
+        self.name = name
+        self.func_name = func_name
+        self.complexity = complexity
+        self.stable = stable
+        self.in_place = in_place
+        self.model = model
+        self.key_kinds = key_kinds
+        self.mode = mode
+        self.isolated = isolated
+    
+    @property
+    def function(self):
+        """The sort function itself."""
+        module = sorting_algorithms if self.isolated else parallel_sort
+        return getattr(module, self.func_name)
+    
+    def describe(self):
+        """Short property summary, e.g. 'stable, in place'."""
+        return f"{'stable' if self.stable else 'unstable'}, {'in place' if self.in_place else 'not in place'}"
+
+# Display name -> entry, in selector order
+ALGORITHMS = {}
+
+def register(algorithm):
+    """Adds an algorithm to the registry (display names and function names are unique)."""
+    if algorithm.name in ALGORITHMS or any(a.func_name == algorithm.func_name for a in ALGORITHMS.values()):
+        raise ValueError(f"Algorithm {algorithm.name!r} ({algorithm.func_name}) is already registered")
+    if not set(algorithm.key_kinds) <= set(KEY_KINDS):
+        raise ValueError(f"Unknown key kinds for {algorithm.name!r}: {algorithm.key_kinds}")
+    ALGORITHMS[algorithm.name] = algorithm
+    return algorithm
+
+def by_function(func_name):
+    """Entry for a function name, or None."""
+    for algorithm in ALGORITHMS.values():
+        if algorithm.func_name == func_name:
+            return algorithm
+    return None
+
+register(SortAlgorithm("Bubble Sort", "bubble_sort", "O(n²)", True, True, "n2"))
+register(SortAlgorithm("Insertion Sort", "insertion_sort", "O(n²)", True, True, "n2"))
+register(SortAlgorithm("Shell Sort (Ciura)", "shell_sort", "~O(n^1.3)", False, True, "nlogn"))
+register(SortAlgorithm("Merge Sort", "merge_sort", "O(n log n)", True, False, "nlogn"))
+register(SortAlgorithm("Merge Sort (Incremental)", "merge_sort_extend", "O(d log d + n)", True, False, "nlogn",
+                       mode="incremental"))
+register(SortAlgorithm("Heap Sort", "heap_sort", "O(n log n)", False, True, "nlogn"))
+register(SortAlgorithm("Intro Sort", "intro_sort", "O(n log n)", False, True, "nlogn"))
+register(SortAlgorithm("Quick Sort (3-way)", "quick_sort_3way", "O(n log n)", False, True, "nlogn"))
+# Encoded name columns give integer codes, so LSD radix accepts them too
+register(SortAlgorithm("Radix Sort (LSD)", "radix_sort", "O(d·(n+b))", True, False, "n"))
+register(SortAlgorithm("Radix Sort (MSD)", "msd_radix_sort", "O(n·k)", True, False, "n", key_kinds=("str",)))
+register(SortAlgorithm("Tim Sort (Adaptive)", "tim_sort", "O(n log n)", True, False, "nlogn"))
+register(SortAlgorithm("Built-in sorted()", "builtin_sort", "O(n log n)", True, False, "nlogn"))
+register(SortAlgorithm("Merge Sort (Parallel)", "parallel_merge_sort", "O(n log n / p)", True, False, "nlogn",
+                       isolated=False))
+register(SortAlgorithm("Top-K (Heap)", "top_k_heap", "O(n log k)", True, False, "n", mode="top_k"))
+register(SortAlgorithm("Top-K (Quickselect)", "top_k_quickselect", "O(n + k log k)", True, False, "n",
+                       mode="top_k"))
@@ -0,0 +1,208 @@
+"""
+Headless Benchmark Module for DAA Prelim Exam
+==============================================
+Command-line benchmark sweep over the sorting algorithms (no tkinter).
+
+Runs every combination of algorithm x sort column x dataset size N x input
+order. The data is loaded with the same record_store.load_cached() as the
+GUI, sorted by the same sorting_algorithms functions and timed with the same
+sort_worker.timed_call() as the ExamApp worker, so with the default --gc off
+the numbers are directly comparable with ExamApp runs.
+
+Input orders (the first N records, rearranged before timing):
+    original  - file order
+    random    - shuffled with a fixed seed
+    sorted    - already sorted by the column
+    reversed  - sorted by the column in reverse
+
+Every measurement performs `warmup` untimed runs, then `repeats` timed runs
+with time.perf_counter_ns(). Garbage is collected before each timed run and
+the collector is disabled during it, as in the ExamApp worker (--gc on keeps
+it enabled, which the app never does).
+Results report min, median, p95 and mean seconds per cell as JSON or CSV.
+With --count-ops, one extra untimed run of the instrumented variant (see
+op_counter) adds comparisons, swaps, shifts, moves and allocations.
+
+Usage:
+    python benchmark.py --algorithms merge_sort tim_sort --columns ID LastName \\
+        --sizes 1000 10000 100000 --orders original random --repeats 5 --format csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import statistics
+import sys
+
+import algorithm_registry
+import op_counter
+import record_store
+import sort_worker
+
+DATA_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'generated_data.csv')
+REQUIRED_COLUMNS = ['ID', 'FirstName', 'LastName']
+
+# CLI name (function name) -> registry entry; the incremental sort needs a cached prefix
+ALGORITHMS = {a.func_name: a for a in algorithm_registry.ALGORITHMS.values() if a.mode != "incremental"}
+
+# The quadratic sorts are opt-in (they take hours at N = 100,000)
+DEFAULT_ALGORITHMS = ["merge_sort", "tim_sort", "radix_sort", "msd_radix_sort"]
+
+INPUT_ORDERS = ("original", "random", "sorted", "reversed")
+
+RESULT_FIELDS = ["algorithm", "column", "n", "order", "repeats",
+                 "min_s", "median_s", "p95_s", "mean_s"] + list(op_counter.COUNTER_NAMES) + ["error"]
+
+def arrange(store, key, order, seed=0):
+    """
+    Returns a view of the rows of store in the given input order (no copy).
+    
+    Args:
+        store (RecordStore | RecordView): The first N records.
+        key (str): Column that "sorted"/"reversed" refer to.
+        order (str): One of INPUT_ORDERS.
+        seed (int): Shuffle seed for "random".
+    """
+    if order == "original":
+        return store
+    indices = list(range(len(store)))
+    if order == "random":
+        random.Random(seed).shuffle(indices)
+    else:
+        keys = store.sort_keys(key)
+        indices.sort(key=keys.__getitem__, reverse=(order == "reversed"))
+    return store.view(perm=indices)
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile (q in 0-100) of an already sorted list."""
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+def time_sort(func, data, key, args, warmup, repeats, gc_enabled):
+    """
+    Runs func(data, key, *args) warmup + repeats times.
+    
+    Returns:
+        list: Timed durations in nanoseconds.
+    """
+    for _ in range(warmup):
+        func(data, key, *args)
+    
+    timings = []
+    for _ in range(repeats):
+        _, elapsed = sort_worker.timed_call(func, data, key, *args, gc_enabled=gc_enabled)
+        timings.append(elapsed)
+    return timings
+
+def run_matrix(store, algorithms, columns, sizes, orders, warmup=1, repeats=5, gc_enabled=False,
+               k=10, seed=0, count_ops=False, on_result=None):
+    """
+    Benchmarks every (algorithm, column, n, order) combination.
+    
+    Args:
+        store (RecordStore): Loaded dataset.
+        algorithms (list): Names from ALGORITHMS.
+        columns (list): Columns to sort by.
+        sizes (list): Dataset sizes N (clamped to the dataset size).
+        orders (list): Input orders from INPUT_ORDERS.
+        warmup (int): Untimed runs per cell.
+        repeats (int): Timed runs per cell.
+        gc_enabled (bool): Keep the garbage collector enabled while timing.
+        k (int): k for the top-k partial sorts.
+        seed (int): Shuffle seed for the "random" order.
+        count_ops (bool): Add operation counts from one instrumented run per cell.
+        on_result (callable): Called with each result dict as soon as it is ready.
+    
+    Returns:
+        list: One result dict per cell (see RESULT_FIELDS).
+    """
+    results = []
+    for n in sizes:
+        head = store.view(0, n)
+        for column in columns:
+            for order in orders:
+                data = arrange(head, column, order, seed)
+                for name in algorithms:
+                    algorithm = ALGORITHMS[name]
+                    args = (min(k, len(data)),) if algorithm.mode == "top_k" else ()
+                    row = dict.fromkeys(RESULT_FIELDS)
+                    row.update(algorithm=name, column=column, n=len(data), order=order,
+                               repeats=repeats, error="")
+                    try:
+                        timings = sorted(time_sort(algorithm.function, data, column, args,
+                                                   warmup, repeats, gc_enabled))
+                        row.update(min_s=timings[0] / 1e9,
+                                   median_s=statistics.median(timings) / 1e9,
+                                   p95_s=percentile(timings, 95) / 1e9,
+                                   mean_s=statistics.fmean(timings) / 1e9)
+                        # The parallel sort has no instrumented variant
+                        if count_ops and algorithm.isolated:
+                            row.update(op_counter.count_operations(name, data, column, *args))
+                    except ValueError as e:
+                        # e.g. Radix Sort on a name column
+                        row["error"] = str(e)
+                    results.append(row)
+                    if on_result:
+                        on_result(row)
+    return results
+
+def write_results(results, fmt, out):
+    """Writes result dicts to the open text stream out as 'json' or 'csv'."""
+    if fmt == "json":
+        json.dump(results, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms without the GUI.")
+    parser.add_argument("--data", default=DATA_FILE_PATH, help="Dataset CSV (default: generated_data.csv)")
+    parser.add_argument("--algorithms", nargs="+", default=DEFAULT_ALGORITHMS, choices=sorted(ALGORITHMS),
+                        metavar="ALGO", help=f"Algorithms to run (default: {' '.join(DEFAULT_ALGORITHMS)})")
+    parser.add_argument("--columns", nargs="+", default=REQUIRED_COLUMNS, help="Columns to sort by")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000], help="Dataset sizes N")
+    parser.add_argument("--orders", nargs="+", default=["original"], choices=INPUT_ORDERS, help="Input orders")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per cell (default: 1)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per cell (default: 5)")
+    parser.add_argument("--gc", choices=["on", "off"], default="off",
+                        help="Garbage collector during timed runs (default: off)")
+    parser.add_argument("--collation", choices=sorted(record_store.COLLATIONS), default="binary",
+                        help="Name column collation (default: binary; casefold = case-insensitive)")
+    parser.add_argument("--k", type=int, default=10, help="k for the top-k sorts (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Shuffle seed for the random order")
+    parser.add_argument("--count-ops", action="store_true",
+                        help="Also count comparisons/swaps/shifts/moves/allocations (one extra untimed run)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json", help="Output format")
+    parser.add_argument("--output", default=None, help="Output file (default: stdout)")
+    args = parser.parse_args()
+    
+    if args.repeats < 1 or args.warmup < 0 or any(n < 1 for n in args.sizes):
+        parser.error("repeats and sizes must be >= 1, warmup >= 0")
+    
+    store, _ = record_store.load_cached(args.data, REQUIRED_COLUMNS, args.collation)
+    missing = [c for c in args.columns if c not in store.column_names]
+    if missing:
+        parser.error(f"Unknown columns: {', '.join(missing)}")
+    
+    def progress(row):
+        status = row["error"] or f"median {row['median_s']:.6f}s"
+        print(f"{row['algorithm']:<20} {row['column']:<10} n={row['n']:<8,} {row['order']:<9} {status}",
+              file=sys.stderr)
+    
+    results = run_matrix(store, args.algorithms, args.columns, args.sizes, args.orders,
+                         warmup=args.warmup, repeats=args.repeats, gc_enabled=(args.gc == "on"),
+                         k=args.k, seed=args.seed, count_ops=args.count_ops, on_result=progress)
+    
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            write_results(results, args.format, f)
+    else:
+        write_results(results, args.format, sys.stdout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""
+Synthetic Dataset Generator Module for DAA Prelim Exam
+=======================================================
+Writes test datasets with a controlled size, key distribution, duplicate
+ratio and amount of pre-sortedness.
+
+Two output formats:
+    records  - CSV with the ExamApp schema (ID,FirstName,LastName); the
+               parameters shape the ID column, names are drawn at random
+    ints     - one integer per line (the Alg.Sorter dataset.txt format)
+
+Rows are produced one at a time and written in batches, so memory use does
+not depend on the row count (10M-row files are fine):
+
+    - Key values: with m = rows · (1 - duplicates) distinct keys, key number
+      j is the (j + 0.5)/m quantile of the chosen distribution, mapped onto
+      the value range. In sorted order, row r has key number r·m // rows, so
+      every key appears equally often and the keys never have to be stored.
+    - Order: `inversions` is the expected share of inverted pairs, as a
+      percentage of the maximum. 0 = sorted, 50 = random, 100 = reversed.
+      A fraction s of the rows (picked by hash) is moved to random positions
+      among themselves. The expected share of inversions is then
+      2s/3 - s²/6, and s is solved from it. Values above 50 start from the
+      reversed order. The positions come from a pseudo-random permutation
+      (Feistel network with cycle walking) computed per row in O(1) memory.
+
+For the normal and skewed distributions, neighbouring quantiles can round to
+the same integer where the density is high, so `duplicates` is a lower bound
+there.
+
+Usage:
+    python dataset_generator.py big.csv --rows 10000000 --inversions 5 --duplicates 0.2
+    python dataset_generator.py ../../PRELIM-LAB-WORK-2/sorted_1m.txt --format ints --rows 1000000 --inversions 0
+"""
+
+import argparse
+import itertools
+import math
+import random
+import statistics
+import time
+
+FORMATS = ("records", "ints")
+DISTRIBUTIONS = ("uniform", "normal", "skewed")
+
+# Default ID range of the records format (7-digit IDs, as in generated_data.csv)
+DEFAULT_MIN_ID = 1000000
+DEFAULT_MAX_ID = 9999999
+
+# Rows written per file write
+WRITE_BATCH = 16384
+
+# Feistel rounds of the position permutation
+PERMUTATION_ROUNDS = 4
+
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth",
+    "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Daniel", "Nancy", "Matthew", "Lisa", "Anthony", "Betty", "Mark", "Margaret", "Paul", "Sandra",
+    "Steven", "Ashley", "Andrew", "Emily", "Kenneth", "Donna", "Joshua", "Michelle", "Kevin", "Carol",
+    "Brian", "Amanda", "George", "Melissa", "Edward", "Deborah", "Ronald", "Stephanie", "Timothy", "Rebecca",
+    "Jose", "Maria", "Juan", "Ana", "Carlos", "Rosa", "Miguel", "Elena", "Hiro", "Yuki",
+)
+
+# Last names are built from 2-3 syllables (about 48,000 combinations);
+# SURNAME_POOL of them are drawn once and reused, so memory stays fixed
+SURNAME_SYLLABLES = (
+    "an", "ber", "cas", "del", "es", "fer", "gar", "hal", "in", "jo", "kar", "lo", "mar", "nel",
+    "or", "per", "quin", "ros", "san", "tor", "ul", "val", "wil", "ya", "zan", "bel", "co", "di",
+    "ga", "ki", "la", "mi", "no", "ra", "shi", "ta",
+)
+SURNAME_POOL = 20000
+
+def _mix32(x):
+    """32-bit integer hash (MurmurHash3 finalizer)."""
+    x = ((x ^ (x >> 16)) * 0x85EBCA6B) & 0xFFFFFFFF
+    x = ((x ^ (x >> 13)) * 0xC2B2AE35) & 0xFFFFFFFF
+    return x ^ (x >> 16)
+
+class _Shuffle:
+    """
+    Moves a hashed subset of positions in range(n) to pseudo-random positions
+    among themselves, in O(1) memory.
+    
+    A balanced Feistel network permutes [0, 4^half) and cycle walking
+    restricts it to the subset: a position is mapped again until the result
+    is a member. That gives a bijection on the subset.
+    
+    Args:
+        n (int): Number of positions.
+        fraction (float): Share of positions that move (0-1).
+        seed (int): Seed of the round keys and the subset hash.
+    """
+    
+    def __init__(self, n, fraction, seed):
+        rng = random.Random(seed)
+        self.n = n
+        self.half = max(((n - 1).bit_length() + 1) // 2, 1)
+        self.mask = (1 << self.half) - 1
+        self.keys = [rng.getrandbits(32) for _ in range(PERMUTATION_ROUNDS)]
+        self.salt = rng.getrandbits(32)
+        self.threshold = int(fraction * (1 << 32))
+    
+    def moves(self, pos):
+        return _mix32((pos ^ self.salt) & 0xFFFFFFFF) < self.threshold
+    
+    def _permute(self, x):
+        left, right = x >> self.half, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (_mix32(right ^ key) & self.mask)
+        return (left << self.half) | right
+    
+    def __getitem__(self, pos):
+        """Source position of the element that ends up at pos."""
+        if not self.moves(pos):
+            return pos
+        x = self._permute(pos)
+        while x >= self.n or not self.moves(x):
+            x = self._permute(x)
+        return x
+
+def _quantile_function(distribution):
+    """Maps u in (0, 1) monotonically to [0, 1)."""
+    if distribution == "uniform":
+        return lambda u: u
+    if distribution == "normal":
+        # Mean in the middle of the range, ±3 sigma spans it
+        inv_cdf = statistics.NormalDist(0.5, 1 / 6).inv_cdf
+        return lambda u: min(max(inv_cdf(u), 0.0), 0.999999999)
+    if distribution == "skewed":
+        # Power law: small keys are much denser than large ones
+        return lambda u: u ** 3
+    raise ValueError(f"Unknown distribution {distribution!r} (choose from {', '.join(DISTRIBUTIONS)})")
+
+def shuffle_fraction(inversions):
+    """
+    Share s of moved rows, and whether to start from the reversed order,
+    for an expected inversion percentage (0-100).
+    """
+    reverse = inversions > 50
+    q = (100 - inversions if reverse else inversions) / 100
+    # Expected inversion share of moving s of the rows: 2s/3 - s²/6 = q
+    s = 2 - math.sqrt(max(4 - 6 * q, 0.0))
+    return min(s, 1.0), reverse
+
+def iter_keys(rows, distribution="uniform", duplicates=0.0, inversions=50.0,
+              min_value=1, max_value=None, seed=0):
+    """
+    Yields the integer keys of a synthetic dataset, one row at a time.
+    
+    Args:
+        rows (int): Number of keys.
+        distribution (str): One of DISTRIBUTIONS.
+        duplicates (float): Share of rows that repeat another row's key (0 <= d < 1).
+        inversions (float): Expected inverted pairs, % of the maximum
+                            (0 = sorted, 50 = random, 100 = reversed).
+        min_value (int): Smallest possible key.
+        max_value (int): Largest possible key (default: min_value + rows - 1).
+        seed (int): Seed for the row order.
+    
+    Raises:
+        ValueError: On out-of-range parameters or a value range smaller
+                    than the number of distinct keys.
+    """
+    if rows < 1:
+        raise ValueError("rows must be at least 1")
+    if not 0 <= duplicates < 1:
+        raise ValueError("duplicates must be in [0, 1)")
+    if not 0 <= inversions <= 100:
+        raise ValueError("inversions must be in [0, 100]")
+    if max_value is None:
+        max_value = min_value + rows - 1
+    
+    distinct = max(round(rows * (1 - duplicates)), 1)
+    span = max_value - min_value + 1
+    if span < distinct:
+        raise ValueError(f"Value range {min_value}..{max_value} is too small for {distinct:,} distinct keys")
+    
+    quantile = _quantile_function(distribution)
+    fraction, reverse = shuffle_fraction(inversions)
+    shuffle = _Shuffle(rows, fraction, seed) if fraction > 0 else None
+    
+    for pos in range(rows):
+        rank = shuffle[pos] if shuffle is not None else pos
+        if reverse:
+            rank = rows - 1 - rank
+        j = rank * distinct // rows
+        yield min_value + min(int(quantile((j + 0.5) / distinct) * span), span - 1)
+
+def _surnames(rng):
+    syllables = SURNAME_SYLLABLES
+    return ["".join(rng.choices(syllables, k=rng.randint(2, 3))).capitalize() for _ in range(SURNAME_POOL)]
+
+def generate(path, rows, fmt="records", distribution="uniform", duplicates=0.0, inversions=50.0,
+             min_value=None, max_value=None, seed=0, progress_callback=None):
+    """
+    Streams a synthetic dataset to path.
+    
+    Args:
+        path (str): Output file.
+        rows (int): Number of rows.
+        fmt (str): 'records' (ID,FirstName,LastName CSV) or 'ints' (one integer per line).
+        distribution, duplicates, inversions, seed: See iter_keys().
+        min_value (int): Smallest key (default: 1,000,000 for records, 1 for ints).
+        max_value (int): Largest key (default: 9,999,999 or 10 per row for records,
+                         min_value + rows - 1 for ints).
+        progress_callback (callable): Function to call with progress percentage (0-100).
+    
+    Returns:
+        dict: Rows, distinct keys, bytes written and seconds.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    if fmt == "records":
+        min_value = DEFAULT_MIN_ID if min_value is None else min_value
+        if max_value is None:
+            max_value = max(DEFAULT_MAX_ID, min_value + 10 * rows - 1)
+    else:
+        min_value = 1 if min_value is None else min_value
+    
+    start = time.perf_counter()
+    keys = iter_keys(rows, distribution, duplicates, inversions, min_value, max_value, seed)
+    names = random.Random(seed + 1)
+    surnames = _surnames(names) if fmt == "records" else None
+    
+    written = 0
+    done = 0
+    with open(path, 'w', encoding='utf-8', newline='') as out:
+        if fmt == "records":
+            out.write("ID,FirstName,LastName\n")
+        while done < rows:
+            batch = list(itertools.islice(keys, WRITE_BATCH))
+            if fmt == "records":
+                firsts = names.choices(FIRST_NAMES, k=len(batch))
+                lasts = names.choices(surnames, k=len(batch))
+                lines = [f"{key},{first},{last}\n" for key, first, last in zip(batch, firsts, lasts)]
+            else:
+                lines = [f"{key}\n" for key in batch]
+            written += out.write("".join(lines))
+            done += len(batch)
+            if progress_callback:
+                progress_callback(min(done / rows * 100, 99.9))
+    
+    if progress_callback:
+        progress_callback(100)
+    return {
+        "rows": rows,
+        "distinct": max(round(rows * (1 - duplicates)), 1),
+        "bytes": written,
+        "seconds": time.perf_counter() - start,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic dataset for the sorting benchmarks.")
+    parser.add_argument("output", help="File to write (.csv for records, .txt for ints)")
+    parser.add_argument("--rows", type=int, default=100000, help="Number of rows (default: 100000)")
+    parser.add_argument("--format", choices=FORMATS, default="records",
+                        help="records = ID,FirstName,LastName CSV; ints = one integer per line")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform",
+                        help="Key distribution over the value range (default: uniform)")
+    parser.add_argument("--duplicates", type=float, default=0.0,
+                        help="Share of rows repeating another row's key, 0-1 (default: 0; 0.99 = few unique)")
+    parser.add_argument("--inversions", type=float, default=50.0,
+                        help="Expected inverted pairs in %% of the maximum: 0 = sorted, 50 = random, 100 = reversed")
+    parser.add_argument("--min", dest="min_value", type=int, default=None, help="Smallest key")
+    parser.add_argument("--max", dest="max_value", type=int, default=None, help="Largest key")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+    
+    try:
+        stats = generate(args.output, args.rows, args.format, args.distribution, args.duplicates,
+                         args.inversions, args.min_value, args.max_value, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Wrote {stats['rows']:,} rows ({stats['distinct']:,} distinct keys, "
+          f"{stats['bytes'] / 1e6:.1f} MB) in {stats['seconds']:.4f}s")
+
+if __name__ == "__main__":
+    main()
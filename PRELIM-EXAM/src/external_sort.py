@@ -0,0 +1,262 @@
+"""
+External Merge Sort Module for DAA Prelim Exam
+===============================================
+Sorts CSV files that are too large to load into memory.
+
+Phase 1 (run generation): the input CSV is read in chunks that fit the
+memory budget, each chunk is sorted by the chosen column with the bottom-up
+merge sort engine, and the sorted chunk is spilled to a temporary run file.
+
+Phase 2 (merging): runs are combined with a heap-based k-way merge
+(heapq.merge), at most `fan_in` runs at a time. Extra intermediate passes
+run only when there are more runs than the fan-in. The final pass streams
+straight into the output CSV.
+
+Only one chunk (phase 1) or one row per open run (phase 2) is in memory at
+any time, so peak memory depends on the budget, not on the input size.
+
+Complexity:
+    Time:  O(n log n) comparisons, O(n · passes) disk I/O
+    Space: O(memory budget) RAM, O(n) temporary disk space
+    Stable: Yes - runs are merged in input order on ties
+
+Usage:
+    python external_sort.py INPUT.csv OUTPUT.csv --key LastName --memory-mb 64 --fan-in 16
+"""
+
+import argparse
+import csv
+import heapq
+import os
+import shutil
+import tempfile
+import time
+
+import sorting_algorithms
+
+# Default memory budget for one in-memory chunk, in megabytes
+DEFAULT_MEMORY_MB = 64
+
+# Default maximum number of runs merged at once
+DEFAULT_FAN_IN = 16
+
+# Rough per-row overhead of a parsed csv row (list object, str headers, pair tuple)
+ROW_OVERHEAD_BYTES = 250
+
+# Rows written between two progress/cancel checks during merging
+MERGE_CHECK_INTERVAL = 10000
+
+# Buffer size for run files and the output file
+IO_BUFFER_BYTES = 1 << 20
+
+class _Cancelled(Exception):
+    """Raised internally to unwind when the cancel event is set."""
+
+def _open_run_writer(path):
+    f = open(path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_BYTES)
+    return f, csv.writer(f)
+
+def _make_key_parser(numeric):
+    """Returns the function that turns a raw CSV field into a sort key."""
+    return int if numeric else str
+
+def _spill_runs(input_path, key, numeric, descending, memory_limit_bytes, run_dir,
+                report, is_cancelled):
+    """
+    Phase 1: reads the CSV in bounded chunks and writes one sorted run per chunk.
+    
+    Returns:
+        tuple: (header, list of run paths, total row count)
+    """
+    parse_key = _make_key_parser(numeric)
+    total_bytes = max(os.path.getsize(input_path), 1)
+    runs = []
+    row_count = 0
+    
+    with open(input_path, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_BYTES) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty or has no headers.")
+        if key not in header:
+            raise ValueError(f"Missing required column: {key}")
+        col = header.index(key)
+        
+        def flush(chunk):
+            pairs = [(row_key, i) for i, (row_key, _) in enumerate(chunk)]
+            pairs = sorting_algorithms.merge_sort_pairs(pairs, descending)
+            path = os.path.join(run_dir, f"run_{len(runs):05d}.csv")
+            out, writer = _open_run_writer(path)
+            with out:
+                writer.writerows(chunk[i][1] for _, i in pairs)
+            runs.append(path)
+        
+        chunk = []
+        chunk_bytes = 0
+        for row in reader:
+            if not row:
+                continue
+            try:
+                row_key = parse_key(row[col])
+            except (ValueError, IndexError):
+                raise ValueError(f"Row {reader.line_num}: invalid {key} value {row[col:col + 1]}")
+            chunk.append((row_key, row))
+            chunk_bytes += ROW_OVERHEAD_BYTES + sum(map(len, row))
+            
+            if chunk_bytes >= memory_limit_bytes:
+                if is_cancelled():
+                    raise _Cancelled()
+                flush(chunk)
+                row_count += len(chunk)
+                chunk = []
+                chunk_bytes = 0
+                # Byte position of the underlying buffer (text tell() is disabled while iterating)
+                report(f.buffer.tell() / total_bytes * 50)
+        
+        if chunk:
+            flush(chunk)
+            row_count += len(chunk)
+        report(50)
+    
+    return header, runs, row_count
+
+def _merge_runs(paths, writer, col, numeric, descending, on_rows):
+    """Streams a stable k-way heap merge of the run files into `writer`."""
+    parse_key = _make_key_parser(numeric)
+    files = [open(p, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_BYTES) for p in paths]
+    try:
+        readers = [csv.reader(f) for f in files]
+        merged = heapq.merge(*readers, key=lambda row: parse_key(row[col]), reverse=descending)
+        pending = 0
+        for row in merged:
+            writer.writerow(row)
+            pending += 1
+            if pending == MERGE_CHECK_INTERVAL:
+                on_rows(pending)
+                pending = 0
+        on_rows(pending)
+    finally:
+        for f in files:
+            f.close()
+
+def external_sort_csv(input_path, output_path, key, descending=False, numeric=None,
+                      memory_mb=DEFAULT_MEMORY_MB, fan_in=DEFAULT_FAN_IN, temp_dir=None,
+                      progress_callback=None, cancel_event=None):
+    """
+    Sorts a CSV file by one column using an external (out-of-core) merge sort.
+    
+    Args:
+        input_path (str): CSV file to sort (first line is the header).
+        output_path (str): Where to write the sorted CSV (header included).
+        key (str): Column to sort by.
+        descending (bool): Sort in descending order if True.
+        numeric (bool): Compare the column as integers. Defaults to True for 'ID'.
+        memory_mb (float): Memory budget for one in-memory chunk, in MB.
+        fan_in (int): Maximum number of runs merged in one pass (>= 2).
+        temp_dir (str): Directory for run files (default: system temp dir).
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        dict: Statistics (rows, runs, merge_passes, seconds), or None if cancelled.
+    
+    Raises:
+        ValueError: For a missing column, unparsable keys or invalid settings.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if memory_mb <= 0:
+        raise ValueError("memory_mb must be positive")
+    if numeric is None:
+        numeric = (key == 'ID')
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    def report(p):
+        if progress_callback:
+            progress_callback(min(p, 99.9))
+    
+    start = time.perf_counter()
+    run_dir = tempfile.mkdtemp(prefix="extsort_", dir=temp_dir)
+    try:
+        header, runs, row_count = _spill_runs(
+            input_path, key, numeric, descending, memory_mb * 1024 * 1024, run_dir,
+            report, is_cancelled)
+        col = header.index(key)
+        run_count = len(runs)
+        
+        # Total rows to write across all merge passes, for progress reporting
+        passes = 1
+        remaining = run_count
+        while remaining > fan_in:
+            remaining = -(-remaining // fan_in)
+            passes += 1
+        total_rows = max(row_count * passes, 1)
+        written = [0]
+        
+        def on_rows(count):
+            written[0] += count
+            if is_cancelled():
+                raise _Cancelled()
+            report(50 + written[0] / total_rows * 50)
+        
+        # Intermediate passes: merge groups of fan_in consecutive runs
+        merge_pass = 0
+        while len(runs) > fan_in:
+            merge_pass += 1
+            next_runs = []
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                path = os.path.join(run_dir, f"pass{merge_pass}_{len(next_runs):05d}.csv")
+                out, writer = _open_run_writer(path)
+                with out:
+                    _merge_runs(group, writer, col, numeric, descending, on_rows)
+                for p in group:
+                    os.remove(p)
+                next_runs.append(path)
+            runs = next_runs
+        
+        # Final pass streams into the output file
+        out, writer = _open_run_writer(output_path)
+        try:
+            with out:
+                writer.writerow(header)
+                _merge_runs(runs, writer, col, numeric, descending, on_rows)
+        except _Cancelled:
+            os.remove(output_path)
+            raise
+    except _Cancelled:
+        return None
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+    
+    if progress_callback:
+        progress_callback(100)
+    return {
+        "rows": row_count,
+        "runs": run_count,
+        "merge_passes": passes,
+        "seconds": time.perf_counter() - start,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Sort a CSV file larger than RAM by one column.")
+    parser.add_argument("input", help="CSV file to sort")
+    parser.add_argument("output", help="Path of the sorted CSV to write")
+    parser.add_argument("--key", default="ID", help="Column to sort by (default: ID)")
+    parser.add_argument("--descending", action="store_true", help="Sort in descending order")
+    parser.add_argument("--memory-mb", type=float, default=DEFAULT_MEMORY_MB,
+                        help=f"Memory budget per chunk in MB (default: {DEFAULT_MEMORY_MB})")
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN,
+                        help=f"Runs merged per pass (default: {DEFAULT_FAN_IN})")
+    parser.add_argument("--temp-dir", default=None, help="Directory for temporary run files")
+    args = parser.parse_args()
+    
+    stats = external_sort_csv(args.input, args.output, args.key, args.descending,
+                              memory_mb=args.memory_mb, fan_in=args.fan_in,
+                              temp_dir=args.temp_dir)
+    print(f"Sorted {stats['rows']:,} rows ({stats['runs']} runs, "
+          f"{stats['merge_passes']} merge passes) in {stats['seconds']:.4f}s")
+
+if __name__ == "__main__":
+    main()
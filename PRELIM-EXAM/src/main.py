@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 import time
 import os
@@ -8,13 +8,43 @@ import sys
 
 # Ensure local imports work
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import sorting_algorithms
+import algorithm_registry
+import external_sort
+import record_store
+import permutation_cache
+import progress_channel
+import sort_worker
+import runtime_estimator
+import op_counter
 
 DATA_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'generated_data.csv')
 
 # Required columns for data validation
 REQUIRED_COLUMNS = ['ID', 'FirstName', 'LastName']
 
+# Benchmark algorithms (display name -> algorithm_registry.SortAlgorithm)
+ALGORITHMS = algorithm_registry.ALGORITHMS
+# Upper limit on rows inserted into the results table for a top-k preview
+TOP_K_MAX_DISPLAY = 1000
+
+# Per-host runtime model constants (see runtime_estimator)
+CALIBRATION_DIR = os.path.join(os.path.dirname(DATA_FILE_PATH), '.calibration')
+# Longest wait for a calibration micro-benchmark to stop (seconds), and the
+# retry delay for resuming when it has not stopped yet (ms)
+CALIBRATION_JOIN_TIMEOUT = 2.0
+CALIBRATION_RETRY_MS = 200
+
+# External (out-of-core) sort settings: memory budget per chunk and merge fan-in
+EXTERNAL_SORT_MEMORY_MB = 64
+EXTERNAL_SORT_FAN_IN = 16
+
+# Computed sort permutations are kept next to the dataset (memory + disk LRU)
+SORT_CACHE_DIR = os.path.join(os.path.dirname(DATA_FILE_PATH), '.sortcache')
+
+def cache_column(key, collation):
+    """Permutation cache column id: case-insensitive orders are cached apart."""
+    return key if collation == "binary" else f"{key}/{collation}"
+
 class ExamApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -35,29 +65,39 @@ class ExamApp(tk.Tk):
         self.stop_color = "#E74C3C"   # Red for stop button
         self.placeholder_text = "#95A5A6" # Muted placeholder text
 
-        # Algorithm complexity mapping
-        self.complexity_map = {
-            "Bubble Sort": "O(n²)",
-            "Insertion Sort": "O(n²)",
-            "Merge Sort": "O(n log n)"
-        }
-
         self.configure(bg=self.bg_main)
         
-        # Data
+        # Data (record_store.RecordStore once loaded)
         self.full_data = []
         self.data_valid = False
         
+        # Sort permutations of finished runs, reused by "sorted view only"
+        self.perm_cache = permutation_cache.PermutationCache(SORT_CACHE_DIR)
+        
         # Threading
         self.cancel_event = threading.Event()
         self.sort_thread = None
+        # Benchmarks run in a separate process; STOP terminates it immediately
+        self.sort_worker = sort_worker.SortWorker()
+        
+        # Host-calibrated run time predictions; background calibration yields to benchmarks
+        self.estimator = runtime_estimator.RuntimeEstimator(CALIBRATION_DIR)
+        self.calibration_stop = threading.Event()
+        self.calibration_thread = None
+        self.run_generation = 0  # Bumped by every pause; stale resume retries compare against it
         
         # UI State
         self.algo_var = tk.StringVar(value="Bubble Sort")
         self.key_var = tk.StringVar(value="ID")
         self.n_var = tk.StringVar(value="1000")
+        self.k_var = tk.StringVar(value="10")
+        self.view_only_var = tk.BooleanVar(value=False)
+        self.count_ops_var = tk.BooleanVar(value=False)
+        self.ignore_case_var = tk.BooleanVar(value=False)
         
         self.create_layout()
+        # Sort threads write progress into a shared slot; the bar polls it at a fixed rate
+        self.progress_channel = progress_channel.ProgressChannel(self, self.progress)
         self.load_data_thread()
         
     def load_data_thread(self):
@@ -68,46 +108,71 @@ class ExamApp(tk.Tk):
         """Load and validate data from CSV file."""
         try:
             start = time.perf_counter()
-            with open(DATA_FILE_PATH, mode='r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                # Validate CSV schema
-                if reader.fieldnames is None:
-                    self.update_status("Error: CSV file is empty or has no headers.")
-                    return
-                    
-                missing_cols = [col for col in REQUIRED_COLUMNS if col not in reader.fieldnames]
-                if missing_cols:
-                    self.update_status(f"Error: Missing required columns: {', '.join(missing_cols)}")
-                    return
-                
-                data = []
-                for row in reader:
-                    try:
-                        row['ID'] = int(row['ID'])
-                    except (ValueError, KeyError):
-                        pass  # Keep as-is if conversion fails
-                    data.append(row)
-                    
+            # Columnar store: mapped from the binary snapshot when the CSV is
+            # unchanged, otherwise parsed (schema validated, IDs to int64) and cached
+            data, from_snapshot = record_store.load_cached(DATA_FILE_PATH, REQUIRED_COLUMNS)
             self.full_data = data
             self.data_valid = True
             end = time.perf_counter()
-            self.update_status(f"✓ Loaded {len(data):,} records in {end-start:.4f}s")
+            source = "snapshot" if from_snapshot else "CSV"
+            self.update_status(f"✓ Loaded {len(data):,} records in {end-start:.4f}s ({source})")
             self.after(0, self.show_data_preview)
             self.after(0, self.update_n_max_label)
             
+            # First launch on this host: measure the cost model constants
+            self.after(0, self.resume_calibration)
+            
         except FileNotFoundError:
             self.update_status(f"Error: File not found at {DATA_FILE_PATH}")
+        except ValueError as e:
+            self.update_status(f"Error: {e}")
         except Exception as e:
             self.update_status(f"Error loading data: {e}")
             
+    def pause_calibration(self):
+        """
+        Stops background calibration before a timed run and waits (bounded)
+        for its current micro-benchmark to finish, so the two never overlap.
+        """
+        self.run_generation += 1
+        self.calibration_stop.set()
+        if self.calibration_thread is not None:
+            self.calibration_thread.join(CALIBRATION_JOIN_TIMEOUT)
+        
+    def resume_calibration(self, generation=None):
+        """
+        Starts (or resumes) background calibration after a run ends; pairs
+        calibrated before the pause are skipped. A paused thread is joined
+        first (the stop event stays set meanwhile), so it can never carry
+        on next to a new one or exit after the event was cleared.
+        """
+        if not self.data_valid:
+            return
+        if generation is not None and generation != self.run_generation:
+            return  # A new run started meanwhile; it resumes calibration when it ends
+        running = self.calibration_thread is not None and self.calibration_thread.is_alive()
+        if running and not self.calibration_stop.is_set():
+            return  # Never paused (e.g. a cached view): still calibrating
+        if running:
+            self.calibration_thread.join(CALIBRATION_JOIN_TIMEOUT)
+            if self.calibration_thread.is_alive():
+                retry_generation = self.run_generation
+                self.after(CALIBRATION_RETRY_MS, lambda: self.resume_calibration(retry_generation))
+                return
+        self.calibration_stop.clear()
+        self.calibration_thread = threading.Thread(target=self.calibrate_bg, daemon=True)
+        self.calibration_thread.start()
+        
+    def calibrate_bg(self):
+        try:
+            self.estimator.calibrate(self.full_data, [a.func_name for a in ALGORITHMS.values()],
+                                     self.calibration_stop)
+        except Exception as e:
+            self.update_status(f"Calibration failed: {e}")
+        
     def update_status(self, msg):
         self.after(0, lambda: self.lbl_sub_status.config(text=msg))
         
-    def update_progress(self, value):
-        """Thread-safe progress bar update."""
-        self.after(0, lambda: self.progress.configure(value=value))
-
     def create_rounded_rect(self, canvas, x1, y1, x2, y2, radius=25, **kwargs):
         points = [
             x1 + radius, y1, x1 + radius, y1,
@@ -135,7 +200,7 @@ class ExamApp(tk.Tk):
                  bg=self.bg_sidebar, fg=self.text_primary, justify="left").pack(pady=(30, 15), padx=20, anchor="w")
 
         # Configurations Card
-        config_frame = self.create_card_container(sidebar, 250, 300)
+        config_frame = self.create_card_container(sidebar, 250, 440)
         
         tk.Label(config_frame, text="Configurations", font=("Segoe UI", 11, "bold"), bg=self.card_bg, fg=self.text_primary).pack(anchor="w", pady=(0, 10))
         
@@ -146,7 +211,7 @@ class ExamApp(tk.Tk):
             cb.pack(fill="x", pady=(0, 5))
             return cb
 
-        add_combo("Algorithm", self.algo_var, ["Bubble Sort", "Insertion Sort", "Merge Sort"])
+        add_combo("Algorithm", self.algo_var, list(ALGORITHMS))
         add_combo("Sort By", self.key_var, ["ID", "FirstName", "LastName"])
         
         # Custom Dataset Size Input with validation
@@ -185,6 +250,29 @@ class ExamApp(tk.Tk):
         # Set up real-time validation trace
         self.n_var.trace_add("write", self.validate_n_input)
         
+        # Number of records returned by the Top-K partial sorts
+        tk.Label(config_frame, text="Top-K Preview (k)", bg=self.card_bg, fg=self.text_secondary, font=("Segoe UI", 9)).pack(anchor="w", pady=(8, 0))
+        self.k_entry = tk.Entry(config_frame, textvariable=self.k_var, font=("Consolas", 10),
+                                bg=self.card_bg, fg=self.text_primary, insertbackground=self.text_primary,
+                                relief="solid", bd=1, highlightthickness=1,
+                                highlightbackground=self.card_border, highlightcolor=self.accent_main)
+        self.k_entry.pack(fill="x")
+        
+        # Answer from the permutation cache instead of running the algorithm
+        tk.Checkbutton(config_frame, text="Sorted view only (use cache)", variable=self.view_only_var,
+                       bg=self.card_bg, fg=self.text_secondary, activebackground=self.card_bg,
+                       font=("Segoe UI", 9), bd=0, highlightthickness=0).pack(anchor="w", pady=(6, 0))
+        
+        # Follow the timed run with an untimed, instrumented run that counts operations
+        tk.Checkbutton(config_frame, text="Count operations (extra run)", variable=self.count_ops_var,
+                       bg=self.card_bg, fg=self.text_secondary, activebackground=self.card_bg,
+                       font=("Segoe UI", 9), bd=0, highlightthickness=0).pack(anchor="w")
+        
+        # Name columns: compare under the case-insensitive collation
+        tk.Checkbutton(config_frame, text="Ignore case (names)", variable=self.ignore_case_var,
+                       bg=self.card_bg, fg=self.text_secondary, activebackground=self.card_bg,
+                       font=("Segoe UI", 9), bd=0, highlightthickness=0).pack(anchor="w")
+        
         # Buttons Container
         btn_container = tk.Frame(sidebar, bg=self.bg_sidebar)
         btn_container.pack(pady=20)
@@ -195,6 +283,9 @@ class ExamApp(tk.Tk):
         # Stop Button
         self.btn_stop = self.create_action_button(btn_container, "STOP", self.cancel_sort, "stop")
         self.set_button_state(self.btn_stop, "disabled")
+        
+        # External Sort Button (sorts a CSV file on disk without loading it)
+        self.btn_external = self.create_action_button(btn_container, "SORT CSV FILE...", self.start_external_sort, "run")
 
         # 2. Main Area
         main_frame = tk.Frame(self, bg=self.bg_main)
@@ -239,6 +330,15 @@ class ExamApp(tk.Tk):
         self.metric_complexity = self.create_metric_card(metrics_frame, "Complexity", "--", "")
         self.metric_records = self.create_metric_card(metrics_frame, "Records Sorted", "--", "")
         
+        # Operation count cards (filled when "Count operations" is checked)
+        ops_frame = tk.Frame(main_frame, bg=self.bg_main)
+        ops_frame.pack(fill="x", pady=(0, 15))
+        
+        self.metric_comparisons = self.create_metric_card(ops_frame, "Comparisons", "--", "", card_w=135, value_size=16)
+        self.metric_swaps = self.create_metric_card(ops_frame, "Swaps / Shifts", "--", "", card_w=135, value_size=16)
+        self.metric_moves = self.create_metric_card(ops_frame, "Moves", "--", "", card_w=135, value_size=16)
+        self.metric_allocations = self.create_metric_card(ops_frame, "Allocations", "--", "", card_w=135, value_size=16)
+        
         # Results Area Label
         result_label = tk.Label(main_frame, text="Top 10 Sorted Records", font=("Segoe UI", 10, "bold"), 
                                  bg=self.bg_main, fg=self.text_secondary)
@@ -327,9 +427,8 @@ class ExamApp(tk.Tk):
         
         return inner
 
-    def create_metric_card(self, parent, title, value, unit):
+    def create_metric_card(self, parent, title, value, unit, card_w=180, value_size=24):
         """Create a metric status card with large bold value."""
-        card_w = 180
         card_h = 90
         
         canvas = tk.Canvas(parent, width=card_w, height=card_h, bg=self.bg_main, highlightthickness=0)
@@ -346,7 +445,7 @@ class ExamApp(tk.Tk):
         # Value label (large, bold) - stored for updates
         value_text = f"{value}{unit}" if unit else value
         value_label = canvas.create_text(card_w/2, 55, text=value_text, 
-                                          fill=self.text_primary, font=("Helvetica", 24, "bold"))
+                                          fill=self.text_primary, font=("Helvetica", value_size, "bold"))
         
         # Store references for updating
         canvas.value_label = value_label
@@ -359,6 +458,18 @@ class ExamApp(tk.Tk):
         display_text = f"{value}{card.unit}" if card.unit else str(value)
         card.itemconfig(card.value_label, text=display_text)
 
+    def update_op_cards(self, counts=None, placeholder="--"):
+        """Show operation counts (dict from op_counter) on the count cards, or a placeholder."""
+        if counts is None:
+            for card in (self.metric_comparisons, self.metric_swaps, self.metric_moves, self.metric_allocations):
+                self.update_metric_card(card, placeholder)
+            return
+        self.update_metric_card(self.metric_comparisons, op_counter.format_count(counts["comparisons"]))
+        self.update_metric_card(self.metric_swaps,
+                                f"{op_counter.format_count(counts['swaps'])} / {op_counter.format_count(counts['shifts'])}")
+        self.update_metric_card(self.metric_moves, op_counter.format_count(counts["moves"]))
+        self.update_metric_card(self.metric_allocations, op_counter.format_count(counts["allocations"]))
+
     def create_action_button(self, parent, text, command, role="run"):
         btn_w = 180
         btn_h = 45
@@ -476,54 +587,38 @@ class ExamApp(tk.Tk):
         div = "-" * len(header)
         
         lines = [header, div]
-        for row in self.full_data[:5]:
+        for row in self.full_data.records(range(min(5, len(self.full_data)))):
             lines.append(f"{str(row.get('ID', 'N/A')):<10} | {row.get('FirstName', 'N/A'):<18} | {row.get('LastName', 'N/A'):<18}")
         
         self.preview_area.insert(tk.END, "\n".join(lines))
         self.preview_area.config(state=tk.DISABLED)
 
-    def estimate_sort_time(self, n, algo):
-        """Estimate sorting time based on algorithm complexity and dataset size.
+    def estimate_sort_time(self, n, algo, key):
+        """Estimate sorting time from constants calibrated on this machine.
         
-        These estimates are calibrated for typical Python performance on modern hardware.
-        Bubble Sort: ~5,337,000 comparisons/swaps per second (slowest, most swaps)
-        Insertion Sort: ~7,726,000 comparisons/shifts per second (fewer operations on average)
-        Merge Sort: ~1,500,000 operations per second (O(n log n), very efficient)
+        Returns the point estimate plus its 95% interval. The constants come
+        from micro-benchmarks run after loading and from every completed
+        run (see runtime_estimator); until then the old fixed throughputs
+        are used with a wide interval.
         """
-        import math
-        
-        if algo == "Bubble Sort":
-            # O(n²) - worst case, every pair compared and many swaps
-            ops = n * n
-            ops_per_sec = 5337000
-        elif algo == "Insertion Sort":
-            # O(n²) but typically faster than bubble (fewer operations on average)
-            ops = (n * n) / 2  # Average case is n²/2
-            ops_per_sec = 7726000
-        else:
-            # O(n log n) algorithms - Merge Sort
-            ops = n * math.log2(n) if n > 0 else 0
-            ops_per_sec = 1500000
-        
-        seconds = ops / ops_per_sec
+        func_name = ALGORITHMS[algo].func_name
+        kind = runtime_estimator.column_kind(self.full_data.column(key))
+        seconds, low, high, calibrated = self.estimator.estimate(func_name, kind, n)
         
-        if seconds < 60:
-            return f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f} minutes"
-        else:
-            return f"{seconds/3600:.1f} hours"
+        fmt = runtime_estimator.format_duration
+        source = "" if calibrated else ", uncalibrated"
+        return f"{fmt(seconds)}\n(95%: {fmt(low)} – {fmt(high)}{source})"
 
-    def show_heat_warning(self, algo, n):
+    def show_heat_warning(self, algo, n, key):
         """Show enhanced heat warning dialog for O(n²) algorithms on large datasets."""
-        estimated_time = self.estimate_sort_time(n, algo)
-        complexity = self.complexity_map.get(algo, "O(n²)")
+        estimated_time = self.estimate_sort_time(n, algo, key)
+        complexity = ALGORITHMS[algo].complexity
         
         result = {"proceed": False, "closed": False}
         
         warning = tk.Toplevel(self)
         warning.title("⚠ Performance Warning")
-        warning.geometry("420x320")
+        warning.geometry("420x340")
         warning.configure(bg=self.card_bg)
         warning.resizable(False, False)
         warning.transient(self)
@@ -541,7 +636,7 @@ class ExamApp(tk.Tk):
         # Center the dialog
         warning.update_idletasks()
         x = self.winfo_x() + (self.winfo_width() - 420) // 2
-        y = self.winfo_y() + (self.winfo_height() - 320) // 2
+        y = self.winfo_y() + (self.winfo_height() - 340) // 2
         warning.geometry(f"+{x}+{y}")
         
         # Warning header with fire icon
@@ -568,7 +663,7 @@ class ExamApp(tk.Tk):
         tk.Label(stats_frame, text=f"Complexity: {complexity}", font=("Consolas", 10, "bold"),
                  bg="#F8F9F9", fg="#E74C3C").pack(anchor="w")
         tk.Label(stats_frame, text=f"Estimated Time: {estimated_time}", font=("Consolas", 10, "bold"),
-                 bg="#F8F9F9", fg="#E67E22").pack(anchor="w")
+                 bg="#F8F9F9", fg="#E67E22", justify="left").pack(anchor="w")
         
         tk.Label(content, text="This may freeze the UI and consume significant resources.",
                  font=("Segoe UI", 9), bg=self.card_bg, fg=self.text_secondary,
@@ -619,19 +714,51 @@ class ExamApp(tk.Tk):
             
         algo = self.algo_var.get()
         key = self.key_var.get()
+        algorithm = ALGORITHMS[algo]
+        
+        kind = runtime_estimator.column_kind(self.full_data.column(key))
+        if kind not in algorithm.key_kinds:
+            kinds = " or ".join({"int": "integer", "str": "text"}[kind] for kind in algorithm.key_kinds)
+            messagebox.showerror("Unsupported Key", f"{algo} sorts {kinds} keys only.\n\nChoose another column or algorithm.")
+            return
+        
+        # Partial sorts need a valid k (clamped to N)
+        k = None
+        if algorithm.mode == "top_k":
+            try:
+                k = int(self.k_var.get().strip())
+                if k <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Invalid Input", "Top-K preview size (k) must be a whole number greater than 0.")
+                return
+            k = min(k, n)
+        
+        collation = "casefold" if self.ignore_case_var.get() else "binary"
+        
+        # Sorted view only: reuse a cached (stable) permutation (exact N or a larger N)
+        if self.view_only_var.get():
+            start = time.perf_counter()
+            perm = self.perm_cache.get(self.full_data.fingerprint, cache_column(key, collation), False, n)
+            lookup = time.perf_counter() - start
+            if perm is not None:
+                self.show_cached_view(perm, lookup, n, algo, key, k)
+                return
         
         # Show enhanced heat warning for O(n²) algorithms on large datasets
-        if n > 10000 and algo in ["Bubble Sort", "Insertion Sort"]:
-            if not self.show_heat_warning(algo, n):
+        if n > 10000 and algorithm.model == "n2":
+            if not self.show_heat_warning(algo, n, key):
                 return
         
         # Reset state
         self.cancel_event.clear()
-        self.progress['value'] = 0
+        self.pause_calibration()
+        self.progress_channel.start()
         
         # Loading State: Change RUN button to SORTING... and disable
         self.set_button_state(self.btn_run, "disabled", "SORTING...")
         self.set_button_state(self.btn_stop, "normal")
+        self.set_button_state(self.btn_external, "disabled")
         
         self.lbl_main_status.config(text="Benchmarking...")
         
@@ -643,67 +770,177 @@ class ExamApp(tk.Tk):
         for item in self.result_tree.get_children():
             self.result_tree.delete(item)
         self.update_metric_card(self.metric_time, "...")
-        self.update_metric_card(self.metric_complexity, self.complexity_map.get(algo, "--"))
+        self.update_metric_card(self.metric_complexity, algorithm.complexity)
         self.update_metric_card(self.metric_records, f"{n:,}")
+        self.update_op_cards(placeholder="..." if self.count_ops_var.get() and algorithm.isolated else "--")
         self.result_status.config(text=f"Running {algo} on {n:,} records sorted by {key}...")
         
-        self.sort_thread = threading.Thread(target=self.run_sort_thread, args=(n, algo, key))
+        self.sort_thread = threading.Thread(target=self.run_sort_thread, args=(n, algo, key, k, collation))
         self.sort_thread.start()
         
     def cancel_sort(self):
-        """Signal the sorting thread to stop."""
+        """Signal the sorting thread to stop (the worker process is terminated)."""
         self.cancel_event.set()
         self.update_status("Cancelling... Please wait.")
         
-    def run_sort_thread(self, n, algo, key):
-        subset = list(self.full_data[:n])
-        
-        start = time.perf_counter()
+    def run_sort_thread(self, n, algo, key, k=None, collation="binary"):
+        # Zero-copy view of the first n rows; results are positions in it
+        subset = self.full_data.view(0, n)
+        if collation != "binary":
+            # Shares the columns; only the name sort keys change
+            subset = subset.with_collation(collation)
         
+        algorithm = ALGORITHMS[algo]
         sorted_data = None
+        counts = None
+        note = ""
         try:
-            if algo == "Bubble Sort":
-                sorted_data = sorting_algorithms.bubble_sort(
-                    subset, key, 
-                    progress_callback=self.update_progress, 
-                    cancel_event=self.cancel_event
-                )
-            elif algo == "Insertion Sort":
-                sorted_data = sorting_algorithms.insertion_sort(
-                    subset, key, 
-                    progress_callback=self.update_progress, 
+            if algorithm.isolated:
+                extra_args = (k,) if algorithm.mode == "top_k" else ()
+                prefix = None
+                if algorithm.mode == "incremental":
+                    # Extend the largest cached sorted prefix (m <= n) by the new records only
+                    m, prefix = self.perm_cache.get_prefix(
+                        self.full_data.fingerprint, cache_column(key, collation), False, n)
+                    prefix = prefix if prefix is not None else []
+                    note = f"Extended cached N = {m:,} by {n - m:,} new records • " if m else "No cached prefix, full sort • "
+                
+                # Runs in the worker process, which also times the sort itself
+                outcome = self.sort_worker.run(
+                    algorithm.func_name, subset, key, *extra_args, 
+                    prefix=prefix, 
+                    count_ops=self.count_ops_var.get(), 
+                    progress_callback=self.progress_channel.report, 
                     cancel_event=self.cancel_event
                 )
-            elif algo == "Merge Sort":
-                sorted_data = sorting_algorithms.merge_sort(
-                    subset, key, 
-                    progress_callback=self.update_progress, 
+                if outcome is not None:
+                    sorted_data, duration, counts = outcome
+            else:
+                # Manages its own worker pool, so it is driven from this thread
+                # (same timing policy as the worker and the headless benchmark)
+                sorted_data, elapsed = sort_worker.timed_call(
+                    algorithm.function, subset, key, 
+                    progress_callback=self.progress_channel.report, 
                     cancel_event=self.cancel_event
                 )
+                duration = elapsed / 1e9
         except Exception as e:
             self.after(0, lambda: self.show_error(str(e)))
             return
         
-        end = time.perf_counter()
-        duration = end - start
-        
         if sorted_data is None:
             # Cancelled
             self.after(0, self.on_sort_cancelled)
         else:
-            self.after(0, lambda: self.show_results(sorted_data, duration, n, algo, key))
+            # Cache the full permutation (outside the timed region) for later sorted views;
+            # prefix reuse needs the stable order, so unstable sorts are not cached
+            if algorithm.mode != "top_k" and algorithm.stable:
+                self.perm_cache.put(self.full_data.fingerprint, cache_column(key, collation), False, n, sorted_data)
+            # Refine the runtime model (incremental runs depend on the delta, not on N)
+            if algorithm.mode != "incremental":
+                kind = runtime_estimator.column_kind(subset.column(key))
+                self.estimator.record(algorithm.func_name, kind, n, duration)
+            # Sorts of a RecordStore return an index permutation into subset
+            self.after(0, lambda: self.show_results(sorted_data, duration, n, algo, key, subset, note, counts))
 
+    def show_cached_view(self, perm, lookup, n, algo, key, k=None):
+        """Show a sorted view answered from the permutation cache (no algorithm run)."""
+        self.empty_state_frame.pack_forget()
+        self.treeview_frame.pack(fill="both", expand=True)
+        
+        data = perm[:k] if ALGORITHMS[algo].mode == "top_k" else perm
+        self.show_results(data, lookup, n, algo, key, self.full_data)
+        self.lbl_main_status.config(text="Sorted View (Cached)")
+        self.result_status.config(
+            text=f"Sorted view from cache • lookup {lookup:.4f}s, no sort performed • Sort Key: {key}")
+        
+    def start_external_sort(self):
+        """Sort a CSV file on disk (possibly larger than RAM) by the selected column."""
+        in_path = filedialog.askopenfilename(
+            title="Select CSV file to sort", initialdir=os.path.dirname(DATA_FILE_PATH),
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not in_path:
+            return
+        
+        key = self.key_var.get()
+        base_name = os.path.splitext(os.path.basename(in_path))[0]
+        out_path = filedialog.asksaveasfilename(
+            title="Save sorted CSV as", initialdir=os.path.dirname(in_path),
+            initialfile=f"{base_name}_sorted_by_{key}.csv", defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")])
+        if not out_path:
+            return
+        if os.path.abspath(out_path) == os.path.abspath(in_path):
+            messagebox.showerror("Invalid Output", "Choose a different file than the input CSV.")
+            return
+        
+        # Reset state
+        self.cancel_event.clear()
+        self.pause_calibration()
+        self.progress_channel.start()
+        self.set_button_state(self.btn_run, "disabled", "SORTING...")
+        self.set_button_state(self.btn_stop, "normal")
+        self.set_button_state(self.btn_external, "disabled")
+        self.lbl_main_status.config(text="External Sort...")
+        
+        self.empty_state_frame.pack_forget()
+        self.treeview_frame.pack(fill="both", expand=True)
+        for item in self.result_tree.get_children():
+            self.result_tree.delete(item)
+        self.update_metric_card(self.metric_time, "...")
+        self.update_metric_card(self.metric_complexity, "O(n log n)")
+        self.update_metric_card(self.metric_records, "--")
+        self.update_op_cards()
+        self.result_status.config(text=f"Sorting {os.path.basename(in_path)} by {key} "
+                                       f"({EXTERNAL_SORT_MEMORY_MB} MB chunks, fan-in {EXTERNAL_SORT_FAN_IN})...")
+        
+        self.sort_thread = threading.Thread(target=self.run_external_sort_thread, args=(in_path, out_path, key))
+        self.sort_thread.start()
+        
+    def run_external_sort_thread(self, in_path, out_path, key):
+        try:
+            stats = external_sort.external_sort_csv(
+                in_path, out_path, key,
+                memory_mb=EXTERNAL_SORT_MEMORY_MB,
+                fan_in=EXTERNAL_SORT_FAN_IN,
+                progress_callback=self.progress_channel.report,
+                cancel_event=self.cancel_event
+            )
+            if stats is None:
+                self.after(0, self.on_sort_cancelled)
+                return
+            
+            # Only the first rows of the output are read back for the results table
+            with open(out_path, mode='r', encoding='utf-8', newline='') as f:
+                reader = csv.DictReader(f)
+                top_rows = [row for _, row in zip(range(10), reader)]
+        except Exception as e:
+            self.after(0, lambda: self.show_error(str(e)))
+            return
+        
+        self.after(0, lambda: self.show_external_results(stats, top_rows, out_path, key))
+        
+    def show_external_results(self, stats, top_rows, out_path, key):
+        self.show_results(top_rows, stats["seconds"], stats["rows"], "External Merge Sort", key)
+        self.update_metric_card(self.metric_complexity, "O(n log n)")
+        self.result_status.config(
+            text=f"Showing top 10 of {stats['rows']:,} sorted records • {stats['runs']} runs, "
+                 f"{stats['merge_passes']} merge pass(es) • Saved to {os.path.basename(out_path)}")
+        
     def on_sort_cancelled(self):
         self.set_button_state(self.btn_run, "normal", "RUN BENCHMARK")
         self.set_button_state(self.btn_stop, "disabled")
+        self.set_button_state(self.btn_external, "normal")
         self.lbl_main_status.config(text="Cancelled")
         self.update_status("Sort operation was cancelled.")
-        self.progress['value'] = 0
+        self.progress_channel.stop(0)
+        self.resume_calibration()
         
         # Reset metric cards
         self.update_metric_card(self.metric_time, "--")
         self.update_metric_card(self.metric_complexity, "--")
         self.update_metric_card(self.metric_records, "--")
+        self.update_op_cards()
         
         # Show empty state placeholder again
         self.treeview_frame.pack_forget()
@@ -713,14 +950,18 @@ class ExamApp(tk.Tk):
         self.result_status.config(text="⚠ Operation cancelled by user.")
 
     def show_error(self, error_msg):
+        self.progress_channel.stop()
         self.set_button_state(self.btn_run, "normal", "RUN BENCHMARK")
         self.set_button_state(self.btn_stop, "disabled")
+        self.set_button_state(self.btn_external, "normal")
         self.lbl_main_status.config(text="Error")
+        self.resume_calibration()
         
         # Reset metric cards
         self.update_metric_card(self.metric_time, "--")
         self.update_metric_card(self.metric_complexity, "--")
         self.update_metric_card(self.metric_records, "--")
+        self.update_op_cards()
         
         # Show empty state placeholder again
         self.treeview_frame.pack_forget()
@@ -729,23 +970,32 @@ class ExamApp(tk.Tk):
         # Show error in status
         self.result_status.config(text=f"❌ Error: {error_msg}")
 
-    def show_results(self, data, duration, n, algo, key):
+    def show_results(self, data, duration, n, algo, key, source=None, note="", counts=None):
+        """Show the outcome of a run. If source is given, data is a permutation of its row indices."""
         self.set_button_state(self.btn_run, "normal", "RUN BENCHMARK")
         self.set_button_state(self.btn_stop, "disabled")
+        self.set_button_state(self.btn_external, "normal")
         self.lbl_main_status.config(text="Benchmark Complete")
-        self.progress['value'] = 100
+        self.progress_channel.stop(100)
+        self.resume_calibration()
         
         # Update metric cards
         self.update_metric_card(self.metric_time, f"{duration:.4f}")
-        self.update_metric_card(self.metric_complexity, self.complexity_map.get(algo, "--"))
+        # None for the external CSV sort, which is not a registered benchmark algorithm
+        algorithm = ALGORITHMS.get(algo)
+        top_k = algorithm is not None and algorithm.mode == "top_k"
+        self.update_metric_card(self.metric_complexity, algorithm.complexity if algorithm else "--")
         self.update_metric_card(self.metric_records, f"{n:,}")
+        self.update_op_cards(counts)
         
         # Clear existing Treeview data
         for item in self.result_tree.get_children():
             self.result_tree.delete(item)
         
-        # Insert top 10 records with zebra striping
-        for i, row in enumerate(data[:10]):
+        # Insert top 10 records (or the whole top-k preview) with zebra striping
+        display_count = min(len(data), TOP_K_MAX_DISPLAY) if top_k else 10
+        top_rows = data[:display_count] if source is None else source.records(data[:display_count])
+        for i, row in enumerate(top_rows):
             tag = "even" if i % 2 == 0 else "odd"
             self.result_tree.insert("", "end", values=(
                 row.get('ID', 'N/A'),
@@ -759,9 +1009,12 @@ class ExamApp(tk.Tk):
         
         # Update status label
         extra_msg = ""
-        if len(data) > 10:
+        if top_k:
+            extra_msg = f"Showing top {display_count:,} of {n:,} records (partial sort, k = {len(data):,}) • "
+        elif len(data) > 10:
             extra_msg = f"Showing top 10 of {len(data):,} sorted records • "
-        self.result_status.config(text=f"{extra_msg}Algorithm: {algo} • Sort Key: {key}")
+        properties = f" ({algorithm.describe()})" if algorithm else ""
+        self.result_status.config(text=f"{note}{extra_msg}Algorithm: {algo}{properties} • Sort Key: {key}")
 
 if __name__ == "__main__":
     app = ExamApp()
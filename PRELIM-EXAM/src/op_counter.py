@@ -0,0 +1,313 @@
+"""
+Operation Counter Module for DAA Prelim Exam
+=============================================
+Counts comparisons, swaps, shifts, element moves and temporary allocations
+of a sort run.
+
+The regular functions in sorting_algorithms contain no counting code, so the
+benchmarked kernels pay nothing for this feature. Instead, this module builds
+an instrumented copy of the whole sorting_algorithms module once, on first
+use. It parses the module source, inserts counter updates with an
+ast.NodeTransformer, and compiles the result into a separate namespace.
+Every algorithm therefore has two variants: the plain one that is timed and
+the instrumented one that is counted. Both come from the same source and can
+never drift apart.
+
+What is counted:
+    comparisons  - key comparisons (<, <=, >, >=, ==, !=). Keys are wrapped
+                   in CountingKey for the comparison sorts. The radix sorts
+                   look at digits/characters instead of comparing keys and
+                   report 0.
+    swaps        - two elements exchanging places: `a[i], a[j] = a[j], a[i]`
+                   (heap, intro, 3-way quick sort), and each step of bubble
+                   sort's carried exchange, where one element is written
+                   back past the element being carried
+    shifts       - an element moved along its own buffer to open a hole
+                   for the element being inserted or sifted (insertion,
+                   shell and binary insertion sort, heap sift-down). A
+                   slice shift counts every element it moves
+    moves        - every element write into a buffer: indexed and slice
+                   stores, append/extend, and the elements copied into a
+                   new list by a comprehension or list literal. A swap is
+                   two moves; a shift or a carried exchange is one
+    allocations  - temporary lists created: comprehensions, literals,
+                   `[x] * n` buffers, slices, list()/sorted() calls
+
+Tuple swaps are recognised from their shape. Carried exchanges, shifts and
+writes to bookkeeping lists (the MSD work stack, Timsort's run stack and the
+quicksort range stacks) look like any other store, so the kernels mark them
+with a trailing `# op: swap`, `# op: shift` or `# op: bookkeeping` comment.
+Bookkeeping writes are not counted at all. Merge writes and final
+placements of a carried element are plain moves, so merge sort's shifts come
+only from the insertion sort of its initial short runs.
+Bubble sort's swaps and insertion sort's shifts both equal the number of
+inversions in the input (190 for 20 reversed keys, 0 for sorted keys).
+The built-in sorted() baseline sorts in C, so only its key comparisons are
+visible.
+
+An instrumented run is 3-10x slower than a plain one. It is always a
+separate, untimed run.
+"""
+
+import ast
+import inspect
+import io
+import threading
+import tokenize
+
+import record_store
+import sorting_algorithms
+
+# Kinds accepted in the `# op: <kind>` store markers
+OP_MARKERS = {"swap", "shift", "bookkeeping"}
+
+# Algorithms that never compare keys (their keys must stay plain int/str)
+NON_COMPARISON_SORTS = {"radix_sort", "msd_radix_sort"}
+
+COUNTER_NAMES = ("comparisons", "swaps", "shifts", "moves", "allocations")
+
+class OpCounts:
+    """Counters of one instrumented run, plus helpers the rewritten code calls."""
+    __slots__ = COUNTER_NAMES
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        for name in COUNTER_NAMES:
+            setattr(self, name, 0)
+    
+    def as_dict(self):
+        return {name: getattr(self, name) for name in COUNTER_NAMES}
+    
+    # --- Called from the instrumented code ---
+    
+    def new(self, buffer):
+        """A new empty or preallocated buffer (no elements copied)."""
+        self.allocations += 1
+        return buffer
+    
+    def fill(self, buffer):
+        """A new buffer filled with copied elements."""
+        self.allocations += 1
+        self.moves += len(buffer)
+        return buffer
+    
+    def extend(self, target, items):
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.moves += len(items)
+        target.extend(items)
+
+class CountingKey:
+    """Sort key wrapper that counts every comparison made against it."""
+    __slots__ = ('value', 'counts')
+    
+    def __init__(self, value, counts):
+        self.value = value
+        self.counts = counts
+    
+    def __lt__(self, other):
+        self.counts.comparisons += 1
+        return self.value < getattr(other, 'value', other)
+    
+    def __le__(self, other):
+        self.counts.comparisons += 1
+        return self.value <= getattr(other, 'value', other)
+    
+    def __gt__(self, other):
+        self.counts.comparisons += 1
+        return self.value > getattr(other, 'value', other)
+    
+    def __ge__(self, other):
+        self.counts.comparisons += 1
+        return self.value >= getattr(other, 'value', other)
+    
+    def __eq__(self, other):
+        self.counts.comparisons += 1
+        return self.value == getattr(other, 'value', other)
+    
+    def __ne__(self, other):
+        self.counts.comparisons += 1
+        return self.value != getattr(other, 'value', other)
+    
+    def __hash__(self):
+        return hash(self.value)
+    
+    def __repr__(self):
+        return repr(self.value)
+
+# --- Source rewriting ---
+
+def _counter_stmt(name, amount):
+    """Builds `_ops.<name> += <amount>`."""
+    return ast.AugAssign(
+        target=ast.Attribute(value=ast.Name(id="_ops", ctx=ast.Load()), attr=name, ctx=ast.Store()),
+        op=ast.Add(), value=amount)
+
+def _ops_call(method, *args):
+    return ast.Call(func=ast.Attribute(value=ast.Name(id="_ops", ctx=ast.Load()), attr=method, ctx=ast.Load()),
+                    args=list(args), keywords=[])
+
+def _op_markers(source):
+    """
+    Maps line numbers to the `# op: <kind>` marker written on them.
+    
+    Raises:
+        ValueError: On a marker with an unknown kind.
+    """
+    markers = {}
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.COMMENT:
+            text = token.string.lstrip("#").strip()
+            if text.startswith("op:"):
+                kind = text[3:].strip()
+                if kind not in OP_MARKERS:
+                    raise ValueError(f"Unknown operation marker '{kind}' on line {token.start[0]}")
+                markers[token.start[0]] = kind
+    return markers
+
+def _as_load(node):
+    """Copy of a Store-context expression usable as a Load expression."""
+    node = ast.parse(ast.unparse(node), mode="eval").body
+    return node
+
+class _Instrumenter(ast.NodeTransformer):
+    """Inserts OpCounts updates into the sorting_algorithms source."""
+    
+    def __init__(self, markers):
+        self.markers = markers
+        self.unused = set(markers)
+    
+    def marker(self, node):
+        """Kind of the `# op:` marker on the statement's lines, or None."""
+        for line in range(node.lineno, node.end_lineno + 1):
+            if line in self.markers:
+                self.unused.discard(line)
+                return self.markers[line]
+        return None
+    
+    # --- Allocations (expressions) ---
+    
+    def visit_ListComp(self, node):
+        self.generic_visit(node)
+        return _ops_call("fill", node)
+    
+    def visit_List(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.ctx, ast.Load):
+            return node
+        return _ops_call("fill", node)
+    
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        # [None] * n style preallocation (the literal itself is already wrapped)
+        if isinstance(node.op, ast.Mult) and isinstance(node.left, ast.Call) \
+                and getattr(node.left.func, "attr", None) == "fill":
+            node.left = node.left.args[0]
+            return _ops_call("new", node)
+        return node
+    
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load) and isinstance(node.slice, ast.Slice):
+            return _ops_call("new", node)
+        return node
+    
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if isinstance(node.func, ast.Name) and node.func.id in ("list", "sorted"):
+            return _ops_call("new", node)
+        return node
+    
+    # --- Moves, shifts and swaps (statements) ---
+    
+    def visit_Assign(self, node):
+        kind = self.marker(node)
+        self.generic_visit(node)
+        if kind == "bookkeeping":
+            return node
+        extra = []
+        for target in node.targets:
+            if isinstance(target, ast.Subscript):
+                for name in ("moves", kind + "s") if kind else ("moves",):
+                    if isinstance(target.slice, ast.Slice):
+                        # Slice store: count the slots written
+                        amount = ast.Call(func=ast.Name(id="len", ctx=ast.Load()), args=[_as_load(target)], keywords=[])
+                    else:
+                        amount = ast.Constant(1)
+                    extra.append(_counter_stmt(name, amount))
+            elif isinstance(target, ast.Tuple) and all(isinstance(e, ast.Subscript) for e in target.elts):
+                extra.append(_counter_stmt("moves", ast.Constant(len(target.elts))))
+                extra.append(_counter_stmt("swaps", ast.Constant(1)))
+        return [node] + extra
+    
+    def visit_Expr(self, node):
+        kind = self.marker(node)
+        self.generic_visit(node)
+        call = node.value
+        if kind != "bookkeeping" and isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute):
+            if call.func.attr == "append":
+                return [node, _counter_stmt("moves", ast.Constant(1))]
+            if call.func.attr == "extend" and len(call.args) == 1:
+                return ast.Expr(_ops_call("extend", call.func.value, call.args[0]))
+        return node
+
+_instrumented = None
+_ops = OpCounts()
+_lock = threading.Lock()
+
+def instrumented_module():
+    """Returns the namespace of the instrumented sorting_algorithms copy (built once)."""
+    global _instrumented
+    if _instrumented is None:
+        source = inspect.getsource(sorting_algorithms)
+        instrumenter = _Instrumenter(_op_markers(source))
+        tree = instrumenter.visit(ast.parse(source))
+        if instrumenter.unused:
+            raise ValueError(f"Operation markers on lines {sorted(instrumenter.unused)} are not on a store")
+        ast.fix_missing_locations(tree)
+        namespace = {"__name__": "sorting_algorithms_instrumented", "_ops": _ops}
+        exec(compile(tree, f"{sorting_algorithms.__file__} [instrumented]", "exec"), namespace)
+        _instrumented = namespace
+    return _instrumented
+
+def count_operations(func_name, data, key, *args, descending=False, progress_callback=None):
+    """
+    Runs the instrumented variant of sorting_algorithms.<func_name>.
+    
+    Args:
+        func_name (str): Name of a function in sorting_algorithms.
+        data (RecordStore): Dataset to sort.
+        key (str): Column to sort by.
+        *args: Extra positional arguments (k, or the prefix permutation).
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+    
+    Returns:
+        dict: Counter name -> count.
+    
+    Raises:
+        KeyError: If func_name is not in sorting_algorithms.
+        ValueError: As the plain algorithm (e.g. unsupported key type).
+    """
+    module = instrumented_module()
+    func = module[func_name]
+    with _lock:
+        _ops.reset()
+        column = data.sort_keys(key, func_name in sorting_algorithms.TEXT_KEY_SORTS)
+        if func_name not in NON_COMPARISON_SORTS:
+            # Comparison sorts see wrapped keys, so every comparison is counted
+            column = [CountingKey(value, _ops) for value in column]
+        store = record_store.RecordStore([key], {key: column}, len(data))
+        func(store, key, *args, descending=descending, progress_callback=progress_callback)
+        return _ops.as_dict()
+
+def format_count(count):
+    """Compact count for the metric cards (999, 12.3K, 4.50M, 1.25B)."""
+    for limit, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if count >= limit:
+            value = count / limit
+            decimals = 2 if value < 10 else 1 if value < 100 else 0
+            return f"{value:.{decimals}f}{suffix}"
+    return str(count)
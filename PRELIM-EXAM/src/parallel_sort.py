@@ -0,0 +1,368 @@
+"""
+Parallel Merge Sort Module for DAA Prelim Exam
+===============================================
+Multi-process merge sort for large benchmark runs.
+
+The sort keys are packed once into shared memory blocks
+(multiprocessing.shared_memory, see sort_worker.pack_column), so the
+workers never receive pickled records. The sort runs in two phases on a
+ProcessPoolExecutor, and both the sorting and the merging happen in the
+workers (parallel sorting by regular sampling):
+
+    1. Sort: each worker sorts one contiguous chunk with the same bottom-up
+       engine as sorting_algorithms.merge_sort and writes the chunk's sorted
+       index permutation back into shared memory.
+    2. Merge: the parent picks p - 1 splitters from a regular sample of the
+       sorted chunks. Worker j binary-searches the splitters in every chunk,
+       merges the slices that fall between splitters j - 1 and j with
+       sorting_algorithms.merge_runs, and writes them to its own disjoint
+       range of the output permutation.
+
+The parent only packs the keys, sorts the p * (p - 1) samples and reads the
+finished permutation back; it never touches the n keys one by one. Splitters
+are (key, index) pairs, so equal keys are ordered by original position in
+every phase and the result is stable.
+
+Progress and cancellation also go through shared memory: every worker
+writes its own progress slot, and the parent thread polls those slots and
+forwards a combined percentage to progress_callback. Setting cancel_event
+raises a shared flag that the workers check.
+
+Complexity:
+    Time:  O((n/p) log(n/p)) per worker to sort + O((n/p) log p) per worker
+           to merge (each merge range holds under 2n/p records)
+    Space: O(n) - shared key, chunk and output permutation buffers
+    Stable: Yes - ties are broken by original index in both phases
+"""
+
+import multiprocessing
+import operator
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from multiprocessing import shared_memory
+
+import sort_worker
+import sorting_algorithms
+
+# Below this many records the process start-up and merge overhead outweighs
+# the gain, so the regular single-process merge sort is used instead
+PARALLEL_MIN_SIZE = 20000
+
+# How often (seconds) the parent polls worker progress and the cancel event
+POLL_INTERVAL = 0.05
+
+# Fraction of the progress bar covered by the sort phase (the rest is the merge phase)
+SORT_PHASE_SHARE = 90.0
+
+# Worker pool reused across runs so process start-up is only paid once
+_pool = None
+_pool_workers = 0
+
+class _SharedFlag:
+    """Read-only stand-in for threading.Event backed by a shared-memory slot."""
+    
+    def __init__(self, ctrl):
+        self.ctrl = ctrl
+    
+    def is_set(self):
+        return self.ctrl[0] != 0
+
+class _SharedKeys:
+    """Read access to the packed key column from inside a worker."""
+    
+    def __init__(self, key_kind, keys_name, offsets_name):
+        self.keys_shm = shared_memory.SharedMemory(name=keys_name)
+        self.offsets_shm = shared_memory.SharedMemory(name=offsets_name) if offsets_name else None
+        if key_kind == 'int':
+            self.values = self.keys_shm.buf.cast('q')
+            self.offsets = None
+        else:
+            self.values = self.keys_shm.buf
+            self.offsets = self.offsets_shm.buf.cast('q')
+    
+    def __getitem__(self, i):
+        if self.offsets is None:
+            return self.values[i]
+        return str(self.values[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+    
+    def range(self, lo, hi):
+        """Keys of records [lo, hi) as a list."""
+        if self.offsets is None:
+            return self.values[lo:hi].tolist()
+        offsets = self.offsets[lo:hi + 1].tolist()
+        base = offsets[0]
+        blob = bytes(self.values[base:offsets[-1]])
+        return [blob[offsets[i] - base:offsets[i + 1] - base].decode('utf-8')
+                for i in range(hi - lo)]
+    
+    def close(self):
+        # Views must be released before the blocks can be closed
+        if self.offsets is not None:
+            self.offsets.release()
+            self.offsets_shm.close()
+        else:
+            self.values.release()
+        self.keys_shm.close()
+
+def _get_pool(workers):
+    """Returns the shared worker pool, (re)creating it if the size changed."""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        # "spawn" keeps the workers independent of the Tk main thread state
+        _pool = ProcessPoolExecutor(max_workers=workers,
+                                    mp_context=multiprocessing.get_context("spawn"))
+        _pool_workers = workers
+    return _pool
+
+def _sort_chunk(spec):
+    """
+    Worker entry point of the sort phase: sorts records [lo, hi) and stores
+    their permutation in perm[lo:hi].
+    
+    Args:
+        spec (tuple): (key_kind, keys_name, offsets_name, perm_name, ctrl_name,
+                       lo, hi, slot, descending)
+    
+    Returns:
+        bool: True if the chunk was sorted, False if cancelled.
+    """
+    (key_kind, keys_name, offsets_name, perm_name, ctrl_name,
+     lo, hi, slot, descending) = spec
+    
+    keys = _SharedKeys(key_kind, keys_name, offsets_name)
+    perm_shm = shared_memory.SharedMemory(name=perm_name)
+    ctrl_shm = shared_memory.SharedMemory(name=ctrl_name)
+    ctrl = None
+    try:
+        ctrl = ctrl_shm.buf.cast('q')
+        pairs = list(zip(keys.range(lo, hi), range(lo, hi)))
+        
+        def report(p):
+            ctrl[slot] = int(p * 100)
+        
+        result = sorting_algorithms.merge_sort_pairs(pairs, descending, report, _SharedFlag(ctrl))
+        if result is None:
+            return False
+        
+        perm_view = perm_shm.buf.cast('q')
+        perm_view[lo:hi] = array('q', [i for _, i in result])
+        perm_view.release()
+        return True
+    finally:
+        if ctrl is not None:
+            ctrl.release()
+        keys.close()
+        perm_shm.close()
+        ctrl_shm.close()
+
+def _rank(keys, perm, lo, hi, splitter, descending):
+    """Number of records in the sorted chunk perm[lo:hi] that sort before splitter."""
+    split_key, split_index = splitter
+    start = lo
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        i = perm[mid]
+        key = keys[i]
+        if key == split_key:
+            before = i < split_index
+        else:
+            before = key > split_key if descending else key < split_key
+        if before:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo - start
+
+def _merge_slice(spec):
+    """
+    Worker entry point of the merge phase: merges the records between two
+    splitters from every sorted chunk into out[offset:offset + count], where
+    offset is the number of records before the lower splitter.
+    
+    Args:
+        spec (tuple): (key_kind, keys_name, offsets_name, perm_name, out_name,
+                       ctrl_name, bounds, low, high, slot, descending);
+                       low/high are (key, index) splitters, None at the ends.
+    
+    Returns:
+        bool: True if the slice was merged, False if cancelled.
+    """
+    (key_kind, keys_name, offsets_name, perm_name, out_name, ctrl_name,
+     bounds, low, high, slot, descending) = spec
+    
+    keys = _SharedKeys(key_kind, keys_name, offsets_name)
+    perm_shm = shared_memory.SharedMemory(name=perm_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    ctrl_shm = shared_memory.SharedMemory(name=ctrl_name)
+    ctrl = perm = None
+    try:
+        ctrl = ctrl_shm.buf.cast('q')
+        perm = perm_shm.buf.cast('q')
+        
+        # Collect this range's slice of every chunk (in chunk order, so ties
+        # between chunks still resolve by original position)
+        offset = 0
+        pairs = []
+        runs = [0]
+        for c in range(len(bounds) - 1):
+            lo, hi = bounds[c], bounds[c + 1]
+            start = lo + (_rank(keys, perm, lo, hi, low, descending) if low else 0)
+            stop = lo + _rank(keys, perm, lo, hi, high, descending) if high else hi
+            offset += start - lo
+            indices = perm[start:stop].tolist()
+            pairs.extend(zip([keys[i] for i in indices], indices))
+            runs.append(len(pairs))
+        
+        def report(p):
+            ctrl[slot] = int(p * 100)
+        
+        result = sorting_algorithms.merge_runs(pairs, runs, descending, report, _SharedFlag(ctrl))
+        if result is None:
+            return False
+        
+        out_view = out_shm.buf.cast('q')
+        out_view[offset:offset + len(result)] = array('q', [i for _, i in result])
+        out_view.release()
+        ctrl[slot] = 10000
+        return True
+    finally:
+        if ctrl is not None:
+            ctrl.release()
+        if perm is not None:
+            perm.release()
+        keys.close()
+        perm_shm.close()
+        out_shm.close()
+        ctrl_shm.close()
+
+def _choose_splitters(column, perm, bounds, descending):
+    """
+    Picks len(bounds) - 2 splitters from a regular sample of the sorted chunks.
+    
+    Every chunk contributes p - 1 evenly spaced records, so each merge range
+    ends up with fewer than 2n/p records whatever the key distribution.
+    
+    Returns:
+        list: (key, index) splitters in sort order.
+    """
+    chunk_count = len(bounds) - 1
+    samples = []
+    for c in range(chunk_count):
+        lo, hi = bounds[c], bounds[c + 1]
+        for s in range(1, chunk_count):
+            i = perm[lo + (hi - lo) * s // chunk_count]
+            samples.append((column[i], i))
+    
+    # Same total order as the sort: key, then original index
+    if descending:
+        samples.sort(key=operator.itemgetter(1))
+        samples.sort(key=operator.itemgetter(0), reverse=True)
+    else:
+        samples.sort()
+    return [samples[len(samples) * t // chunk_count] for t in range(1, chunk_count)]
+
+def _run_phase(pool, func, specs, ctrl, slots, cancel_event, progress_callback, base, share):
+    """
+    Runs one phase on the pool, forwarding progress and cancellation until
+    every spec has finished.
+    
+    Returns:
+        bool: False if the phase was cancelled.
+    
+    Raises:
+        Exception: Whatever a worker raised.
+    """
+    futures = [pool.submit(func, spec) for spec in specs]
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_EXCEPTION)
+        if cancel_event is not None and cancel_event.is_set():
+            ctrl[0] = 1
+        if progress_callback:
+            progress_callback(base + sum(ctrl[s] for s in slots) / (len(slots) * 10000) * share)
+    
+    # Re-raise worker errors; a False result means the worker was cancelled
+    return all([f.result() for f in futures]) and not (cancel_event is not None and cancel_event.is_set())
+
+def parallel_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None, workers=None):
+    """
+    Sorts a record store using a multi-process Merge Sort.
+    
+    Args:
+        data (RecordStore | RecordView | list): Records to sort (a list of
+                                                dictionaries also works).
+        key (str): Column to sort by (int or str keys).
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+        workers (int): Number of worker processes (default: os.cpu_count()).
+    
+    Returns:
+        list: The index permutation for a RecordStore/RecordView (the sorted
+              records for a list of dictionaries), or None if cancelled.
+    
+    Raises:
+        ValueError: If the key column mixes types or has unsupported values.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(data)
+    if n < PARALLEL_MIN_SIZE or workers < 2:
+        return sorting_algorithms.merge_sort(data, key, descending, progress_callback, cancel_event)
+    
+    sort_keys = getattr(data, 'sort_keys', None)
+    column = sort_keys(key) if sort_keys is not None else [row.get(key) for row in data]
+    key_kind, keys_shm, offsets_shm = sort_worker.pack_column(column)
+    
+    chunk_count = workers
+    bounds = [n * c // chunk_count for c in range(chunk_count + 1)]
+    perm_shm = out_shm = ctrl_shm = ctrl = None
+    try:
+        perm_shm = sort_worker.create_block(n * 8)
+        out_shm = sort_worker.create_block(n * 8)
+        # Slot 0 is the cancel flag, then one progress slot per worker and phase
+        ctrl_shm = sort_worker.create_block((1 + 2 * chunk_count) * 8)
+        ctrl = ctrl_shm.buf.cast('q')
+        for s in range(1 + 2 * chunk_count):
+            ctrl[s] = 0
+        
+        shared = (key_kind, keys_shm.name, offsets_shm.name if offsets_shm else None)
+        pool = _get_pool(workers)
+        
+        sort_slots = range(1, 1 + chunk_count)
+        specs = [shared + (perm_shm.name, ctrl_shm.name, bounds[c], bounds[c + 1], sort_slots[c], descending)
+                 for c in range(chunk_count)]
+        if not _run_phase(pool, _sort_chunk, specs, ctrl, sort_slots, cancel_event, progress_callback,
+                          0, SORT_PHASE_SHARE):
+            return None
+        
+        perm_view = perm_shm.buf.cast('q')
+        splitters = [None] + _choose_splitters(column, perm_view, bounds, descending) + [None]
+        perm_view.release()
+        
+        merge_slots = range(1 + chunk_count, 1 + 2 * chunk_count)
+        specs = [shared + (perm_shm.name, out_shm.name, ctrl_shm.name, bounds,
+                           splitters[j], splitters[j + 1], merge_slots[j], descending)
+                 for j in range(chunk_count)]
+        if not _run_phase(pool, _merge_slice, specs, ctrl, merge_slots, cancel_event, progress_callback,
+                          SORT_PHASE_SHARE, 100 - SORT_PHASE_SHARE):
+            return None
+        
+        out_view = out_shm.buf.cast('q')
+        perm = out_view.tolist()
+        out_view.release()
+    finally:
+        if ctrl is not None:
+            ctrl.release()
+        for block in (keys_shm, offsets_shm, perm_shm, out_shm, ctrl_shm):
+            if block is not None:
+                block.close()
+                block.unlink()
+    
+    if progress_callback:
+        progress_callback(100)
+    if hasattr(data, 'column'):
+        return perm
+    return [data[i] for i in perm]
@@ -0,0 +1,82 @@
+"""
+Progress Channel Module for DAA Prelim Exam
+============================================
+Rate-limited progress reporting from a sort thread to the Tk progress bar.
+
+The old approach scheduled one `after(0, ...)` callback per progress call,
+so a long run pushed thousands of events through the Tk queue and the GUI
+thread competed with the sort for the GIL. A ProgressChannel splits the two
+sides instead:
+
+    - Writer (sort thread): `channel.report(p)` stores p into a one-slot
+      array('d'). report is a functools.partial over operator.setitem, so a
+      call runs entirely in C - no Python frame, no lock, no Tk call.
+    - Reader (Tk main loop): a fixed-rate `after` timer reads the slot and
+      updates the progress bar only when the value changed.
+
+A single float store is atomic under the GIL, so no lock is needed; the
+reader at worst sees a value one update old.
+
+Usage:
+    channel = ProgressChannel(root, progressbar)
+    channel.start()                      # main thread, before the run
+    sort(..., progress_callback=channel.report)
+    channel.stop(100)                    # main thread, after the run
+"""
+
+import functools
+import operator
+from array import array
+
+# Progress bar refresh interval (20 fps)
+POLL_INTERVAL_MS = 50
+
+class ProgressChannel:
+    """
+    Shared progress slot written by a worker and polled by the Tk main loop.
+    
+    Args:
+        widget (tk.Misc): Any widget of the app (owns the `after` timer).
+        progressbar (ttk.Progressbar): Bar that displays the value.
+        interval_ms (int): Polling interval in milliseconds.
+    """
+    
+    def __init__(self, widget, progressbar, interval_ms=POLL_INTERVAL_MS):
+        self.widget = widget
+        self.progressbar = progressbar
+        self.interval_ms = interval_ms
+        self.slot = array('d', [0.0])
+        # C-level setter: report(p) == slot[0] = p
+        self.report = functools.partial(operator.setitem, self.slot, 0)
+        self._after_id = None
+        self._shown = None
+    
+    @property
+    def value(self):
+        """Latest reported progress (0-100)."""
+        return self.slot[0]
+    
+    def start(self):
+        """Resets the slot to 0 and starts polling (main thread only)."""
+        self.stop()
+        self.slot[0] = 0.0
+        self._show(0.0)
+        self._after_id = self.widget.after(self.interval_ms, self._poll)
+    
+    def stop(self, final=None):
+        """Stops polling and optionally shows a final value (main thread only)."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if final is not None:
+            self._show(final)
+    
+    def _show(self, value):
+        self.progressbar.configure(value=value)
+        self._shown = value
+    
+    def _poll(self):
+        value = self.slot[0]
+        if value != self._shown:
+            self._show(value)
+        self._after_id = self.widget.after(self.interval_ms, self._poll)
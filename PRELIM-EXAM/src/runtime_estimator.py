@@ -0,0 +1,219 @@
+"""
+Runtime Estimator Module for DAA Prelim Exam
+=============================================
+Predicts sort durations from constants measured on this machine.
+
+Each algorithm follows a cost model t(n) = c · f(n), with f(n) = n², n log n
+or n. The constant c depends on the host, the Python build and the key type
+(comparing ints is cheaper than comparing strings). It is learned per
+(algorithm, key type) instead of being hardcoded:
+
+    - Calibration: short micro-benchmarks on the loaded data (a few hundred
+      records for the O(n²) sorts, a few thousand for the others) give the
+      first samples of c = t / f(n).
+    - Refinement: every completed benchmark run adds another sample, so the
+      estimate tracks the real workload over time.
+
+Samples are kept in log space (errors are multiplicative), so an estimate is
+the geometric mean of c times f(n). The 95% interval is exp(mean ± 1.96·sd).
+With fewer than two samples, the old fixed throughputs serve as a prior with
+a wide (4x) interval.
+
+Constants are saved as JSON per host (<cache dir>/<hostname>.json) and are
+ignored if they were measured under a different Python version.
+"""
+
+import json
+import math
+import os
+import platform
+import socket
+import threading
+import time
+
+import algorithm_registry
+import sorting_algorithms
+
+MODEL_FUNCTIONS = {
+    "n2": lambda n: n * n,
+    "nlogn": lambda n: n * math.log2(n) if n > 1 else 1,
+    "n": lambda n: n,
+}
+
+# Cost model per algorithm function name (declared in the registry)
+ALGORITHM_MODELS = {a.func_name: a.model for a in algorithm_registry.ALGORITHMS.values()}
+
+# Prior constants (seconds per model unit), from the old fixed throughputs:
+# bubble 5,337,000 ops/s on n², insertion 7,726,000 ops/s on n²/2,
+# n log n sorts 1,500,000 ops/s
+PRIOR_CONSTANTS = {
+    "bubble_sort": 1 / 5337000,
+    "insertion_sort": 0.5 / 7726000,
+    "n2": 1 / 5337000,
+    "nlogn": 1 / 1500000,
+    "n": 1 / 1500000,
+}
+PRIOR_SPREAD = 4.0
+
+# Micro-benchmark sizes per model (kept small: calibration takes ~1-2 s in total)
+CALIBRATION_SIZES = {
+    "n2": (300, 600, 1200),
+    "nlogn": (4000, 8000, 16000),
+    "n": (4000, 8000, 16000),
+}
+
+# k used when calibrating the top-k sorts
+CALIBRATION_K = 10
+
+# Samples kept per (algorithm, key type); older ones are dropped
+MAX_SAMPLES = 50
+
+# z-score of the 95% interval
+Z_95 = 1.96
+
+def column_kind(values):
+    """Returns 'int' or 'str' for a key column (by its first value)."""
+    if len(values) == 0:
+        return 'str'
+    return 'int' if type(values[0]) is int else 'str'
+
+class RuntimeEstimator:
+    """
+    Per-host cost model constants with confidence intervals.
+    
+    Args:
+        cache_dir (str): Directory for the per-host JSON file (None = not persisted).
+    """
+    
+    def __init__(self, cache_dir=None):
+        self.path = os.path.join(cache_dir, f"{socket.gethostname()}.json") if cache_dir else None
+        self.samples = {}  # "algorithm/kind" -> [log c, ...]
+        self.lock = threading.Lock()
+        self.load()
+    
+    # --- Persistence ---
+    
+    def load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get("python") != platform.python_version():
+            return  # Constants from another interpreter do not transfer
+        with self.lock:
+            self.samples = {name: list(values)[-MAX_SAMPLES:]
+                            for name, values in saved.get("samples", {}).items()}
+    
+    def save(self):
+        if not self.path:
+            return
+        # Held while writing, so the calibration thread and the GUI never interleave
+        with self.lock:
+            payload = {"host": socket.gethostname(), "python": platform.python_version(),
+                       "samples": self.samples}
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass  # Estimates still work for this session
+    
+    # --- Samples ---
+    
+    def record(self, algorithm, kind, n, seconds, save=True):
+        """Adds one measured run (algorithm function name, key kind, N, seconds)."""
+        model = ALGORITHM_MODELS.get(algorithm)
+        if model is None or n < 2 or seconds <= 0:
+            return
+        entry = f"{algorithm}/{kind}"
+        with self.lock:
+            values = self.samples.setdefault(entry, [])
+            values.append(math.log(seconds / MODEL_FUNCTIONS[model](n)))
+            del values[:-MAX_SAMPLES]
+        if save:
+            self.save()
+    
+    def is_calibrated(self, algorithm, kind):
+        with self.lock:
+            return len(self.samples.get(f"{algorithm}/{kind}", ())) >= 2
+    
+    def calibrate(self, store, algorithms=None, cancel_event=None):
+        """
+        Runs micro-benchmarks for every uncalibrated (algorithm, key kind).
+        
+        One int and one str column of store are used. Intended for a
+        background thread; stops early when cancel_event is set.
+        
+        Returns:
+            int: Number of (algorithm, kind) pairs calibrated.
+        """
+        columns = {}
+        for name in store.column_names:
+            columns.setdefault(column_kind(store.column(name)), name)
+        
+        calibrated = 0
+        for algorithm in algorithms or ALGORITHM_MODELS:
+            entry = algorithm_registry.by_function(algorithm)
+            if entry is None or not entry.isolated or entry.mode == "incremental":
+                continue  # Not a plain single-process (data, key) sort
+            func = getattr(sorting_algorithms, algorithm)
+            args = (CALIBRATION_K,) if entry.mode == "top_k" else ()
+            for kind, key in columns.items():
+                if kind not in entry.key_kinds or self.is_calibrated(algorithm, kind):
+                    continue
+                try:
+                    for n in CALIBRATION_SIZES[ALGORITHM_MODELS[algorithm]]:
+                        if cancel_event is not None and cancel_event.is_set():
+                            return calibrated
+                        subset = store.view(0, n)
+                        start = time.perf_counter()
+                        func(subset, key, *args)
+                        self.record(algorithm, kind, len(subset), time.perf_counter() - start, save=False)
+                    calibrated += 1
+                except ValueError:
+                    continue  # Key type not supported (e.g. radix on names)
+        if calibrated:
+            self.save()
+        return calibrated
+    
+    # --- Estimates ---
+    
+    def estimate(self, algorithm, kind, n):
+        """
+        Predicts the run time of algorithm on n records.
+        
+        Returns:
+            tuple: (seconds, low, high, calibrated) - point estimate, 95%
+                   interval and whether host measurements were used.
+        """
+        model = ALGORITHM_MODELS.get(algorithm, "nlogn")
+        units = MODEL_FUNCTIONS[model](n) if n > 0 else 0
+        with self.lock:
+            logs = list(self.samples.get(f"{algorithm}/{kind}", ()))
+        
+        if len(logs) < 2:
+            c = PRIOR_CONSTANTS.get(algorithm, PRIOR_CONSTANTS[model])
+            if logs:
+                c = math.exp(logs[0])
+            seconds = c * units
+            return seconds, seconds / PRIOR_SPREAD, seconds * PRIOR_SPREAD, bool(logs)
+        
+        mean = sum(logs) / len(logs)
+        sd = math.sqrt(sum((x - mean) ** 2 for x in logs) / (len(logs) - 1))
+        seconds = math.exp(mean) * units
+        return (seconds, math.exp(mean - Z_95 * sd) * units,
+                math.exp(mean + Z_95 * sd) * units, True)
+
+def format_duration(seconds):
+    """Human-readable duration (seconds, minutes or hours)."""
+    if seconds < 60:
+        return f"{seconds:.1f} seconds"
+    elif seconds < 3600:
+        return f"{seconds/60:.1f} minutes"
+    else:
+        return f"{seconds/3600:.1f} hours"
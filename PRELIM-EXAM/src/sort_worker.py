@@ -0,0 +1,311 @@
+"""
+Isolated Sort Worker Module for DAA Prelim Exam
+================================================
+Runs one benchmark sort in a separate worker process.
+
+Running the sort on a thread of the GUI process has two drawbacks. The sort
+shares the heap, the garbage collector and the GIL with Tk. And it can only
+stop at its own cancel checks. A SortWorker keeps one spawned process
+alive across runs and hands it each job through shared memory:
+
+    - keys:   the sort keys, packed as int64 (IDs, name codes) or as UTF-8
+              bytes + offsets (strings for the TEXT_KEY_SORTS)
+    - prefix: optional int64 index permutation (incremental merge sort)
+    - perm:   int64 result permutation written by the worker
+    - ctrl:   float64 slots [progress, sort seconds, result length,
+              operation counts...]
+
+Only a small job tuple and a status reply travel through the pipe. The
+worker times the sort itself with timed_call(), so process start-up and
+data transfer stay out of the measurement. timed_call() is also what the
+headless benchmark uses: garbage is collected before the run and the
+collector is disabled while the clock runs, so both report the same thing.
+It runs the sort with cancel_event=None, so every cancel check reduces to a
+constant-false call.
+STOP terminates the process instantly. A fresh worker is spawned lazily for
+the next run.
+
+With count_ops=True the worker follows the timed run with a second, untimed
+run of the instrumented variant (see op_counter) and returns its operation
+counts. The timed run itself is never instrumented.
+
+The worker rebuilds a one-column RecordStore, so the algorithms run on
+exactly the same key column and code paths as in the GUI process.
+"""
+
+import gc
+import multiprocessing
+import time
+from array import array
+from multiprocessing import shared_memory
+
+import op_counter
+import record_store
+import sorting_algorithms
+
+# How often (seconds) the parent polls progress and the cancel event
+POLL_INTERVAL = 0.05
+
+# Progress, sort duration and result length slots in the ctrl block,
+# followed by one slot per operation counter
+CTRL_PROGRESS, CTRL_SECONDS, CTRL_RESULT_LEN, CTRL_COUNTS = 0, 1, 2, 3
+CTRL_SLOTS = CTRL_COUNTS + len(op_counter.COUNTER_NAMES)
+
+def timed_call(func, *args, gc_enabled=False, **kwargs):
+    """
+    Runs func(*args, **kwargs) under the benchmark timing policy: garbage is
+    collected first and, unless gc_enabled, the collector stays disabled
+    while the clock runs (sorts allocate many tracked tuples, so collections
+    would otherwise land at random points inside the measurement).
+    
+    Returns:
+        tuple: (result, elapsed nanoseconds from perf_counter_ns)
+    """
+    gc.collect()
+    if not gc_enabled:
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+    return result, elapsed
+
+def create_block(size):
+    """Allocates a shared memory block (never zero-sized)."""
+    return shared_memory.SharedMemory(create=True, size=max(size, 8))
+
+def pack_column(values):
+    """
+    Packs a key column into shared memory (also used by parallel_sort).
+    
+    Returns:
+        tuple: (kind, keys block, offsets block or None)
+    
+    Raises:
+        ValueError: If the column mixes types or holds unsupported values.
+    """
+    if isinstance(values, (array, memoryview)) or all(type(v) is int for v in values):
+        try:
+            # int64 columns go as they are; uint32 name codes are widened
+            is_int64 = getattr(values, 'typecode', getattr(values, 'format', None)) == 'q'
+            packed = values if is_int64 else array('q', values)
+        except OverflowError:
+            raise ValueError("Integer keys must fit in 64 bits")
+        data = packed.tobytes()
+        keys = create_block(len(data))
+        keys.buf[:len(data)] = data
+        return 'int', keys, None
+    if all(type(v) is str for v in values):
+        encoded = [v.encode('utf-8') for v in values]
+        offsets = array('q', [0])
+        total = 0
+        for b in encoded:
+            total += len(b)
+            offsets.append(total)
+        keys = create_block(total)
+        keys.buf[:total] = b''.join(encoded)
+        offsets_block = create_block(len(offsets) * 8)
+        offsets_block.buf[:len(offsets) * 8] = offsets.tobytes()
+        return 'str', keys, offsets_block
+    raise ValueError("Sort keys must be all integers or all strings")
+
+def _unpack_column(kind, keys_shm, offsets_shm, n):
+    """Rebuilds the key column list from its shared memory blocks."""
+    if kind == 'int':
+        view = keys_shm.buf[:n * 8].cast('q')
+        column = view.tolist()
+        view.release()
+        return column
+    offsets_view = offsets_shm.buf.cast('q')
+    offsets = offsets_view[:n + 1].tolist()
+    offsets_view.release()
+    blob = bytes(keys_shm.buf[:offsets[-1]])
+    return [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(n)]
+
+def _run_job(job):
+    """Executes one job inside the worker process (see SortWorker.run)."""
+    (func_name, key, kind, keys_name, offsets_name, n, prefix_name, prefix_len,
+     perm_name, ctrl_name, descending, extra_args, count_ops) = job
+    
+    blocks = [shared_memory.SharedMemory(name=name)
+              for name in (keys_name, offsets_name, prefix_name, perm_name, ctrl_name)
+              if name]
+    by_name = {block.name: block for block in blocks}
+    ctrl = None
+    try:
+        ctrl = by_name[ctrl_name].buf.cast('d')
+        column = _unpack_column(kind, by_name[keys_name], by_name.get(offsets_name), n)
+        store = record_store.RecordStore([key], {key: column}, n)
+        
+        args = list(extra_args)
+        if prefix_name:
+            prefix_view = by_name[prefix_name].buf[:prefix_len * 8].cast('q')
+            args.insert(0, prefix_view.tolist())
+            prefix_view.release()
+        
+        # With counting, the timed run fills the bar to 50% and the counted run the rest
+        scale = 0.5 if count_ops else 1.0
+        
+        def report(p):
+            ctrl[CTRL_PROGRESS] = p * scale
+        
+        func = getattr(sorting_algorithms, func_name)
+        result, elapsed = timed_call(func, store, key, *args, descending=descending, progress_callback=report)
+        ctrl[CTRL_SECONDS] = elapsed / 1e9
+        
+        perm_view = by_name[perm_name].buf[:len(result) * 8].cast('q')
+        perm_view[:] = array('q', result)
+        perm_view.release()
+        ctrl[CTRL_RESULT_LEN] = len(result)
+        
+        if count_ops:
+            def report_counted(p):
+                ctrl[CTRL_PROGRESS] = 50 + p * 0.5
+            
+            counts = op_counter.count_operations(func_name, store, key, *args, descending=descending,
+                                                 progress_callback=report_counted)
+            for i, name in enumerate(op_counter.COUNTER_NAMES):
+                ctrl[CTRL_COUNTS + i] = counts[name]
+    finally:
+        if ctrl is not None:
+            ctrl.release()
+        for block in blocks:
+            block.close()
+
+def _worker_main(conn):
+    """Worker process loop: one job in, one status reply out."""
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        try:
+            _run_job(job)
+            conn.send(("ok", None))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+class SortWorker:
+    """
+    A reusable worker process that runs sorting_algorithms functions.
+    
+    Not thread-safe: use it from one sort thread at a time.
+    """
+    
+    def __init__(self):
+        self.process = None
+        self.conn = None
+    
+    def _ensure_process(self):
+        if self.process is None or not self.process.is_alive():
+            # "spawn" keeps the worker independent of the Tk main thread state
+            ctx = multiprocessing.get_context("spawn")
+            self.conn, child_conn = ctx.Pipe()
+            self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+            self.process.start()
+            child_conn.close()
+    
+    def terminate(self):
+        """Kills the worker process immediately (a new one starts on the next run)."""
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.conn.close()
+        self.process = None
+        self.conn = None
+    
+    def shutdown(self):
+        """Asks the worker process to exit after its current job."""
+        if self.process is not None and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(timeout=1)
+        self.terminate()
+    
+    def run(self, func_name, data, key, *extra_args, descending=False, prefix=None,
+            count_ops=False, progress_callback=None, cancel_event=None):
+        """
+        Runs sorting_algorithms.<func_name>(data, key, *extra_args) in the worker.
+        
+        Args:
+            func_name (str): Name of a function in sorting_algorithms.
+            data (RecordStore): Dataset (only the key column is sent).
+            key (str): Column to sort by.
+            *extra_args: Additional positional arguments (e.g. k for the top-k sorts).
+            descending (bool): Sort in descending order if True.
+            prefix (list): Sorted prefix permutation (for merge_sort_extend).
+            count_ops (bool): Also count operations with an untimed instrumented run.
+            progress_callback (callable): Function to call with progress percentage (0-100).
+            cancel_event (threading.Event): Setting it terminates the worker.
+        
+        Returns:
+            tuple: (index permutation, sort seconds, operation counts dict or
+                   None), or None if cancelled.
+        
+        Raises:
+            ValueError: For unsupported keys, or any error raised by the sort.
+        """
+        n = len(data)
+        # Only the sort keys travel: integer codes for encoded name columns
+        text = func_name in sorting_algorithms.TEXT_KEY_SORTS
+        kind, keys_shm, offsets_shm = pack_column(data.sort_keys(key, text))
+        prefix_shm = None
+        if prefix is not None:
+            prefix = prefix if isinstance(prefix, array) else array('q', prefix)
+            prefix_shm = create_block(len(prefix) * 8)
+            prefix_shm.buf[:len(prefix) * 8] = prefix.tobytes()
+        perm_shm = create_block(n * 8)
+        ctrl_shm = create_block(CTRL_SLOTS * 8)
+        blocks = [keys_shm, offsets_shm, prefix_shm, perm_shm, ctrl_shm]
+        ctrl = ctrl_shm.buf.cast('d')
+        try:
+            for i in range(CTRL_SLOTS):
+                ctrl[i] = 0.0
+            
+            self._ensure_process()
+            self.conn.send((func_name, key, kind, keys_shm.name,
+                            offsets_shm.name if offsets_shm else None, n,
+                            prefix_shm.name if prefix_shm else None,
+                            len(prefix) if prefix is not None else 0,
+                            perm_shm.name, ctrl_shm.name, descending, extra_args, count_ops))
+            
+            # Forward progress until the worker replies; STOP kills it outright
+            while not self.conn.poll(POLL_INTERVAL):
+                if cancel_event is not None and cancel_event.is_set():
+                    self.terminate()
+                    return None
+                if not self.process.is_alive():
+                    self.terminate()
+                    raise ValueError("Sort worker process exited unexpectedly")
+                if progress_callback:
+                    progress_callback(min(ctrl[CTRL_PROGRESS], 99.9))
+            
+            status, message = self.conn.recv()
+            if status != "ok":
+                raise ValueError(message)
+            
+            count = int(ctrl[CTRL_RESULT_LEN])
+            perm_view = perm_shm.buf[:count * 8].cast('q')
+            perm = perm_view.tolist()
+            perm_view.release()
+            seconds = ctrl[CTRL_SECONDS]
+            counts = None
+            if count_ops:
+                counts = {name: int(ctrl[CTRL_COUNTS + i])
+                          for i, name in enumerate(op_counter.COUNTER_NAMES)}
+        finally:
+            ctrl.release()
+            for block in blocks:
+                if block is not None:
+                    block.close()
+                    block.unlink()
+        
+        if progress_callback:
+            progress_callback(100)
+        return perm, seconds, counts
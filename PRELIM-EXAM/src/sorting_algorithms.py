@@ -6,11 +6,85 @@ optimized for sorting lists of dictionaries by a specified key.
 
 Algorithms:
     - Bubble Sort:    O(n²) time, O(1) space, Stable
-    - Insertion Sort: O(n²) time, O(1) space, Stable  
-    - Merge Sort:     O(n log n) time, O(n) space, Stable
+    - Insertion Sort: O(n²) time, O(1) space, Stable
+    - Merge Sort:     O(n log n) time, O(n) space, Stable (bottom-up)
+    - Merge Sort (Incremental): O(d log d + n) time for d new records, Stable
+    - Radix Sort:     O(d·(n+b)) time, O(n+b) space, Stable (integer keys, LSD)
+    - MSD Radix Sort: O(n·k) time, O(n+σ) space, Stable (string keys)
+    - Tim Sort:       O(n log n) time (O(n) on presorted runs), O(n) space, Stable
+    - Shell Sort:     about O(n^1.3) time (Ciura gaps), O(1) space, Unstable
+    - Heap Sort:      O(n log n) time, O(1) space, Unstable
+    - Intro Sort:     O(n log n) time, O(log n) space, Unstable
+    - Quick Sort (3-way): O(n log n) expected time, O(log n) space, Unstable
+    - Built-in sorted(): O(n log n) time, O(n) space, Stable (C Timsort baseline)
+
+Partial sorts (first k records only, in order):
+    - Top-K Heap:        O(n log k) time, O(k) space, Stable
+    - Top-K Quickselect: O(n + k log k) expected time, O(n) space, Stable
+
+All algorithms use a decorate-sort-undecorate scheme: the sort key of every
+record is extracted once into a flat list of (key, index) pairs, the pairs
+are sorted with order-specialised inner loops, and the records are then
+gathered back in sorted order. Comparisons never touch the dictionaries.
+
+`data` may be a list of dictionaries or a record_store.RecordStore. For a
+RecordStore the sort keys are read directly and the result is the index
+permutation (list of row indices in sorted order) - no records are moved.
+Dictionary-encoded name columns give order-preserving integer codes as keys,
+so name sorts compare small ints (and Radix Sort accepts them). Sorts listed
+in TEXT_KEY_SORTS read the collated strings instead.
+
+Trailing `# op: swap|shift|bookkeeping` comments tell op_counter what a store
+means to the algorithm. They are comments, so the timed code is unaffected.
 """
 
 import math
+import operator
+import random
+
+# --- Key Extraction (decorate / undecorate) ---
+
+# Sorts that inspect characters and so need str keys, even for encoded columns
+TEXT_KEY_SORTS = ("msd_radix_sort",)
+
+def decorate(data, key, text=False):
+    """
+    Builds the flat (key, index) pair list for a run.
+    
+    Each record's key is looked up exactly once, so the inner loops of the
+    sorts only compare plain values instead of calling dict.get() twice
+    per comparison.
+    
+    Args:
+        data (list | RecordStore): List of dictionaries (or record store) to sort.
+        key (str): The key in the dictionary to sort by.
+        text (bool): For a RecordStore, use the collated strings of an
+                     encoded text column instead of its integer codes.
+    
+    Returns:
+        list: List of (key_value, original_index) tuples.
+    """
+    sort_keys = getattr(data, 'sort_keys', None)
+    if sort_keys is not None:
+        # Columnar store: the sort keys already are a flat array
+        return list(zip(sort_keys(key, text), range(len(data))))
+    return [(row.get(key), i) for i, row in enumerate(data)]
+
+def undecorate(pairs, data):
+    """
+    Gathers the original records in the order given by sorted pairs.
+    
+    Args:
+        pairs (list): Sorted list of (key_value, original_index) tuples.
+        data (list | RecordStore): The original list of dictionaries (or record store).
+    
+    Returns:
+        list: New list of dictionaries in sorted order, or the index
+              permutation when data is a RecordStore.
+    """
+    if hasattr(data, 'column'):
+        return [i for _, i in pairs]
+    return [data[i] for _, i in pairs]
 
 def bubble_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
     """
@@ -18,7 +92,7 @@ def bubble_sort(data, key, descending=False, progress_callback=None, cancel_even
     
     Complexity:
         Time:  O(n²) average/worst, O(n) best (already sorted)
-        Space: O(1) - sorts in-place
+        Space: O(n) for the key/index pairs, O(1) extra while sorting
         Stable: Yes - equal elements maintain relative order
     
     Args:
@@ -27,13 +101,12 @@ def bubble_sort(data, key, descending=False, progress_callback=None, cancel_even
         descending (bool): Sort in descending order if True.
         progress_callback (callable): Function to call with progress percentage (0-100).
         cancel_event (threading.Event): Event to check for cancellation.
-        
+    
     Returns:
         list: The sorted list, or None if cancelled.
     """
-    # Create a copy to avoid modifying original data
-    data = data[:]
-    n = len(data)
+    pairs = decorate(data, key)
+    n = len(pairs)
     
     # Pre-fetch cancellation check for performance
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
@@ -43,38 +116,43 @@ def bubble_sort(data, key, descending=False, progress_callback=None, cancel_even
     comparisons_done = 0
     
     # Outer loop: each pass bubbles the largest unsorted element to the end
-    for i in range(n):
+    for i in range(n - 1):
+        # One pass is at most n comparisons, so checking once per pass
+        # keeps the STOP button responsive without taxing the inner loop
         if is_cancelled():
             return None
-            
+        
         swapped = False
-        comparisons_in_pass = n - i - 1
+        end = n - i
         
-        # Inner loop: compare adjacent elements
-        for j in range(0, comparisons_in_pass):
-            val1 = data[j].get(key)
-            val2 = data[j+1].get(key)
-            
-            # Determine if swap is needed based on sort order
-            should_swap = False
-            if descending:
-                if val1 < val2:
-                    should_swap = True
-            else:
-                if val1 > val2:
-                    should_swap = True
-                    
-            if should_swap:
-                # Swap adjacent elements
-                data[j], data[j+1] = data[j+1], data[j]
-                swapped = True
-            
-            # Periodic cancellation check for responsiveness
-            if j % 1000 == 0 and is_cancelled():
-                return None
+        # Inner loop: carry the current element forward while it is out of
+        # order, writing back only the element that stays behind
+        current = pairs[0]
+        current_val = current[0]
+        if descending:
+            for j in range(1, end):
+                nxt = pairs[j]
+                if current_val < nxt[0]:
+                    pairs[j - 1] = nxt  # op: swap
+                    swapped = True
+                else:
+                    pairs[j - 1] = current
+                    current = nxt
+                    current_val = nxt[0]
+        else:
+            for j in range(1, end):
+                nxt = pairs[j]
+                if current_val > nxt[0]:
+                    pairs[j - 1] = nxt  # op: swap
+                    swapped = True
+                else:
+                    pairs[j - 1] = current
+                    current = nxt
+                    current_val = nxt[0]
+        pairs[end - 1] = current
         
         # Update progress based on work completed
-        comparisons_done += comparisons_in_pass
+        comparisons_done += end - 1
         if progress_callback:
             p = (comparisons_done / total_comparisons) * 100
             progress_callback(min(p, 99.9))
@@ -85,7 +163,7 @@ def bubble_sort(data, key, descending=False, progress_callback=None, cancel_even
     
     if progress_callback:
         progress_callback(100)
-    return data
+    return undecorate(pairs, data)
 
 def insertion_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
     """
@@ -93,7 +171,7 @@ def insertion_sort(data, key, descending=False, progress_callback=None, cancel_e
     
     Complexity:
         Time:  O(n²) average/worst, O(n) best (already sorted)
-        Space: O(1) - sorts in-place
+        Space: O(n) for the key/index pairs, O(1) extra while sorting
         Stable: Yes - equal elements maintain relative order
     
     Args:
@@ -102,65 +180,134 @@ def insertion_sort(data, key, descending=False, progress_callback=None, cancel_e
         descending (bool): Sort in descending order if True.
         progress_callback (callable): Function to call with progress percentage (0-100).
         cancel_event (threading.Event): Event to check for cancellation.
-        
+    
     Returns:
         list: The sorted list, or None if cancelled.
     """
-    # Create a copy to avoid modifying original data
-    data = data[:]
-    n = len(data)
+    pairs = decorate(data, key)
+    n = len(pairs)
     
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
     
     # Iterate through unsorted portion (starting at index 1)
     for i in range(1, n):
-        if is_cancelled():
-            return None
-            
         # Store the current element to be inserted
-        current_record = data[i]
-        current_val = current_record.get(key)
+        current = pairs[i]
+        current_val = current[0]
         j = i - 1
         
         # Shift elements in sorted portion to make room for current element
-        while j >= 0:
-            compare_val = data[j].get(key)
-            should_move = False
-            
-            # Compare based on sort order
-            if descending:
-                if compare_val < current_val:
-                    should_move = True
-            else:
-                if compare_val > current_val:
-                    should_move = True
-            
-            if should_move:
-                # Shift element right to make space
-                data[j + 1] = data[j]
+        if descending:
+            while j >= 0 and pairs[j][0] < current_val:
+                pairs[j + 1] = pairs[j]  # op: shift
+                j -= 1
+        else:
+            while j >= 0 and pairs[j][0] > current_val:
+                pairs[j + 1] = pairs[j]  # op: shift
                 j -= 1
-            else:
-                break
         
         # Insert current element in its correct position
-        data[j + 1] = current_record
+        pairs[j + 1] = current
         
-        # Update progress (using quadratic mapping for accurate time representation)
-        if progress_callback and i % 10 == 0:
-            p = (i / n) ** 2 * 100  # Quadratic progress for O(n²) algorithms
-            progress_callback(p)
+        # Cancel check and progress update every 10 insertions (not per element)
+        if i % 10 == 0:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                p = (i / n) ** 2 * 100  # Quadratic progress for O(n²) algorithms
+                progress_callback(p)
     
     if progress_callback:
         progress_callback(100)
-    return data
+    return undecorate(pairs, data)
+
+# Length of the runs sorted by insertion sort before the first merge pass
+MERGE_RUN_WIDTH = 32
+
+def _insertion_sort_range(pairs, lo, hi, descending):
+    """Stably sorts pairs[lo:hi] in place (used for the initial short runs)."""
+    for i in range(lo + 1, hi):
+        current = pairs[i]
+        current_val = current[0]
+        j = i - 1
+        if descending:
+            while j >= lo and pairs[j][0] < current_val:
+                pairs[j + 1] = pairs[j]  # op: shift
+                j -= 1
+        else:
+            while j >= lo and pairs[j][0] > current_val:
+                pairs[j + 1] = pairs[j]  # op: shift
+                j -= 1
+        pairs[j + 1] = current
+
+def _merge_into(src, dst, lo, mid, hi, descending):
+    """
+    Stably merges the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    
+    Ties always take the element from the left run, which keeps the sort stable.
+    """
+    # Runs already in order (common on presorted input): one block copy suffices
+    if descending:
+        if src[mid - 1][0] >= src[mid][0]:
+            dst[lo:hi] = src[lo:hi]
+            return
+    elif src[mid - 1][0] <= src[mid][0]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    
+    i, j, k = lo, mid, lo
+    left = src[i]
+    right = src[j]
+    if descending:
+        while True:
+            if left[0] >= right[0]:
+                dst[k] = left
+                k += 1
+                i += 1
+                if i == mid:
+                    break
+                left = src[i]
+            else:
+                dst[k] = right
+                k += 1
+                j += 1
+                if j == hi:
+                    break
+                right = src[j]
+    else:
+        while True:
+            if left[0] <= right[0]:
+                dst[k] = left
+                k += 1
+                i += 1
+                if i == mid:
+                    break
+                left = src[i]
+            else:
+                dst[k] = right
+                k += 1
+                j += 1
+                if j == hi:
+                    break
+                right = src[j]
+    
+    # Copy whichever run still has elements left
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
 
 def merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
     """
     Sorts a list of dictionaries using Merge Sort.
     
+    Bottom-up variant: short runs are first sorted with insertion sort, then
+    runs of doubling width are merged back and forth between two buffers that
+    are allocated once. No recursion and no per-level temporary lists.
+    
     Complexity:
         Time:  O(n log n) - all cases (best, average, worst)
-        Space: O(n) - requires additional space for merging
+        Space: O(n) - one auxiliary buffer for merging
         Stable: Yes - equal elements maintain relative order
     
     Args:
@@ -169,82 +316,1174 @@ def merge_sort(data, key, descending=False, progress_callback=None, cancel_event
         descending (bool): Sort in descending order if True.
         progress_callback (callable): Function to call with progress percentage (0-100).
         cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    result = merge_sort_pairs(decorate(data, key), descending, progress_callback, cancel_event)
+    if result is None:
+        return None
+    return undecorate(result, data)
+
+def merge_sort_pairs(pairs, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Bottom-up merge sort engine working directly on (key, index) pairs.
+    
+    This is the core of merge_sort(); it is exposed separately so callers that
+    already hold decorated pairs (e.g. the parallel sort workers) can reuse it.
+    The input list is sorted in place and may be returned or replaced by the
+    auxiliary buffer, so always use the return value.
+    
+    Args:
+        pairs (list): List of (key_value, original_index) tuples.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
         
+    Returns:
+        list: The sorted pairs, or None if cancelled.
+    """
+    n = len(pairs)
+    if n <= 1:
+        return pairs
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    src = pairs
+    
+    # Tracking state for progress calculation: one unit of work per element
+    # per pass (the insertion-sort pass plus every merge pass)
+    merge_passes = math.ceil(math.log2(math.ceil(n / MERGE_RUN_WIDTH))) if n > MERGE_RUN_WIDTH else 0
+    total_work = n * (merge_passes + 1)
+    report_step = max(total_work // 100, 1)
+    work_done = 0
+    next_report = report_step
+    
+    # Pass 0: sort short runs in place
+    for lo in range(0, n, MERGE_RUN_WIDTH):
+        hi = min(lo + MERGE_RUN_WIDTH, n)
+        _insertion_sort_range(src, lo, hi, descending)
+        work_done += hi - lo
+        if work_done >= next_report:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(min(work_done / total_work * 100, 99.9))
+            next_report = work_done + report_step
+    
+    # Merge passes: ping-pong between the two preallocated buffers
+    dst = [None] * n
+    width = MERGE_RUN_WIDTH
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid < hi:
+                _merge_into(src, dst, lo, mid, hi, descending)
+            else:
+                # Lone trailing run: carry it over to the other buffer
+                dst[lo:hi] = src[lo:hi]
+            
+            work_done += hi - lo
+            if work_done >= next_report:
+                if is_cancelled():
+                    return None
+                if progress_callback:
+                    progress_callback(min(work_done / total_work * 100, 99.9))
+                next_report = work_done + report_step
+        
+        src, dst = dst, src
+        width *= 2
+    
+    if is_cancelled():
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return src
+
+def merge_runs(pairs, bounds, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Stably merges consecutive sorted runs of (key, index) pairs.
+    
+    Run r is pairs[bounds[r]:bounds[r + 1]]. Neighbouring runs are merged
+    pairwise, ceil(log2(runs)) passes between two buffers as in the merge
+    passes of merge_sort_pairs(); ties take the element from the earlier run.
+    Used by the parallel sort workers to merge their slices of the sorted
+    chunks. Always use the return value (it may be the auxiliary buffer).
+    
+    Args:
+        pairs (list): Concatenated sorted runs of (key_value, original_index) tuples.
+        bounds (list): Run boundaries, from 0 to len(pairs); runs may be empty.
+        descending (bool): The runs are sorted in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The merged pairs, or None if cancelled.
+    """
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    passes = math.ceil(math.log2(len(bounds) - 1)) if len(bounds) > 2 else 0
+    src = pairs
+    dst = [None] * len(pairs)
+    
+    for done in range(passes):
+        if is_cancelled():
+            return None
+        merged = [bounds[0]]
+        for r in range(0, len(bounds) - 1, 2):
+            lo = bounds[r]
+            mid = bounds[r + 1]
+            hi = bounds[r + 2] if r + 2 < len(bounds) else mid
+            if lo < mid < hi:
+                _merge_into(src, dst, lo, mid, hi, descending)
+            else:
+                # Lone or empty run: carry it over to the other buffer
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+        if progress_callback:
+            progress_callback((done + 1) / passes * 100)
+    
+    return src
+
+def merge_sort_extend(data, key, prefix, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Incremental Merge Sort: extends a sorted prefix to the whole list.
+    
+    `prefix` is the sorted order of the first m records, given as their
+    indices (e.g. the result of merge_sort on a RecordStore of m rows).
+    Only the new records data[m:] are sorted; the two sorted sequences are
+    then combined with a single linear merge. Growing N from 10,000 to
+    100,000 therefore sorts 90,000 records instead of 100,000, and growing
+    it by a few records costs little more than one O(n) merge.
+    
+    Complexity:
+        Time:  O(d log d + n) with d = n - m new records
+        Space: O(n) - the merge buffer
+        Stable: Yes - prefix records have the lower indices and win ties
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        prefix (list): Sorted index permutation of data[:len(prefix)].
+        descending (bool): Sort in descending order if True (must match prefix).
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
     Returns:
         list: The sorted list, or None if cancelled.
+    
+    Raises:
+        ValueError: If the prefix is longer than data.
     """
-    if len(data) <= 1:
-        return data
+    n = len(data)
+    m = len(prefix)
+    if m > n:
+        raise ValueError(f"Sorted prefix has {m} records but data only has {n}")
+    
+    pairs = decorate(data, key)
+    
+    # Sort only the newly included records (0-90% of the progress bar)
+    sub_progress = (lambda p: progress_callback(p * 0.9)) if progress_callback else None
+    delta = merge_sort_pairs(pairs[m:], descending, sub_progress, cancel_event)
+    if delta is None:
+        return None
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+    
+    # One stable merge of the cached prefix with the sorted delta
+    src = [pairs[i] for i in prefix]
+    src.extend(delta)
+    if 0 < m < n:
+        dst = [None] * n
+        _merge_into(src, dst, 0, m, n, descending)
+        src = dst
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(src, data)
+
+def radix_sort(data, key, descending=False, progress_callback=None, cancel_event=None, digit_bits=8):
+    """
+    Sorts a list of dictionaries by an integer key using LSD Radix Sort.
+    
+    Keys are shifted by the minimum value (so negative IDs work) and then
+    distributed into 2**digit_bits buckets, one digit at a time starting from
+    the least significant one. No keys are ever compared with each other.
+    
+    Complexity:
+        Time:  O(d·(n + b)) where d = number of digits, b = 2**digit_bits
+        Space: O(n + b) - bucket lists
+        Stable: Yes - equal elements maintain relative order
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by (values must be int;
+                   encoded name columns provide int codes).
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+        digit_bits (int): Width of one digit in bits (bucket count = 2**digit_bits).
+        
+    Returns:
+        list: The sorted list, or None if cancelled.
+        
+    Raises:
+        ValueError: If a key value is not an integer or digit_bits < 1.
+    """
+    if digit_bits < 1:
+        raise ValueError("digit_bits must be at least 1")
+    
+    pairs = decorate(data, key)
+    if len(pairs) <= 1:
+        return undecorate(pairs, data)
+    
+    for value, _ in pairs:
+        if type(value) is not int:
+            raise ValueError(f"Radix Sort needs integer keys, but '{key}' has value {value!r}")
     
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
     
-    # Tracking state for progress calculation
-    total_elements = len(data)
-    total_work = total_elements * math.log2(total_elements) if total_elements > 1 else 1
-    state = [0]  # Mutable container for nested function access
+    # Work on (key - min) so every key is non-negative, and only run as many
+    # digit passes as the largest shifted key needs
+    min_val = min(value for value, _ in pairs)
+    max_val = max(value for value, _ in pairs)
+    span_bits = (max_val - min_val).bit_length()
+    passes = max(math.ceil(span_bits / digit_bits), 1)
+    
+    num_buckets = 1 << digit_bits
+    mask = num_buckets - 1
     
-    def merge_recursive(arr):
-        """Recursively divide and merge the array."""
+    shift = 0
+    for pass_no in range(passes):
         if is_cancelled():
             return None
+        
+        # Distribute: each pair goes to the bucket of its current digit
+        buckets = [[] for _ in range(num_buckets)]
+        for pair in pairs:
+            buckets[((pair[0] - min_val) >> shift) & mask].append(pair)
+        
+        # Collect: bucket order decides the direction of the sort
+        if descending:
+            buckets.reverse()
+        pairs = [pair for bucket in buckets for pair in bucket]
+        
+        shift += digit_bits
+        if progress_callback:
+            progress_callback(min((pass_no + 1) / passes * 100, 99.9))
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+# Buckets at or below this size are finished with insertion sort
+MSD_INSERTION_CUTOFF = 16
+
+def msd_radix_sort(data, key, descending=False, progress_callback=None, cancel_event=None, cutoff=MSD_INSERTION_CUTOFF):
+    """
+    Sorts a list of dictionaries by a string key using MSD Radix Sort.
+    
+    Records are bucketed by the character at the current depth, starting from
+    the first one, and every bucket is then processed at the next depth.
+    Strings that end at the current depth form their own bucket, which comes
+    first (or last when descending). Buckets of at most `cutoff` records are
+    finished with insertion sort. A bucket that holds every record of its
+    group (a shared prefix, common in name data) just moves on to the next
+    depth without being copied.
+    
+    Complexity:
+        Time:  O(n·k) worst case, k = average distinguishing prefix length
+        Space: O(n + σ) - bucket lists, σ = alphabet size per level
+        Stable: Yes - equal elements maintain relative order
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by (values must be str).
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+        cutoff (int): Bucket size at or below which insertion sort is used.
+        
+    Returns:
+        list: The sorted list, or None if cancelled.
+        
+    Raises:
+        ValueError: If a key value is not a string.
+    """
+    pairs = decorate(data, key, text=True)
+    n = len(pairs)
+    if n <= 1:
+        return undecorate(pairs, data)
+    
+    for value, _ in pairs:
+        if type(value) is not str:
+            raise ValueError(f"MSD Radix Sort needs string keys, but '{key}' has value {value!r}")
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    result = []
+    finished = 0
+    report_step = max(n // 100, 1)
+    next_report = report_step
+    
+    # Explicit stack of (group, depth) instead of recursion; groups are pushed
+    # in reverse so they are popped (and emitted) in sorted order
+    stack = [(pairs, 0)]
+    while stack:
+        group, depth = stack.pop()
+        size = len(group)
+        
+        if size <= cutoff:
+            # Small bucket: all members share the first `depth` characters,
+            # so plain string comparison gives the same order
+            _insertion_sort_range(group, 0, size, descending)
+            result.extend(group)
+            finished += size
+        else:
+            # Distribute by the character at `depth` ('' = string ended here)
+            buckets = {}
+            for pair in group:
+                s = pair[0]
+                ch = s[depth] if depth < len(s) else ''
+                bucket = buckets.get(ch)
+                if bucket is None:
+                    buckets[ch] = [pair]
+                else:
+                    bucket.append(pair)
             
-        if len(arr) <= 1:
-            return arr
+            ended = buckets.pop('', None)
+            if ended is not None and not buckets:
+                # Every string in the group is identical: already in final order
+                result.extend(ended)
+                finished += size
+            elif ended is None and len(buckets) == 1:
+                # Shared prefix: no reordering happened, just look one character deeper
+                stack.append((group, depth + 1))  # op: bookkeeping
+                continue
+            else:
+                # Strings that ended are equal and are a prefix of all the others
+                chars = sorted(buckets, reverse=not descending)
+                if descending and ended is not None:
+                    stack.append((ended, depth + 1))  # op: bookkeeping
+                for ch in chars:
+                    stack.append((buckets[ch], depth + 1))  # op: bookkeeping
+                if not descending and ended is not None:
+                    result.extend(ended)
+                    finished += len(ended)
+        
+        if finished >= next_report:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(min(finished / n * 100, 99.9))
+            next_report = finished + report_step
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(result, data)
+
+# --- Adaptive Merge Sort (Timsort-style) ---
+
+# Consecutive wins by one run before the merge switches to galloping
+MIN_GALLOP = 7
+
+def _compute_min_run(n):
+    """Minimum run length (32..64) so that n / min_run is close to a power of 2."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _count_run(pairs, lo, hi, lt):
+    """
+    Returns the end of the natural run starting at lo.
+    
+    Strictly descending runs are reversed in place, so the result is always
+    an ascending run. (The strictness keeps equal elements in their order.)
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return hi
+    
+    if lt(pairs[run_hi][0], pairs[lo][0]):
+        while run_hi + 1 < hi and lt(pairs[run_hi + 1][0], pairs[run_hi][0]):
+            run_hi += 1
+        run_hi += 1
+        pairs[lo:run_hi] = pairs[lo:run_hi][::-1]
+    else:
+        while run_hi + 1 < hi and not lt(pairs[run_hi + 1][0], pairs[run_hi][0]):
+            run_hi += 1
+        run_hi += 1
+    return run_hi
+
+def _binary_insertion_sort(pairs, lo, hi, start, lt):
+    """Extends the sorted run pairs[lo:start] to pairs[lo:hi] with binary insertion."""
+    for i in range(start, hi):
+        pivot = pairs[i]
+        pivot_val = pivot[0]
+        
+        # Rightmost insertion point keeps equal elements in order
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) >> 1
+            if lt(pivot_val, pairs[mid][0]):
+                right = mid
+            else:
+                left = mid + 1
+        
+        # Shift the tail of the run one slot right with a single slice move
+        pairs[left + 1:i + 1] = pairs[left:i]  # op: shift
+        pairs[left] = pivot
+
+def _gallop_right(key_val, a, lo, hi, lt):
+    """First index in a[lo:hi] whose key sorts strictly after key_val."""
+    if lo == hi or lt(key_val, a[lo][0]):
+        return lo
+    
+    # Exponential probe: a[last] is known to be <= key_val
+    last = lo
+    ofs = 1
+    while lo + ofs < hi and not lt(key_val, a[lo + ofs][0]):
+        last = lo + ofs
+        ofs = (ofs << 1) + 1
+    
+    # Binary search inside the last probed interval
+    left, right = last + 1, min(lo + ofs, hi)
+    while left < right:
+        mid = (left + right) >> 1
+        if lt(key_val, a[mid][0]):
+            right = mid
+        else:
+            left = mid + 1
+    return left
+
+def _gallop_left(key_val, a, lo, hi, lt):
+    """First index in a[lo:hi] whose key does not sort before key_val."""
+    if lo == hi or not lt(a[lo][0], key_val):
+        return lo
+    
+    # Exponential probe: a[last] is known to be < key_val
+    last = lo
+    ofs = 1
+    while lo + ofs < hi and lt(a[lo + ofs][0], key_val):
+        last = lo + ofs
+        ofs = (ofs << 1) + 1
+    
+    # Binary search inside the last probed interval
+    left, right = last + 1, min(lo + ofs, hi)
+    while left < right:
+        mid = (left + right) >> 1
+        if lt(a[mid][0], key_val):
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+def _merge_lo(pairs, base1, len1, base2, len2, lt):
+    """
+    Merges the adjacent runs pairs[base1:base1+len1] and pairs[base2:base2+len2].
+    
+    The left run is copied to a temporary list and the output is written from
+    the left. After MIN_GALLOP consecutive wins by one run the merge switches
+    to galloping and moves whole blocks with slice assignment.
+    """
+    tmp = pairs[base1:base1 + len1]
+    i = 0
+    j = base2
+    end2 = base2 + len2
+    k = base1
+    
+    while i < len1 and j < end2:
+        # One-pair-at-a-time mode
+        count1 = count2 = 0
+        while i < len1 and j < end2 and count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+            if lt(pairs[j][0], tmp[i][0]):
+                pairs[k] = pairs[j]
+                j += 1
+                count2 += 1
+                count1 = 0
+            else:
+                pairs[k] = tmp[i]
+                i += 1
+                count1 += 1
+                count2 = 0
+            k += 1
+        
+        # Galloping mode: stays on while either side keeps winning in blocks
+        while i < len1 and j < end2:
+            count1 = _gallop_right(pairs[j][0], tmp, i, len1, lt) - i
+            if count1:
+                pairs[k:k + count1] = tmp[i:i + count1]
+                k += count1
+                i += count1
+                if i == len1:
+                    break
+            pairs[k] = pairs[j]
+            k += 1
+            j += 1
+            if j == end2:
+                break
             
-        # Divide: Split array into two halves
-        mid = len(arr) // 2
-        left_half = merge_recursive(arr[:mid])
-        if left_half is None:
-            return None
+            count2 = _gallop_left(tmp[i][0], pairs, j, end2, lt) - j
+            if count2:
+                pairs[k:k + count2] = pairs[j:j + count2]
+                k += count2
+                j += count2
+                if j == end2:
+                    break
+            pairs[k] = tmp[i]
+            k += 1
+            i += 1
             
-        right_half = merge_recursive(arr[mid:])
-        if right_half is None:
+            if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                break
+    
+    # Leftovers of the right run are already in place; copy back the left ones
+    if i < len1:
+        pairs[k:k + len1 - i] = tmp[i:]
+
+def _merge_at(pairs, runs, idx, lt):
+    """Merges runs[idx] with runs[idx + 1] and updates the run stack."""
+    base1, len1 = runs[idx]
+    base2, len2 = runs[idx + 1]
+    runs[idx] = (base1, len1 + len2)  # op: bookkeeping
+    del runs[idx + 1]
+    
+    # Elements of run 1 that sort before run 2's first element are in place
+    start = _gallop_right(pairs[base2][0], pairs, base1, base2, lt)
+    len1 -= start - base1
+    base1 = start
+    if len1 == 0:
+        return
+    
+    # Elements of run 2 that sort after run 1's last element are in place
+    len2 = _gallop_left(pairs[base1 + len1 - 1][0], pairs, base2, base2 + len2, lt) - base2
+    if len2 == 0:
+        return
+    
+    _merge_lo(pairs, base1, len1, base2, len2, lt)
+
+def _merge_collapse(pairs, runs, lt):
+    """Merges runs until the run-length invariants of the stack hold again."""
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+           (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(pairs, runs, n, lt)
+
+def tim_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Sorts a list of dictionaries using an adaptive, run-detecting Merge Sort.
+    
+    Timsort-style: the input is scanned for natural ascending and (strictly)
+    descending runs, short runs are extended to a minimum length with binary
+    insertion, and runs are merged with galloping under the Timsort stack
+    invariants. Presorted, reversed and partially sorted inputs finish in
+    close to linear time.
+    
+    Complexity:
+        Time:  O(n) best (already sorted/reversed), O(n log n) average/worst
+        Space: O(n) - temporary copy of the left run while merging
+        Stable: Yes - equal elements maintain relative order
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+        
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    pairs = decorate(data, key)
+    n = len(pairs)
+    if n <= 1:
+        return undecorate(pairs, data)
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    # "Sorts before" relation for the requested order
+    lt = operator.gt if descending else operator.lt
+    
+    min_run = _compute_min_run(n)
+    runs = []
+    lo = 0
+    while lo < n:
+        if is_cancelled():
             return None
         
-        # Conquer: Merge the sorted halves
-        merged = []
-        i = j = 0
+        # Find the next natural run and extend it to min_run if it is short
+        run_end = _count_run(pairs, lo, n, lt)
+        if run_end - lo < min_run:
+            forced_end = min(lo + min_run, n)
+            _binary_insertion_sort(pairs, lo, forced_end, run_end, lt)
+            run_end = forced_end
+        
+        runs.append((lo, run_end - lo))  # op: bookkeeping
+        _merge_collapse(pairs, runs, lt)
+        lo = run_end
         
-        while i < len(left_half) and j < len(right_half):
+        if progress_callback:
+            progress_callback(min(lo / n * 100, 99.9))
+    
+    # Merge whatever is left on the run stack
+    while len(runs) > 1:
+        n_idx = len(runs) - 2
+        if n_idx > 0 and runs[n_idx - 1][1] < runs[n_idx + 1][1]:
+            n_idx -= 1
+        _merge_at(pairs, runs, n_idx, lt)
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+# --- In-Place Comparison Sorts (unstable) ---
+
+# Ciura's experimentally tuned gap sequence; beyond 701 each gap is ~2.25x the previous one
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701)
+
+def _shell_gaps(n):
+    """Ciura gaps smaller than n, largest first."""
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] * 9 // 4 < n:
+        gaps.append(gaps[-1] * 9 // 4)
+    return [gap for gap in reversed(gaps) if gap < n]
+
+def shell_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Sorts a list of dictionaries using Shell Sort with Ciura's gap sequence.
+    
+    Each pass is an insertion sort over elements `gap` apart, so early passes
+    move far-away elements in long jumps and the final gap-1 pass (a plain
+    insertion sort) only has short distances left to shift.
+    
+    Complexity:
+        Time:  about O(n^1.3) in practice (no proven bound for Ciura's gaps)
+        Space: O(n) for the key/index pairs, O(1) extra while sorting
+        Stable: No - long jumps can reorder equal elements
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    pairs = decorate(data, key)
+    n = len(pairs)
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    gaps = _shell_gaps(n)
+    for pass_no, gap in enumerate(gaps):
+        if is_cancelled():
+            return None
+        
+        # Gapped insertion sort: carry the current element back in steps of gap
+        if descending:
+            for i in range(gap, n):
+                current = pairs[i]
+                current_val = current[0]
+                j = i
+                while j >= gap and pairs[j - gap][0] < current_val:
+                    pairs[j] = pairs[j - gap]  # op: shift
+                    j -= gap
+                pairs[j] = current
+        else:
+            for i in range(gap, n):
+                current = pairs[i]
+                current_val = current[0]
+                j = i
+                while j >= gap and pairs[j - gap][0] > current_val:
+                    pairs[j] = pairs[j - gap]  # op: shift
+                    j -= gap
+                pairs[j] = current
+        
+        if progress_callback:
+            progress_callback(min((pass_no + 1) / len(gaps) * 100, 99.9))
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+def _sift_down(pairs, lo, pos, size, lt):
+    """Moves pairs[lo + pos] down the heap stored in pairs[lo:lo + size] (root sorts last)."""
+    item = pairs[lo + pos]
+    item_val = item[0]
+    child = 2 * pos + 1
+    while child < size:
+        # Pick the child that sorts later
+        right = child + 1
+        if right < size and lt(pairs[lo + child][0], pairs[lo + right][0]):
+            child = right
+        if not lt(item_val, pairs[lo + child][0]):
+            break
+        pairs[lo + pos] = pairs[lo + child]  # op: shift
+        pos = child
+        child = 2 * pos + 1
+    pairs[lo + pos] = item
+
+def _heap_sort_range(pairs, lo, hi, lt):
+    """Sorts pairs[lo:hi] in place with heap sort (Introsort's fallback)."""
+    size = hi - lo
+    for pos in range(size // 2 - 1, -1, -1):
+        _sift_down(pairs, lo, pos, size, lt)
+    for end in range(size - 1, 0, -1):
+        pairs[lo], pairs[lo + end] = pairs[lo + end], pairs[lo]
+        _sift_down(pairs, lo, 0, end, lt)
+
+def heap_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Sorts a list of dictionaries using Heap Sort.
+    
+    The pairs are arranged into a binary heap whose root is the pair that
+    sorts last. The root is then repeatedly swapped to the end of the
+    shrinking heap and the new root is sifted down.
+    
+    Complexity:
+        Time:  O(n log n) best/average/worst
+        Space: O(n) for the key/index pairs, O(1) extra while sorting
+        Stable: No - the heap reorders equal elements
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    pairs = decorate(data, key)
+    n = len(pairs)
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    # "Sorts before" relation for the requested order
+    lt = operator.gt if descending else operator.lt
+    
+    # Build the heap bottom-up (O(n))
+    for pos in range(n // 2 - 1, -1, -1):
+        _sift_down(pairs, 0, pos, n, lt)
+    
+    # Move the root to the end of the heap, one extraction at a time
+    report_step = max(n // 100, 1)
+    for end in range(n - 1, 0, -1):
+        pairs[0], pairs[end] = pairs[end], pairs[0]
+        _sift_down(pairs, 0, 0, end, lt)
+        if end % report_step == 0:
             if is_cancelled():
                 return None
-                
-            val1 = left_half[i].get(key)
-            val2 = right_half[j].get(key)
-            
-            # Select smaller/larger element based on sort order
-            pick_left = False
-            if descending:
-                if val1 >= val2:
-                    pick_left = True
-            else:
-                if val1 <= val2:
-                    pick_left = True
+            if progress_callback:
+                progress_callback(min((n - end) / n * 100, 99.9))
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+# Ranges at or below this size are finished with insertion sort
+QUICK_INSERTION_CUTOFF = 16
+
+def intro_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Sorts a list of dictionaries using Introsort.
+    
+    Quicksort with a median-of-three pivot and Hoare partitioning. A range
+    that is still unsorted after 2·log2(n) levels of partitioning (a run of
+    bad pivots) is finished with heap sort, so the worst case stays
+    O(n log n). Ranges of at most QUICK_INSERTION_CUTOFF pairs are finished
+    with insertion sort.
+    
+    Complexity:
+        Time:  O(n log n) average/worst
+        Space: O(n) for the key/index pairs, O(log n) range stack
+        Stable: No - partitioning reorders equal elements
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    pairs = decorate(data, key)
+    n = len(pairs)
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    lt = operator.gt if descending else operator.lt
+    
+    finished = 0
+    report_step = max(n // 100, 1)
+    next_report = report_step
+    
+    # Explicit stack of (lo, hi, depth budget) ranges instead of recursion
+    stack = [(0, n, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        size = hi - lo
+        
+        if size <= QUICK_INSERTION_CUTOFF:
+            _insertion_sort_range(pairs, lo, hi, descending)
+            finished += size
+        elif depth == 0:
+            # Too many unbalanced partitions: guarantee O(n log n) for this range
+            _heap_sort_range(pairs, lo, hi, lt)
+            finished += size
+        else:
+            # Median of three: order the first, middle and last pair, pivot on the middle
+            last = hi - 1
+            mid = (lo + last) >> 1
+            if lt(pairs[mid][0], pairs[lo][0]):
+                pairs[lo], pairs[mid] = pairs[mid], pairs[lo]
+            if lt(pairs[last][0], pairs[mid][0]):
+                pairs[mid], pairs[last] = pairs[last], pairs[mid]
+                if lt(pairs[mid][0], pairs[lo][0]):
+                    pairs[lo], pairs[mid] = pairs[mid], pairs[lo]
+            pivot_val = pairs[mid][0]
             
-            if pick_left:
-                merged.append(left_half[i])
+            # Hoare partition: pairs[lo:j + 1] <= pivot <= pairs[j + 1:hi]
+            i, j = lo - 1, hi
+            while True:
                 i += 1
+                while lt(pairs[i][0], pivot_val):
+                    i += 1
+                j -= 1
+                while lt(pivot_val, pairs[j][0]):
+                    j -= 1
+                if i >= j:
+                    break
+                pairs[i], pairs[j] = pairs[j], pairs[i]
+            
+            # Push the larger part first, so the stack stays O(log n) deep
+            left, right = (lo, j + 1, depth - 1), (j + 1, hi, depth - 1)
+            if j + 1 - lo < hi - j - 1:
+                stack.append(right)  # op: bookkeeping
+                stack.append(left)  # op: bookkeeping
             else:
-                merged.append(right_half[j])
-                j += 1
+                stack.append(left)  # op: bookkeeping
+                stack.append(right)  # op: bookkeeping
         
-        # Append remaining elements
-        merged.extend(left_half[i:])
-        merged.extend(right_half[j:])
+        if finished >= next_report:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(min(finished / n * 100, 99.9))
+            next_report = finished + report_step
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+def quick_sort_3way(data, key, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Sorts a list of dictionaries using Quicksort with 3-way partitioning.
+    
+    Dijkstra's "Dutch national flag" partition splits each range into pairs
+    that sort before, equal to and after a random pivot in one
+    pass. The equal block is final at once, so columns with many repeated
+    keys (such as first names) need far fewer partitioning levels.
+    
+    Complexity:
+        Time:  O(n log n) expected, O(n) for few distinct keys, O(n²) worst case (unlucky pivots)
+        Space: O(n) for the key/index pairs, O(log n) range stack
+        Stable: No - partitioning reorders equal elements
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    pairs = decorate(data, key)
+    n = len(pairs)
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    lt = operator.gt if descending else operator.lt
+    
+    finished = 0
+    report_step = max(n // 100, 1)
+    next_report = report_step
+    
+    stack = [(0, n)]
+    while stack:
+        lo, hi = stack.pop()
+        size = hi - lo
         
-        # Update progress
-        state[0] += len(arr)
-        if progress_callback:
-            p = (state[0] / total_work) * 100
-            progress_callback(min(p, 99.9))
+        if size <= QUICK_INSERTION_CUTOFF:
+            _insertion_sort_range(pairs, lo, hi, descending)
+            finished += size
+        else:
+            # Random pivot, moved to the front of the range (presorted input
+            # would skew a positional pivot once the partition reshuffles it)
+            pick = random.randrange(lo, hi)
+            pairs[lo], pairs[pick] = pairs[pick], pairs[lo]
+            pivot_val = pairs[lo][0]
+            
+            # Invariant: [lo:before] < pivot, [before:i] == pivot, [after + 1:hi] > pivot
+            before, i, after = lo, lo + 1, hi - 1
+            while i <= after:
+                value = pairs[i][0]
+                if lt(value, pivot_val):
+                    pairs[before], pairs[i] = pairs[i], pairs[before]
+                    before += 1
+                    i += 1
+                elif lt(pivot_val, value):
+                    pairs[i], pairs[after] = pairs[after], pairs[i]
+                    after -= 1
+                else:
+                    i += 1
+            finished += after + 1 - before
+            
+            # Smaller part on top of the stack keeps it O(log n) deep
+            left, right = (lo, before), (after + 1, hi)
+            if before - lo < hi - after - 1:
+                stack.append(right)  # op: bookkeeping
+                stack.append(left)  # op: bookkeeping
+            else:
+                stack.append(left)  # op: bookkeeping
+                stack.append(right)  # op: bookkeeping
         
-        return merged
+        if finished >= next_report:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(min(finished / n * 100, 99.9))
+            next_report = finished + report_step
     
-    result = merge_recursive(data[:])
-    if result is None:
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+# --- Baseline ---
+
+def builtin_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Sorts a list of dictionaries with Python's built-in sorted() (C Timsort).
+    
+    Reference point for the hand-written algorithms: the same decorated
+    pairs, sorted by their key in C. It cannot report progress or stop
+    before it finishes (STOP terminates the worker process instead).
+    
+    Complexity:
+        Time:  O(n) best (presorted), O(n log n) average/worst
+        Space: O(n) - the sorted copy plus Timsort's merge buffer
+        Stable: Yes - equal elements maintain relative order (also descending)
+    
+    Args:
+        data (list): List of dictionaries to sort.
+        key (str): The key in the dictionary to sort by.
+        descending (bool): Sort in descending order if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+    
+    Returns:
+        list: The sorted list, or None if cancelled.
+    """
+    pairs = decorate(data, key)
+    if cancel_event is not None and cancel_event.is_set():
         return None
+    
+    pairs = sorted(pairs, key=operator.itemgetter(0), reverse=descending)
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(pairs, data)
+
+# --- Partial Sorts (Top-K) ---
+
+def _validate_k(k):
+    if type(k) is not int or k < 1:
+        raise ValueError(f"k must be a positive integer, got {k!r}")
+
+def top_k_heap(data, key, k, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Returns the first k records of the sorted order using heap selection.
+    
+    A max-heap (by sort order) holds the k best pairs seen so far, so its root
+    is the worst of them. Each remaining pair is compared with the root only
+    and replaces it when it sorts earlier. Finally the heap is emptied from
+    the worst pair to the best.
+    
+    Complexity:
+        Time:  O(n log k) worst case, O(n + k log k · log(n/k)) typical
+        Space: O(k) - the heap (plus the key/index pairs)
+        Stable: Yes - ties are broken by original position
+    
+    Args:
+        data (list): List of dictionaries to select from.
+        key (str): The key in the dictionary to sort by.
+        k (int): Number of records to return (clamped to len(data)).
+        descending (bool): Take the largest keys first if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
         
+    Returns:
+        list: The first k records in sorted order, or None if cancelled.
+    """
+    _validate_k(k)
+    pairs = decorate(data, key)
+    n = len(pairs)
+    k = min(k, n)
+    if k == 0:
+        return []
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    # "a sorts before b", with the original index as tie-breaker
+    if descending:
+        def before(a, b):
+            return a[0] > b[0] or (a[0] == b[0] and a[1] < b[1])
+    else:
+        def before(a, b):
+            return a < b  # (key, index) tuple order
+    
+    def sift_down(heap, pos, size):
+        """Moves heap[pos] down until both children sort before it."""
+        item = heap[pos]
+        child = 2 * pos + 1
+        while child < size:
+            # Pick the child that sorts later (the "larger" one in a max-heap)
+            right = child + 1
+            if right < size and before(heap[child], heap[right]):
+                child = right
+            if not before(item, heap[child]):
+                break
+            heap[pos] = heap[child]  # op: shift
+            pos = child
+            child = 2 * pos + 1
+        heap[pos] = item
+    
+    # Build the heap from the first k pairs
+    heap = pairs[:k]
+    for pos in range(k // 2 - 1, -1, -1):
+        sift_down(heap, pos, k)
+    
+    # Scan the rest: only pairs that beat the current worst enter the heap
+    report_step = max((n - k) // 100, 1)
+    for i in range(k, n):
+        pair = pairs[i]
+        if before(pair, heap[0]):
+            heap[0] = pair
+            sift_down(heap, 0, k)
+        if (i - k) % report_step == 0:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(min((i - k) / (n - k) * 100, 99.9))
+    
+    # Heap sort the survivors: repeatedly move the worst to the end
+    for size in range(k - 1, 0, -1):
+        heap[0], heap[size] = heap[size], heap[0]
+        sift_down(heap, 0, size)
+    
     if progress_callback:
         progress_callback(100)
-    return result
+    return undecorate(heap, data)
 
+def top_k_quickselect(data, key, k, descending=False, progress_callback=None, cancel_event=None):
+    """
+    Returns the first k records of the sorted order using quickselect.
+    
+    Stable 3-way quickselect: the candidates are split around a random pivot
+    key into "before", "equal" and "after" lists that keep the input order,
+    and only the part containing the k-th position is processed further.
+    The selected prefix is then sorted with the bottom-up merge sort.
+    
+    Complexity:
+        Time:  O(n + k log k) expected, O(n²) worst case (unlucky pivots)
+        Space: O(n) - partition lists
+        Stable: Yes - partitions preserve order and the prefix sort is stable
+    
+    Args:
+        data (list): List of dictionaries to select from.
+        key (str): The key in the dictionary to sort by.
+        k (int): Number of records to return (clamped to len(data)).
+        descending (bool): Take the largest keys first if True.
+        progress_callback (callable): Function to call with progress percentage (0-100).
+        cancel_event (threading.Event): Event to check for cancellation.
+        
+    Returns:
+        list: The first k records in sorted order, or None if cancelled.
+    """
+    _validate_k(k)
+    candidates = decorate(data, key)
+    n = len(candidates)
+    k = min(k, n)
+    if k == 0:
+        return []
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    selected = []
+    need = k
+    while need > 0:
+        if is_cancelled():
+            return None
+        
+        if need >= len(candidates):
+            selected.extend(candidates)
+            break
+        
+        pivot = candidates[random.randrange(len(candidates))][0]
+        if descending:
+            first = [p for p in candidates if p[0] > pivot]
+            last = [p for p in candidates if p[0] < pivot]
+        else:
+            first = [p for p in candidates if p[0] < pivot]
+            last = [p for p in candidates if p[0] > pivot]
+        
+        if need <= len(first):
+            candidates = first
+            continue
+        
+        # Everything in "first" is selected; equal keys fill up the rest in order
+        selected.extend(first)
+        need -= len(first)
+        equal = [p for p in candidates if p[0] == pivot]
+        if need <= len(equal):
+            selected.extend(equal[:need])
+            break
+        selected.extend(equal)
+        need -= len(equal)
+        candidates = last
+        
+        if progress_callback:
+            progress_callback(min((k - need) / k * 50, 50))
+    
+    if progress_callback:
+        progress_callback(50)
+    
+    # Equal keys were kept in input order, so a stable sort of the prefix
+    # yields exactly the first k records of the full stable sort
+    def prefix_progress(p):
+        progress_callback(50 + p / 2)
+    
+    result = merge_sort_pairs(selected, descending,
+                              prefix_progress if progress_callback else None, cancel_event)
+    if result is None:
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return undecorate(result, data)
@@ -1,69 +1,200 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import scrolledtext
+import argparse
 import time
 import os
+import sys
 import threading
 import math
-import glob
+import functools
+import multiprocessing
+import operator
+import random
+import mmap
+import struct
+from array import array
 from collections import Counter
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None # Optional: without NumPy only the pure-Python sorts are used
 
 # --- BACKEND LOGIC ---
 
+# Bytes read per chunk while parsing a dataset
+READ_CHUNK_BYTES = 1 << 20
+# Leading values used to infer the typical digit length
+DIGIT_SAMPLE = 10000
+SEPARATORS = b" \t\r\n\v\f,"
+
+def append_values(data, tokens, typical_length):
+    """
+    Parses byte tokens into data, splitting concatenated numbers into
+    typical_length digit chunks. Returns data, which becomes a list if a value
+    does not fit in int64.
+    """
+    # Values longer than 1.5x typical are likely concatenated
+    concat_threshold = int(typical_length * 1.5)
+    if max(map(len, tokens)) <= concat_threshold:
+        # Fast path: no concatenated values, parse the whole chunk in C
+        try:
+            data.extend(array('q', map(int, tokens)))
+            return data
+        except (ValueError, OverflowError):
+            pass # Malformed or oversized value somewhere; go token by token
+    
+    for token in tokens:
+        if len(token) > concat_threshold:
+            parts = [token[i:i + typical_length] for i in range(0, len(token), typical_length)]
+        else:
+            parts = (token,)
+        for part in parts:
+            try:
+                value = int(part)
+            except ValueError:
+                continue  # Skip malformed values
+            try:
+                data.append(value)
+            except OverflowError:
+                data = data.tolist() # Beyond int64: keep going as plain ints
+                data.append(value)
+    return data
+
 def read_dataset(filename):
-    """Reads integers from a file. Auto-detects and splits concatenated numbers."""
-    raw_values = []
+    """
+    Reads integers from a file. Auto-detects and splits concatenated numbers.
+    
+    Streams the file in binary chunks: values are separated by whitespace or
+    commas, and the typical digit length is inferred from the leading values.
+    Values longer than 1.5x that length are split into typical-length numbers
+    as they are read. Returns an array('q') (a list if some value does not
+    fit in 64 bits).
+    """
+    data = array('q')
+    typical_length = None
+    carry = b""
     
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                stripped = line.strip()
-                if stripped:
-                    # Handle comma/space-separated values first
-                    if ',' in stripped or ' ' in stripped:
-                        parts = stripped.replace(',', ' ').split()
-                        for part in parts:
-                            part = part.strip()
-                            if part:
-                                raw_values.append(part)
-                    else:
-                        raw_values.append(stripped)
+        with open(filename, 'rb') as f:
+            while True:
+                chunk = f.read(READ_CHUNK_BYTES)
+                at_end = not chunk
+                chunk = carry + chunk
+                tokens = chunk.replace(b',', b' ').split()
+                # A value cut off at the chunk boundary continues in the next chunk
+                carry = tokens.pop() if tokens and not at_end and chunk[-1] not in SEPARATORS else b""
+                if tokens:
+                    if typical_length is None:
+                        # Mode of the leading values' lengths
+                        typical_length = Counter(map(len, tokens[:DIGIT_SAMPLE])).most_common(1)[0][0]
+                    data = append_values(data, tokens, typical_length)
+                if at_end:
+                    break
     except FileNotFoundError:
         return None
     except Exception:
         return []
     
-    if not raw_values:
-        return []
-    
-    # First pass: collect digit lengths to find the typical (mode) length
-    digit_lengths = Counter(len(v) for v in raw_values)
-    typical_length = digit_lengths.most_common(1)[0][0]
-    
-    # Threshold: values longer than 1.5x typical are likely concatenated
-    concat_threshold = int(typical_length * 1.5)
-    
-    # Second pass: parse values, splitting concatenated ones
-    data = []
-    for val in raw_values:
-        try:
-            if len(val) > concat_threshold and typical_length > 0:
-                # Split into chunks of typical_length
-                for i in range(0, len(val), typical_length):
-                    chunk = val[i:i + typical_length]
-                    if chunk:
-                        data.append(int(chunk))
-            else:
-                data.append(int(val))
-        except ValueError:
-            continue  # Skip malformed values
-    
     return data
 
+# --- BINARY DATASETS ---
+# A converted dataset is a 16-byte header (magic, value count) followed by the
+# values as little-endian int64. Loading one maps the file instead of parsing
+# it, so switching to it costs the same at any size. Pages are read on first
+# access, and the sort worker copies the values into its own block, so the
+# file itself is never written.
+
+BINARY_EXT = ".i64"
+BINARY_MAGIC = b"ALGSORT1"
+BINARY_HEADER = struct.Struct("<8sQ")
+
+def write_binary_dataset(values, path):
+    """Writes int64 values in the binary dataset format (atomically, via a temp file)."""
+    packed = values if isinstance(values, array) else array('q', values)
+    if sys.byteorder != "little":
+        packed = array('q', packed); packed.byteswap()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, len(packed)))
+        packed.tofile(f)
+    os.replace(tmp_path, path)
+
+def convert_dataset(txt_path, out_path=None):
+    """
+    Converts a text dataset to the binary format (by default next to it,
+    same name with BINARY_EXT). Returns the output path.
+    Raises OverflowError if a value does not fit in 64 bits.
+    """
+    values = read_dataset(txt_path)
+    if values is None:
+        raise FileNotFoundError(f"No such file: {txt_path}")
+    if not isinstance(values, array):
+        raise OverflowError("Values beyond 64 bits cannot be stored in the binary format")
+    out_path = out_path or os.path.splitext(txt_path)[0] + BINARY_EXT
+    write_binary_dataset(values, out_path)
+    return out_path
+
+def open_binary_dataset(path):
+    """
+    Maps a binary dataset read-only and returns an int64 memoryview over it.
+    The mapping stays open as long as a view of it is alive.
+    Raises ValueError if the file is not a binary dataset.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(BINARY_HEADER.size)
+        size = os.fstat(f.fileno()).st_size
+        if len(header) < BINARY_HEADER.size:
+            raise ValueError(f"{os.path.basename(path)} is not a binary dataset")
+        magic, count = BINARY_HEADER.unpack(header)
+        if magic != BINARY_MAGIC or size != BINARY_HEADER.size + count * 8:
+            raise ValueError(f"{os.path.basename(path)} is not a binary dataset")
+        # The map keeps its own handle, so the file can be closed right away
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    values = memoryview(mapped)[BINARY_HEADER.size:].cast('q')
+    if sys.byteorder != "little":
+        # Big-endian host: swap into a private copy (the only case that reads the whole file)
+        swapped = array('q'); swapped.frombytes(values); swapped.byteswap()
+        return swapped
+    return values
+
+def load_dataset(path):
+    """Loads a dataset by extension: binary files are mapped, text files parsed (see read_dataset)."""
+    if path.lower().endswith(BINARY_EXT):
+        try:
+            return open_binary_dataset(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            return []
+    return read_dataset(path)
+
+# --- IN-PLACE SORTS ---
+# Datasets are int64 buffers: an array('q') in the app and a memoryview over
+# shared memory in the sort worker (a list only when a value exceeds 64 bits).
+# The pure-Python sorts below reorder the buffer they are given and return
+# it; callers that still need the input order pass a copy.
+
+def scratch_like(arr):
+    """Zeroed buffer of the same kind and length as arr (the merge passes' second buffer)."""
+    if isinstance(arr, list):
+        return [0] * len(arr)
+    scratch = array('q', bytes(8 * len(arr)))
+    # Slices only assign between buffers of the same kind
+    return memoryview(scratch) if isinstance(arr, memoryview) else scratch
+
+def reverse_in_place(arr):
+    """Reverses a list, array or memoryview (memoryviews have no reverse())."""
+    arr[:] = arr[::-1]
+
 def bubble_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Bubble sort with early exit. The element being bubbled is carried in a
+    local, so each step reads one element from the buffer instead of two.
+    """
     n = len(arr)
-    # Shallow copy to avoid sorting the original reference in place if reused
-    arr = arr[:] 
     
     # Pre-fetch check for slightly faster access
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
@@ -71,177 +202,736 @@ def bubble_sort(arr, progress_callback=None, cancel_event=None, descending=True)
     # Total expected comparisons for progress tracking (Sum of n-1 ... 1)
     total_comparisons = n * (n - 1) // 2
     comparisons_done = 0
-
-    for i in range(n):
+    
+    for i in range(n - 1):
         if is_cancelled(): return None
-
+        
         swapped = False
         # Inner loop does n-i-1 comparisons
         comparisons_in_pass = n - i - 1
         
-        for j in range(0, comparisons_in_pass):
-            # Comparison Logic
-            should_swap = False
-            if descending:
-                if arr[j] < arr[j + 1]: should_swap = True
-            else:
-                if arr[j] > arr[j + 1]: should_swap = True
-                
-            if should_swap:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-            
-            # Stride check inner loop
-            if j % 1000 == 0 and is_cancelled():
-                return None
+        moving = arr[0]
+        if descending:
+            for j in range(1, n - i):
+                value = arr[j]
+                if moving < value:
+                    arr[j - 1] = value; arr[j] = moving
+                    swapped = True
+                else:
+                    moving = value
+        else:
+            for j in range(1, n - i):
+                value = arr[j]
+                if moving > value:
+                    arr[j - 1] = value; arr[j] = moving
+                    swapped = True
+                else:
+                    moving = value
         
         # Update progress (based on work done vs total estimated work)
         comparisons_done += comparisons_in_pass
         if progress_callback: 
             p = (comparisons_done / total_comparisons) * 100
             progress_callback(min(p, 99.9))
-            
+        
         if not swapped:
             break
-            
+    
     if progress_callback: progress_callback(100)
     return arr
 
 def insertion_sort(arr, progress_callback=None, cancel_event=None, descending=True):
-    arr = arr[:] # Copy
     n = len(arr)
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
-
+    
     for i in range(1, n):
-        if is_cancelled(): return None
-
         key = arr[i]
         j = i - 1
         
-        # Comparison logic inside while
-        while j >= 0:
-            should_move = False
+        # Shift the larger (descending: smaller) elements one slot right
+        if descending:
+            while j >= 0 and arr[j] < key:
+                arr[j + 1] = arr[j]; j -= 1
+        else:
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]; j -= 1
+        
+        arr[j + 1] = key
+        
+        # Cancel check and progress every 10 insertions (not per element)
+        if i % 10 == 0:
+            if is_cancelled(): return None
+            if progress_callback:
+                # Map progress to i^2 for quadratic time complexity
+                # This makes progress bar linear with TIME rather than iteration count
+                p = (i / n) ** 2 * 100
+                progress_callback(p)
+    
+    if progress_callback: progress_callback(100)
+    return arr
+
+# Length of the runs sorted by insertion sort before the first merge pass
+MERGE_RUN_WIDTH = 32
+NP_MERGE_RUN_WIDTH = 16 # NumPy backend: its row-wise passes favour shorter runs
+
+def merge_into(src, dst, lo, mid, hi, descending=True):
+    """Stably merges src[lo:mid] and src[mid:hi] into dst[lo:hi] (ties take the left run)."""
+    # Runs already in order: a single block copy is enough
+    if (src[mid - 1] >= src[mid]) if descending else (src[mid - 1] <= src[mid]):
+        dst[lo:hi] = src[lo:hi]
+        return
+    
+    i, j, k = lo, mid, lo
+    left = src[i]
+    right = src[j]
+    if descending:
+        while True:
+            if left >= right:
+                dst[k] = left; k += 1; i += 1
+                if i == mid: break
+                left = src[i]
+            else:
+                dst[k] = right; k += 1; j += 1
+                if j == hi: break
+                right = src[j]
+    else:
+        while True:
+            if left <= right:
+                dst[k] = left; k += 1; i += 1
+                if i == mid: break
+                left = src[i]
+            else:
+                dst[k] = right; k += 1; j += 1
+                if j == hi: break
+                right = src[j]
+    
+    # Copy the leftovers of whichever run is not exhausted
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+def merge_sort_wrapper(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Bottom-up merge sort that ping-pongs between arr and one scratch buffer.
+    If the last pass ends in the scratch buffer, it is copied back into arr.
+    """
+    n = len(arr)
+    src = arr
+    if n <= 1:
+        return arr
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    # Work = one unit per element per pass (insertion pass + merge passes)
+    merge_passes = math.ceil(math.log2(math.ceil(n / MERGE_RUN_WIDTH))) if n > MERGE_RUN_WIDTH else 0
+    total_work = n * (merge_passes + 1)
+    report_step = max(total_work // 100, 1)
+    state = [0, report_step] # [work done, next report threshold]
+    
+    def checkpoint(done):
+        """Progress/cancel hook, only hit about 100 times per sort."""
+        state[0] += done
+        if state[0] < state[1]: return True
+        state[1] = state[0] + report_step
+        if is_cancelled(): return False
+        if progress_callback: progress_callback(min(state[0] / total_work * 100, 99.9))
+        return True
+    
+    # Pass 0: insertion sort each short run in place
+    for lo in range(0, n, MERGE_RUN_WIDTH):
+        hi = min(lo + MERGE_RUN_WIDTH, n)
+        for i in range(lo + 1, hi):
+            key = src[i]
+            j = i - 1
             if descending:
-                if key > arr[j]: should_move = True
+                while j >= lo and src[j] < key:
+                    src[j + 1] = src[j]; j -= 1
             else:
-                if key < arr[j]: should_move = True
-            
-            if should_move:
-                arr[j + 1] = arr[j]
-                j -= 1
+                while j >= lo and src[j] > key:
+                    src[j + 1] = src[j]; j -= 1
+            src[j + 1] = key
+        if not checkpoint(hi - lo): return None
+    
+    # Merge passes of doubling width, swapping buffer roles after each pass
+    dst = scratch_like(arr)
+    width = MERGE_RUN_WIDTH
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid < hi:
+                merge_into(src, dst, lo, mid, hi, descending)
             else:
-                break
+                dst[lo:hi] = src[lo:hi] # Lone trailing run
+            if not checkpoint(hi - lo): return None
+        src, dst = dst, src
+        width *= 2
+    
+    if is_cancelled(): return None
+    if src is not arr:
+        arr[:] = src # Odd number of merge passes: one block copy back
+    if progress_callback: progress_callback(100)
+    return arr
 
+# --- FASTER COMPARISON SORTS ---
+# The values are plain integers, so these sort ascending and reverse the
+# result for descending order (like the NumPy backend).
+
+# Ciura's tuned gap sequence; beyond 701 each gap is ~2.25x the previous one
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701)
+# Ranges at or below this size are finished with insertion sort
+QUICK_INSERTION_CUTOFF = 16
+
+def insertion_sort_range(arr, lo, hi):
+    """Sorts arr[lo:hi] ascending in place."""
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]; j -= 1
         arr[j + 1] = key
+
+def shell_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """Shell sort: gapped insertion passes over Ciura's gaps, ending with gap 1."""
+    n = len(arr)
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] * 9 // 4 < n:
+        gaps.append(gaps[-1] * 9 // 4)
+    gaps = [gap for gap in reversed(gaps) if gap < n]
+    
+    for pass_no, gap in enumerate(gaps):
+        if is_cancelled(): return None
+        for i in range(gap, n):
+            key = arr[i]
+            j = i
+            while j >= gap and arr[j - gap] > key:
+                arr[j] = arr[j - gap]; j -= gap
+            arr[j] = key
+        if progress_callback: progress_callback(min((pass_no + 1) / len(gaps) * 100, 99.9))
+    
+    if descending: reverse_in_place(arr)
+    if progress_callback: progress_callback(100)
+    return arr
+
+def sift_down(arr, lo, pos, size):
+    """Moves arr[lo + pos] down the max-heap stored in arr[lo:lo + size]."""
+    item = arr[lo + pos]
+    child = 2 * pos + 1
+    while child < size:
+        right = child + 1
+        if right < size and arr[lo + child] < arr[lo + right]:
+            child = right
+        if item >= arr[lo + child]:
+            break
+        arr[lo + pos] = arr[lo + child]
+        pos = child
+        child = 2 * pos + 1
+    arr[lo + pos] = item
+
+def heap_sort_range(arr, lo, hi):
+    """Sorts arr[lo:hi] ascending in place (Introsort's fallback)."""
+    size = hi - lo
+    for pos in range(size // 2 - 1, -1, -1):
+        sift_down(arr, lo, pos, size)
+    for end in range(size - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        sift_down(arr, lo, 0, end)
+
+def heap_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """Heap sort: build a max-heap, then swap the root to the end of the shrinking heap."""
+    n = len(arr)
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    for pos in range(n // 2 - 1, -1, -1):
+        sift_down(arr, 0, pos, n)
+    
+    report_step = max(n // 100, 1)
+    for end in range(n - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        sift_down(arr, 0, 0, end)
+        if end % report_step == 0:
+            if is_cancelled(): return None
+            if progress_callback: progress_callback(min((n - end) / n * 100, 99.9))
+    
+    if descending: reverse_in_place(arr)
+    if progress_callback: progress_callback(100)
+    return arr
+
+def intro_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Introsort: median-of-three quicksort with Hoare partitioning. Ranges still
+    unsorted after 2·log2(n) partition levels fall back to heap sort, short
+    ranges finish with insertion sort.
+    """
+    n = len(arr)
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    finished = 0
+    report_step = max(n // 100, 1)
+    next_report = report_step
+    
+    # Explicit stack of (lo, hi, depth budget) ranges instead of recursion
+    stack = [(0, n, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= QUICK_INSERTION_CUTOFF:
+            insertion_sort_range(arr, lo, hi)
+            finished += hi - lo
+        elif depth == 0:
+            heap_sort_range(arr, lo, hi)
+            finished += hi - lo
+        else:
+            # Median of three: order first, middle and last, pivot on the middle
+            last = hi - 1
+            mid = (lo + last) >> 1
+            if arr[mid] < arr[lo]: arr[lo], arr[mid] = arr[mid], arr[lo]
+            if arr[last] < arr[mid]:
+                arr[mid], arr[last] = arr[last], arr[mid]
+                if arr[mid] < arr[lo]: arr[lo], arr[mid] = arr[mid], arr[lo]
+            pivot = arr[mid]
+            
+            # Hoare partition: arr[lo:j + 1] <= pivot <= arr[j + 1:hi]
+            i, j = lo - 1, hi
+            while True:
+                i += 1
+                while arr[i] < pivot: i += 1
+                j -= 1
+                while pivot < arr[j]: j -= 1
+                if i >= j: break
+                arr[i], arr[j] = arr[j], arr[i]
+            
+            # Smaller part on top of the stack keeps it O(log n) deep
+            left, right = (lo, j + 1, depth - 1), (j + 1, hi, depth - 1)
+            if j + 1 - lo < hi - j - 1:
+                stack.append(right); stack.append(left)
+            else:
+                stack.append(left); stack.append(right)
         
-        if progress_callback and i % 10 == 0:
-            # Map progress to i^2 for quadratic time complexity
-            # This makes progress bar linear with TIME rather than iteration count
-            p = (i / n) ** 2 * 100
-            progress_callback(p)
+        if finished >= next_report:
+            if is_cancelled(): return None
+            if progress_callback: progress_callback(min(finished / n * 100, 99.9))
+            next_report = finished + report_step
+    
+    if descending: reverse_in_place(arr)
+    if progress_callback: progress_callback(100)
+    return arr
+
+def quick_sort_3way(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Quicksort with Dijkstra's 3-way partition around a random pivot. Keys equal
+    to the pivot are final after one pass, which suits data with many repeats.
+    """
+    n = len(arr)
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    
+    finished = 0
+    report_step = max(n // 100, 1)
+    next_report = report_step
+    
+    stack = [(0, n)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo <= QUICK_INSERTION_CUTOFF:
+            insertion_sort_range(arr, lo, hi)
+            finished += hi - lo
+        else:
+            pick = random.randrange(lo, hi)
+            arr[lo], arr[pick] = arr[pick], arr[lo]
+            pivot = arr[lo]
+            
+            # Invariant: [lo:before] < pivot, [before:i] == pivot, [after + 1:hi] > pivot
+            before, i, after = lo, lo + 1, hi - 1
+            while i <= after:
+                value = arr[i]
+                if value < pivot:
+                    arr[before], arr[i] = value, arr[before]
+                    before += 1; i += 1
+                elif value > pivot:
+                    arr[i], arr[after] = arr[after], value
+                    after -= 1
+                else:
+                    i += 1
+            finished += after + 1 - before
             
+            left, right = (lo, before), (after + 1, hi)
+            if before - lo < hi - after - 1:
+                stack.append(right); stack.append(left)
+            else:
+                stack.append(left); stack.append(right)
+        
+        if finished >= next_report:
+            if is_cancelled(): return None
+            if progress_callback: progress_callback(min(finished / n * 100, 99.9))
+            next_report = finished + report_step
+    
+    if descending: reverse_in_place(arr)
     if progress_callback: progress_callback(100)
     return arr
 
-# Helper for merge sort to track progress
-def merge_sort_wrapper(arr, progress_callback=None, cancel_event=None, descending=True):
-    if not progress_callback and not cancel_event:
-        # Fallback to simple recursive if no callback needed
-        return merge_sort_recursive_simple(arr, descending)
+def builtin_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """Baseline: Python's built-in sorted() (C Timsort). No progress until it is done."""
+    if cancel_event is not None and cancel_event.is_set(): return None
+    result = sorted(arr, reverse=descending)
+    if progress_callback: progress_callback(100)
+    return result
+
+# --- NUMPY BACKEND (optional) ---
+# Same API as the functions above, but the work runs on int64 arrays in C.
+# The values are plain integers, so equal elements are indistinguishable and
+# reversing the ascending result gives exactly the descending one.
+
+def np_odd_even_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Odd-even transposition sort (the bubble-family variant). Each phase
+    compare-exchanges all even (or all odd) neighbour pairs at once.
+    Still O(n²) work, but every phase is one vectorised O(n) step.
+    """
+    a = np.array(arr, dtype=np.int64)
+    n = len(a)
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    report_step = max(n // 100, 1)
     
-    total_elements = len(arr)
-    state = [0] # Shared progress counter
+    quiet_phases = 0
+    for phase in range(n):
+        start = phase & 1
+        lo = a[start:n - 1:2]   # views: writing them updates a
+        hi = a[start + 1:n:2]
+        if (lo > hi).any():
+            smaller = np.minimum(lo, hi)
+            hi[:] = np.maximum(lo, hi)
+            lo[:] = smaller
+            quiet_phases = 0
+        else:
+            # An even and an odd phase without exchanges: sorted
+            quiet_phases += 1
+            if quiet_phases == 2:
+                break
+        
+        if phase % report_step == 0:
+            if is_cancelled(): return None
+            if progress_callback: progress_callback(min(phase / n * 100, 99.9))
+    
+    if progress_callback: progress_callback(100)
+    return (a[::-1] if descending else a).tolist()
+
+def np_insertion_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Binary insertion sort: searchsorted finds the slot and one block copy
+    shifts the tail of the sorted prefix (a memmove instead of a Python loop).
+    """
+    a = np.array(arr, dtype=np.int64)
+    n = len(a)
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
     
-    # Total merge operations is approx N * log2(N)
-    total_work = total_elements * math.log2(total_elements) if total_elements > 1 else 1
+    for i in range(1, n):
+        key = a[i]
+        if a[i - 1] > key:
+            # side='right' inserts after equal keys (stable)
+            pos = int(np.searchsorted(a[:i], key, side='right'))
+            a[pos + 1:i + 1] = a[pos:i]
+            a[pos] = key
+        
+        if i % 1024 == 0:
+            if is_cancelled(): return None
+            if progress_callback: progress_callback((i / n) ** 2 * 100)
+    
+    if progress_callback: progress_callback(100)
+    return (a[::-1] if descending else a).tolist()
 
-    def merge_sort_recursive(arr):
+def np_insertion_rows(rows):
+    """
+    Insertion-sorts every row of a 2-D array in place. Works on a transposed
+    copy so each step is one contiguous column operation for all rows at once.
+    """
+    cols = np.ascontiguousarray(rows.T)
+    for i in range(1, cols.shape[0]):
+        key = cols[i].copy()
+        # Carry key down while the element above it is greater (strict: stable)
+        for j in range(i - 1, -1, -1):
+            move = cols[j] > key
+            if not move.any(): break
+            cols[j + 1] = np.where(move, cols[j], cols[j + 1])
+            cols[j] = np.where(move, key, cols[j])
+    rows[:] = cols.T
+
+def np_merge_rows(src_rows, dst_rows, width):
+    """
+    Merges the two halves of every row of src_rows into dst_rows, one output
+    column per step for all rows at once (stable: ties take the left half).
+    """
+    row_ids = np.arange(src_rows.shape[0])
+    i = np.zeros(src_rows.shape[0], dtype=np.int64)
+    j = np.zeros(src_rows.shape[0], dtype=np.int64)
+    for k in range(2 * width):
+        left = src_rows[row_ids, np.minimum(i, width - 1)]
+        right = src_rows[row_ids, width + np.minimum(j, width - 1)]
+        take_left = (i < width) & ((j >= width) | (left <= right))
+        dst_rows[:, k] = np.where(take_left, left, right)
+        i += take_left
+        j += ~take_left
+
+def np_merge_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """
+    Bottom-up merge sort on arrays. Pass 0 insertion-sorts all
+    NP_MERGE_RUN_WIDTH-wide runs together (one row per run). Narrow passes,
+    which have many short run pairs, merge all pairs together (one row per
+    pair). Wide passes merge pair by pair with searchsorted: an element's
+    final slot is its rank in its own run plus the number of elements of the
+    other run that go before it.
+    """
+    a = np.array(arr, dtype=np.int64)
+    n = len(a)
+    if n <= 1:
+        return a.tolist()
+    
+    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    merge_passes = math.ceil(math.log2(math.ceil(n / NP_MERGE_RUN_WIDTH))) if n > NP_MERGE_RUN_WIDTH else 0
+    
+    # Pass 0: full runs as rows of a view, then the short trailing run
+    full = n - n % NP_MERGE_RUN_WIDTH
+    if full:
+        np_insertion_rows(a[:full].reshape(-1, NP_MERGE_RUN_WIDTH))
+    if full < n:
+        np_insertion_rows(a[full:].reshape(1, -1))
+    if is_cancelled(): return None
+    if progress_callback: progress_callback(100 / (merge_passes + 1))
+    
+    src, dst = a, np.empty_like(a)
+    width = NP_MERGE_RUN_WIDTH
+    done_passes = 1
+    while width < n:
+        first = 0
+        # Row-wise merging costs 2*width steps, pair-wise merging one step per pair
+        if (2 * width) ** 2 <= n:
+            first = n - n % (2 * width)
+            np_merge_rows(src[:first].reshape(-1, 2 * width), dst[:first].reshape(-1, 2 * width), width)
+        for lo in range(first, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid == hi or src[mid - 1] <= src[mid]:
+                dst[lo:hi] = src[lo:hi] # Lone trailing run, or runs already in order
+                continue
+            left = src[lo:mid]
+            right = src[mid:hi]
+            # Ties: left elements count only smaller right ones, so they stay first (stable)
+            dst[np.searchsorted(right, left, side='left') + np.arange(lo, mid)] = left
+            dst[np.searchsorted(left, right, side='right') + np.arange(lo, lo + hi - mid)] = right
+        src, dst = dst, src
+        width *= 2
+        done_passes += 1
         if is_cancelled(): return None
+        if progress_callback: progress_callback(min(done_passes / (merge_passes + 1) * 100, 99.9))
+    
+    if progress_callback: progress_callback(100)
+    return (src[::-1] if descending else src).tolist()
 
-        if len(arr) > 1:
-            mid = len(arr) // 2
-            left_half = arr[:mid]
-            right_half = arr[mid:]
+def np_argsort_sort(arr, progress_callback=None, cancel_event=None, descending=True):
+    """Reference path: NumPy's stable argsort (radix sort for int64), then one gather."""
+    a = np.array(arr, dtype=np.int64)
+    result = a[np.argsort(a, kind='stable')]
+    if progress_callback: progress_callback(100)
+    return (result[::-1] if descending else result).tolist()
 
-            l_res = merge_sort_recursive(left_half)
-            if l_res is None: return None # Propagate cancel
-            r_res = merge_sort_recursive(right_half)
-            if r_res is None: return None # Propagate cancel
+# --- ALGORITHM REGISTRY ---
 
-            i = j = k = 0
+class SortAlgorithm:
+    """One menu entry: the pure-Python sort, its optional NumPy variant and the facts shown about it."""
+    __slots__ = ("label", "func", "np_func", "complexity", "stable", "in_place")
+    
+    def __init__(self, label, func, complexity, stable, in_place, np_func=None):
+        self.label = label
+        self.func = func
+        self.np_func = np_func
+        self.complexity = complexity
+        self.stable = stable
+        self.in_place = in_place
+    
+    @property
+    def backend(self):
+        # The NumPy variant is picked automatically when NumPy is installed
+        return "NumPy" if np is not None and self.np_func is not None else "Python"
+    
+    @property
+    def function(self):
+        return self.np_func if self.backend == "NumPy" else self.func
+    
+    def describe(self):
+        return f"{self.complexity}, {'stable' if self.stable else 'unstable'}, {'in place' if self.in_place else 'not in place'}"
 
-            while i < len(left_half) and j < len(right_half):
-                if k % 1000 == 0 and is_cancelled(): return None
+# Menu key -> algorithm, in menu order; the sidebar gets one button per entry
+ALGORITHMS = {}
 
-                # Selection Logic
-                pick_left = False
-                if descending:
-                    if left_half[i] > right_half[j]: pick_left = True
-                else:
-                    if left_half[i] < right_half[j]: pick_left = True
+def register(key, algorithm):
+    if key in ALGORITHMS:
+        raise ValueError(f"Algorithm {key!r} is already registered")
+    ALGORITHMS[key] = algorithm
 
-                if pick_left:
-                    arr[k] = left_half[i]
-                    i += 1
-                else:
-                    arr[k] = right_half[j]
-                    j += 1
-                k += 1
+register("Bubble", SortAlgorithm("Bubble Sort", bubble_sort, "O(n²)", True, True, np_func=np_odd_even_sort))
+register("Insertion", SortAlgorithm("Insertion Sort", insertion_sort, "O(n²)", True, True, np_func=np_insertion_sort))
+register("Shell", SortAlgorithm("Shell Sort", shell_sort, "~O(n^1.3)", False, True))
+register("Merge", SortAlgorithm("Merge Sort", merge_sort_wrapper, "O(n log n)", True, False, np_func=np_merge_sort))
+register("Heap", SortAlgorithm("Heap Sort", heap_sort, "O(n log n)", False, True))
+register("Intro", SortAlgorithm("Intro Sort", intro_sort, "O(n log n)", False, True))
+register("Quick3", SortAlgorithm("Quick Sort (3-way)", quick_sort_3way, "O(n log n)", False, True))
+register("Builtin", SortAlgorithm("Built-in sorted()", builtin_sort, "O(n log n)", True, False))
+if np is not None:
+    # Reference path, only offered by the NumPy backend
+    register("Reference", SortAlgorithm("NumPy Argsort", None, "O(n)", True, False, np_func=np_argsort_sort))
 
-            while i < len(left_half):
-                arr[k] = left_half[i]
-                i += 1
-                k += 1
+# --- ISOLATED SORT WORKER ---
 
-            while j < len(right_half):
-                arr[k] = right_half[j]
-                j += 1
-                k += 1
+def sort_worker_main(conn):
+    """
+    Worker process loop. Each job names an int64 shared memory block holding
+    the values and a float64 control block [progress, sort seconds]. The
+    sorted values are written back into the value block, and the sort itself
+    is timed here, away from the GUI's heap, GC and event loop.
+    """
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        algo_type, data_name, ctrl_name, n, descending = job
+        data_shm = shared_memory.SharedMemory(name=data_name)
+        ctrl_shm = shared_memory.SharedMemory(name=ctrl_name)
+        values = ctrl = None
+        try:
+            values = data_shm.buf[:n * 8].cast('q')
+            ctrl = ctrl_shm.buf.cast('d')
             
-            # Heuristic progress update
-            state[0] += len(arr)
+            def report(p):
+                ctrl[0] = p
             
-            p = (state[0] / total_work) * 100
-            if p > 99.9: p = 99.9
-            progress_callback(p)
-                
-        return arr
+            start = time.perf_counter()
+            # Sorts the shared block in place; no cancel event: STOP terminates this process instead
+            result = ALGORITHMS[algo_type].function(values, report, None, descending=descending)
+            ctrl[1] = time.perf_counter() - start
+            if result is not values:
+                values[:] = array('q', result) # NumPy variants and sorted() return new sequences
+            conn.send(("ok", None))
+        except Exception as e:
+            conn.send(("error", str(e)))
+        finally:
+            for view in (values, ctrl):
+                if view is not None:
+                    view.release()
+            data_shm.close()
+            ctrl_shm.close()
 
-    res = merge_sort_recursive(arr[:])
-    if res is None: return None
-    if progress_callback: progress_callback(100)
-    return res
-
-def merge_sort_recursive_simple(arr, descending=True):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-        merge_sort_recursive_simple(left_half, descending)
-        merge_sort_recursive_simple(right_half, descending)
-        i=j=k=0
-        while i < len(left_half) and j < len(right_half):
-            pick_left = False
-            if descending:
-                if left_half[i] > right_half[j]: pick_left = True
-            else:
-                if left_half[i] < right_half[j]: pick_left = True
+class SortWorker:
+    """Reusable sort process; terminated on STOP and respawned on the next run."""
+    def __init__(self):
+        self.process = None
+        self.conn = None
+    
+    def terminate(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.conn.close()
+        self.process = None
+        self.conn = None
+    
+    def run(self, algo_type, data, descending, progress_callback, cancel_event):
+        """
+        Sorts data in the worker process.
+        
+        Returns (sorted array('q'), sort seconds), or None if cancel_event was set.
+        Raises OverflowError if a value does not fit in 64 bits.
+        """
+        n = len(data)
+        # Arrays and mapped binary datasets are copied into the block as raw bytes
+        packed = data if isinstance(data, (array, memoryview)) else array('q', data)
+        data_shm = shared_memory.SharedMemory(create=True, size=max(n * 8, 8))
+        ctrl_shm = shared_memory.SharedMemory(create=True, size=16)
+        ctrl = ctrl_shm.buf.cast('d')
+        try:
+            data_shm.buf[:n * 8] = memoryview(packed).cast('B')
+            ctrl[0] = ctrl[1] = 0.0
             
-            if pick_left:
-                arr[k] = left_half[i]
-                i += 1
-            else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
-        while i < len(left_half):
-            arr[k] = left_half[i]
-            i += 1; k += 1
-        while j < len(right_half):
-            arr[k] = right_half[j]
-            j += 1; k += 1
-    return arr
+            if self.process is None or not self.process.is_alive():
+                ctx = multiprocessing.get_context("spawn")
+                self.conn, child_conn = ctx.Pipe()
+                self.process = ctx.Process(target=sort_worker_main, args=(child_conn,), daemon=True)
+                self.process.start()
+                child_conn.close()
+            self.conn.send((algo_type, data_shm.name, ctrl_shm.name, n, descending))
+            
+            # Forward progress until the worker replies; STOP kills it outright
+            while not self.conn.poll(0.05):
+                if cancel_event.is_set():
+                    self.terminate()
+                    return None
+                if not self.process.is_alive():
+                    self.terminate()
+                    raise RuntimeError("Sort worker process exited unexpectedly")
+                progress_callback(min(ctrl[0], 99.9))
+            
+            status, message = self.conn.recv()
+            if status != "ok":
+                raise RuntimeError(message)
+            result = array('q')
+            result.frombytes(data_shm.buf[:n * 8])
+            seconds = ctrl[1]
+        finally:
+            ctrl.release()
+            for block in (data_shm, ctrl_shm):
+                block.close()
+                block.unlink()
+        progress_callback(100)
+        return result, seconds
+
+# --- PROGRESS REPORTING ---
+
+class ProgressChannel:
+    """
+    Shared progress slot between the sort thread and the Tk main loop.
+    
+    The sort thread calls report(p), a C-level setitem into a one-slot
+    array (no Python frame, no lock, no Tk call). The main loop polls the
+    slot every `interval_ms` with an `after` timer and only touches the
+    progress bar when the value changed, so the event queue is never flooded.
+    
+    Mirrors PRELIM-EXAM/src/progress_channel.py; kept inline so this script
+    runs on its own. Change both together.
+    """
+    def __init__(self, widget, progressbar, interval_ms=50):
+        self.widget = widget
+        self.progressbar = progressbar
+        self.interval_ms = interval_ms
+        self.slot = array('d', [0.0])
+        self.report = functools.partial(operator.setitem, self.slot, 0)
+        self._after_id = None
+        self._shown = None
+    
+    def start(self):
+        self.stop()
+        self.slot[0] = 0.0
+        self._show(0.0)
+        self._after_id = self.widget.after(self.interval_ms, self._poll)
+    
+    def stop(self, final=None):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if final is not None:
+            self._show(final)
+    
+    def _show(self, value):
+        self.progressbar.configure(value=value)
+        self._shown = value
+    
+    def _poll(self):
+        value = self.slot[0]
+        if value != self._shown:
+            self._show(value)
+        self._after_id = self.widget.after(self.interval_ms, self._poll)
 
 # --- MODERN MINIMALIST GUI ---
 
@@ -250,7 +940,7 @@ class SorterApp(tk.Tk):
         super().__init__()
         
         self.title("Data Sorting Algorithm")
-        self.geometry("1000x750")
+        self.geometry("1100x870")
         
         # Color Palette - Latte Theme
         self.bg_main = "#F9F8F6"      # Main Canvas
@@ -273,7 +963,7 @@ class SorterApp(tk.Tk):
         # Load initial data
         if self.current_dataset_name:
             self.dataset_path = os.path.join(self.base_dir, self.current_dataset_name)
-            self.data_cache = read_dataset(self.dataset_path) or []
+            self.data_cache = load_dataset(self.dataset_path) or []
         else:
             self.dataset_path = None
             self.data_cache = []
@@ -283,15 +973,19 @@ class SorterApp(tk.Tk):
         # Threading Event for Cancellation
         self.cancel_event = threading.Event()
         self.sort_descending = True # Default Sort Order
+        
+        # Sorts run in a separate process that STOP can terminate at once
+        self.sort_worker = SortWorker()
 
         self.create_layout()
+        self.progress_channel = ProgressChannel(self, self.progress)
 
     def scan_datasets(self):
-        """Finds all .txt files in the script directory."""
+        """Finds all .txt and binary (.i64) datasets in the script directory."""
         # Using os.listdir instead of glob because the path contains brackets []
         # which glob interprets as wildcard patterns.
         try:
-            files = [f for f in os.listdir(self.base_dir) if f.lower().endswith('.txt')]
+            files = [f for f in os.listdir(self.base_dir) if f.lower().endswith(('.txt', BINARY_EXT))]
             return files
         except Exception as e:
             print(f"Error scanning datasets: {e}")
@@ -372,22 +1066,17 @@ class SorterApp(tk.Tk):
         
         tk.Label(menu_container, text="MENU", font=("Segoe UI", 9, "bold"), bg=self.bg_sidebar, fg="#B0B0B0").pack(padx=30, anchor="w", pady=(0, 10))
 
-        self.btn_bubble = self.create_nav_button(menu_container, "Bubble Sort", lambda: self.start_sort("Bubble"))
-        self.btn_insert = self.create_nav_button(menu_container, "Insertion Sort", lambda: self.start_sort("Insertion"))
-        self.btn_merge = self.create_nav_button(menu_container, "Merge Sort", lambda: self.start_sort("Merge"))
+        # One compact button per registered algorithm, stored in a map for easy access
+        self.buttons = {}
+        for key, algorithm in ALGORITHMS.items():
+            self.buttons[key] = self.create_nav_button(menu_container, algorithm.label,
+                                                       lambda key=key: self.start_sort(key), height=36, pady=4)
         
         # Separator for Stop Button
         tk.Frame(menu_container, bg=self.bg_sidebar, height=20).pack(fill="x")
 
         self.btn_stop = self.create_nav_button(menu_container, "Stop Sorting", self.cancel_sort, role="stop")
 
-        # Store buttons in map for easy access
-        self.buttons = {
-            "Bubble": self.btn_bubble,
-            "Insertion": self.btn_insert,
-            "Merge": self.btn_merge
-        }
-
         # 2. Main Area
         main_frame = tk.Frame(self, bg=self.bg_main)
         main_frame.pack(side="right", fill="both", expand=True, padx=40, pady=40)
@@ -438,7 +1127,7 @@ class SorterApp(tk.Tk):
             self.dataset_path = os.path.join(self.base_dir, new_file)
             
             # Reload data
-            self.data_cache = read_dataset(self.dataset_path) or []
+            self.data_cache = load_dataset(self.dataset_path) or []
             self.data_count = len(self.data_cache)
             
             # Update UI
@@ -450,7 +1139,7 @@ class SorterApp(tk.Tk):
             self.result_area.config(state=tk.NORMAL)
             self.result_area.delete('1.0', tk.END)
             self.result_area.config(state=tk.DISABLED)
-            self.progress['value'] = 0
+            self.progress_channel.stop(0)
 
     def on_toggle_order(self, event):
         # Allow toggling only if not sorting
@@ -517,13 +1206,13 @@ class SorterApp(tk.Tk):
         ]
         return canvas.create_polygon(points, **kwargs, smooth=True)
 
-    def create_nav_button(self, parent, text, command, role="nav"):
+    def create_nav_button(self, parent, text, command, role="nav", height=50, pady=8):
         # Dimensions
         btn_w = 200 
-        btn_h = 50
+        btn_h = height
         
         canvas = tk.Canvas(parent, width=btn_w, height=btn_h, bg=self.bg_sidebar, highlightthickness=0)
-        canvas.pack(pady=8) 
+        canvas.pack(pady=pady) 
         
         # State
         canvas.is_disabled = False
@@ -601,13 +1290,14 @@ class SorterApp(tk.Tk):
         self.result_area.delete('1.0', tk.END)
         self.result_area.config(state=tk.DISABLED)
         
-        self.lbl_main_status.config(text=f"Running {algorithm_name} Sort...", fg=self.accent_hover)
+        label = ALGORITHMS[algorithm_name].label
+        self.lbl_main_status.config(text=f"Running {label}...", fg=self.accent_hover)
         self.lbl_sub_status.config(text=f"Processing {self.data_count:,} items. Please wait...", fg="#E67E22")
-        self.progress['value'] = 0
+        self.progress_channel.start()
         
         # Reset cancel flag
         self.cancel_event.clear()
-        self.current_algo_name = algorithm_name # Track current algo
+        self.current_algo_name = label # Track current algo
         
         # Disable Sort buttons, Enable Stop button
         self.set_buttons_state(tk.DISABLED)
@@ -645,41 +1335,37 @@ class SorterApp(tk.Tk):
 
     def run_sort_process(self, algo_type):
         # Use currently loaded cache which matches the selection
-        data = self.data_cache if self.data_cache else read_dataset(self.dataset_path)
+        data = self.data_cache if self.data_cache else load_dataset(self.dataset_path)
         
         if not data:
             self.update_gui_error("Dataset is empty or file missing.")
             return
 
-        # Callback for progress with throttling
-        # Closure to hold last update time
-        last_update_time = [0] 
-
-        def progress_cb(val):
-            # Only update if not cancelled
-            if not self.cancel_event.is_set():
-                current_time = time.time()
-                # Update if complete, or if > 0.05s has passed (20fps cap)
-                if val >= 100 or (current_time - last_update_time[0] > 0.05):
-                    last_update_time[0] = current_time
-                    self.update_progress_from_thread(val)
+        # Progress goes into the shared slot; the GUI polls it at 20 fps
+        progress_cb = self.progress_channel.report
 
-        start_time = time.time()
-        
         sorted_data = None
         # Pass the current sort_descending flag
         order_flag = self.sort_descending 
         
-        if algo_type == "Bubble":
-            sorted_data = bubble_sort(data, progress_cb, self.cancel_event, descending=order_flag)
-        elif algo_type == "Insertion":
-            sorted_data = insertion_sort(data, progress_cb, self.cancel_event, descending=order_flag)
-        elif algo_type == "Merge":
-            data_copy = data[:] 
-            sorted_data = merge_sort_wrapper(data_copy, progress_cb, self.cancel_event, descending=order_flag)
+        algorithm = ALGORITHMS[algo_type]
+        backend = algorithm.backend
         
-        end_time = time.time()
-        elapsed = end_time - start_time
+        try:
+            outcome = self.sort_worker.run(algo_type, data, order_flag, progress_cb, self.cancel_event)
+            if outcome is not None:
+                sorted_data, elapsed = outcome
+        except OverflowError:
+            # Values beyond int64 fit neither shared memory nor NumPy; sort them in pure Python on this thread
+            start_time = time.perf_counter()
+            sort_func = algorithm.func or merge_sort_wrapper
+            backend = "Python"
+            # The sorts work in place: sort a copy so the loaded dataset keeps its order
+            sorted_data = sort_func(data[:], progress_cb, self.cancel_event, descending=order_flag)
+            elapsed = time.perf_counter() - start_time
+        except RuntimeError as e:
+            self.update_gui_error(str(e))
+            return
 
         if sorted_data is None:
             # Cancellation occurred
@@ -688,15 +1374,12 @@ class SorterApp(tk.Tk):
             # Get result area width for dynamic column layout
             widget_width = self.result_area.winfo_width()
             display_text = self.format_output(sorted_data, widget_width)
-            self.after(0, lambda: self.finalize_gui(display_text, algo_type, elapsed))
-
-    def update_progress_from_thread(self, value):
-        self.after(0, lambda: self.progress.configure(value=value))
+            self.after(0, lambda: self.finalize_gui(display_text, algorithm, elapsed, backend))
 
     def finalize_cancelled(self):
-        self.progress['value'] = 0
+        self.progress_channel.stop(0)
         name = getattr(self, 'current_algo_name', 'Sort')
-        self.lbl_main_status.config(text=f"{name} Sort Stopped", fg="#C0392B")
+        self.lbl_main_status.config(text=f"{name} Stopped", fg="#C0392B")
         self.lbl_sub_status.config(text="Operation stopped by user.", fg=self.text_secondary)
         self.set_buttons_state(tk.NORMAL)
         # Reset active button visualization
@@ -726,20 +1409,21 @@ class SorterApp(tk.Tk):
         
         return "\n".join(output)
 
-    def finalize_gui(self, text, algo_name, elapsed_time):
-        self.progress['value'] = 100
+    def finalize_gui(self, text, algorithm, elapsed_time, backend):
+        self.progress_channel.stop(100)
         self.result_area.config(state=tk.NORMAL)
         self.result_area.insert(tk.END, text)
         self.result_area.config(state=tk.DISABLED)
         
-        self.lbl_main_status.config(text=f"{algo_name} Sort Complete", fg=self.accent_main)
-        self.lbl_sub_status.config(text=f"Processed {self.data_count:,} items in {elapsed_time:.4f} seconds.", fg=self.text_secondary)
+        self.lbl_main_status.config(text=f"{algorithm.label} Complete", fg=self.accent_main)
+        self.lbl_sub_status.config(text=f"Processed {self.data_count:,} items in {elapsed_time:.4f} seconds ({backend} backend) • {algorithm.describe()}.", fg=self.text_secondary)
         self.set_buttons_state(tk.NORMAL)
 
     def update_gui_error(self, msg):
         self.after(0, lambda: self._show_error(msg))
 
     def _show_error(self, msg):
+        self.progress_channel.stop()
         self.lbl_main_status.config(text="Error Encountered", fg="#C0392B")
         self.lbl_sub_status.config(text=msg)
         self.set_buttons_state(tk.NORMAL)
@@ -786,6 +1470,24 @@ class SorterApp(tk.Tk):
              self.btn_stop.itemconfig(self.btn_stop.ids["shape"], fill=self.card_bg, outline=self.card_border)
              self.btn_stop.itemconfig(self.btn_stop.ids["text"], fill=self.text_primary)
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Sorting algorithms visualizer.")
+    parser.add_argument("--convert", nargs="+", metavar="TXT",
+                        help=f"Convert text datasets to the binary {BINARY_EXT} format and exit")
+    args = parser.parse_args()
+    
+    if args.convert:
+        for path in args.convert:
+            try:
+                out_path = convert_dataset(path)
+            except (OSError, OverflowError) as e:
+                print(f"{path}: {e}")
+                continue
+            print(f"{path} -> {out_path}")
+        return
+    
     app = SorterApp()
     app.mainloop()
+
+if __name__ == "__main__":
+    main()